@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from core import Step, TaskDetail, TaskNode
 from core.desktop.devtools.application.plan_hygiene import plan_doc_overlap_reasons, plan_steps_overlap_reasons
 from core.desktop.devtools.application.task_manager import _flatten_steps
+from core.step import step_count_memo
 
 
 Severity = str  # "error" | "warning"
@@ -410,7 +411,9 @@ def lint_item(manager, detail: TaskDetail, all_items: Optional[List[TaskDetail]]
     if kind == "plan":
         issues.extend(_lint_plan(detail))
     else:
-        issues.extend(_lint_task(detail, manager, all_items))
+        # Read-only pass: readiness checks share subtree counts instead of recounting per step.
+        with step_count_memo():
+            issues.extend(_lint_task(detail, manager, all_items))
     # Stable ordering: errors first, then warnings, then by code.
     issues_sorted = sorted(issues, key=lambda i: (0 if i.severity == "error" else 1, i.code))
     return LintReport(item_id=item_id, kind=kind, revision=revision, issues=issues_sorted)
@@ -22,6 +22,7 @@ from core.desktop.devtools.application.context import derive_domain_explicit
 from core.desktop.devtools.interface.i18n import translate, effective_lang as _effective_lang
 from infrastructure.file_repository import FileTaskRepository
 from infrastructure.projects_sync_service import ProjectsSyncService
+from infrastructure.task_file_parser import TaskFileParser
 from projects_sync import get_projects_sync
 from core.status import normalize_status_code
 
@@ -799,6 +800,7 @@ class TaskManager:
                 task._sync_error = None
             if changed:
                 file_path.write_text(task.to_file_content(), encoding="utf-8")
+                TaskFileParser.clear_cache(file_path)
             return changed
 
         max_workers = self._compute_worker_count(len(tasks_to_sync))
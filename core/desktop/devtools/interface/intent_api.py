@@ -21,6 +21,7 @@ import re
 import shutil
 import tempfile
 import copy
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from functools import lru_cache
@@ -30,6 +31,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from core import PlanNode, Step, TaskDetail, TaskNode, Attachment, VerificationCheck, StepEvent
 from core.evidence import redact, redact_text
 from core.status import status_label
+from core.step import step_count_memo
 from core.desktop.devtools.application.context import (
     clear_last_task,
     get_last_task,
@@ -818,42 +820,46 @@ def _build_patch_field_diffs(*, kind: str, before_target: Any, after_target: Any
     return diffs
 
 
+def _evidence_columns(items: List[Any], kinds: List[str], observed: List[str]) -> None:
+    """Append each item's normalized kind and non-empty observed_at to flat column lists."""
+    for item in items:
+        kinds.append(str(getattr(item, "kind", "") or "").strip() or "unknown")
+        ts = str(getattr(item, "observed_at", "") or "").strip()
+        if ts:
+            observed.append(ts)
+
+
+def _evidence_column_stats(kinds: List[str], observed: List[str]) -> Dict[str, Any]:
+    # Same shape/order as _counts_by_kind/_latest_observed_at (Counter keeps first-seen order).
+    return {"count": len(kinds), "kinds": dict(Counter(kinds)), "last_observed_at": max(observed) if observed else ""}
+
+
 def _task_evidence_summary(task: Any) -> Dict[str, Any]:
     flat = _flatten_steps(list(getattr(task, "steps", []) or []))
-    all_checks: List[Any] = []
-    all_attachments: List[Any] = []
+    # Columnar pass: one walk fills flat kind/timestamp lists; aggregation runs over plain strings.
+    check_kinds: List[str] = []
+    check_observed: List[str] = []
+    attachment_kinds: List[str] = []
+    attachment_observed: List[str] = []
     outcomes: List[str] = []
+    with_evidence = 0
     for _path, st in flat:
-        all_checks.extend(list(getattr(st, "verification_checks", []) or []))
-        all_attachments.extend(list(getattr(st, "attachments", []) or []))
+        checks = getattr(st, "verification_checks", None) or ()
+        attachments = getattr(st, "attachments", None) or ()
+        _evidence_columns(checks, check_kinds, check_observed)
+        _evidence_columns(attachments, attachment_kinds, attachment_observed)
         outcome = str(getattr(st, "verification_outcome", "") or "").strip()
         if outcome:
             outcomes.append(outcome)
-
-    outcome_counts: Dict[str, int] = {}
-    for out in outcomes:
-        outcome_counts[out] = outcome_counts.get(out, 0) + 1
+        if outcome or checks or attachments:
+            with_evidence += 1
 
     return {
         "steps_total": len(flat),
-        "steps_with_any_evidence": sum(
-            1
-            for _p, st in flat
-            if bool(str(getattr(st, "verification_outcome", "") or "").strip())
-            or bool(list(getattr(st, "verification_checks", []) or []))
-            or bool(list(getattr(st, "attachments", []) or []))
-        ),
-        "verification_outcomes": {"count": len(outcomes), "kinds": outcome_counts},
-        "checks": {
-            "count": len(all_checks),
-            "kinds": _counts_by_kind(all_checks),
-            "last_observed_at": _latest_observed_at(all_checks),
-        },
-        "attachments": {
-            "count": len(all_attachments),
-            "kinds": _counts_by_kind(all_attachments),
-            "last_observed_at": _latest_observed_at(all_attachments),
-        },
+        "steps_with_any_evidence": with_evidence,
+        "verification_outcomes": {"count": len(outcomes), "kinds": dict(Counter(outcomes))},
+        "checks": _evidence_column_stats(check_kinds, check_observed),
+        "attachments": _evidence_column_stats(attachment_kinds, attachment_observed),
     }
 
 
@@ -1809,7 +1815,9 @@ def _compute_checkpoint_status(task: TaskDetail) -> Dict[str, List[str]]:
                     task_prefix = f"{path}.t:{t_idx}"
                     walk(list(getattr(task, "steps", []) or []), task_prefix)
 
-    walk(list(getattr(task, "steps", []) or []))
+    # Every step's readiness checks its plan tasks; share subtree counts across the walk.
+    with step_count_memo():
+        walk(list(getattr(task, "steps", []) or []))
     return {"pending": pending, "ready": ready, "pending_ids": pending_ids, "ready_ids": ready_ids}
 
 
@@ -9,12 +9,28 @@ All external boundaries (intent API / MCP / GUI / TUI) must either use these
 serializers directly or match them exactly to prevent contract drift.
 """
 
-from typing import Any, Dict
+from functools import wraps
+from typing import Any, Callable, Dict, TypeVar
 
 from core import PlanNode, Step, TaskDetail, TaskNode
 from core.status import status_label
+from core.step import step_count_memo
 
+_F = TypeVar("_F", bound=Callable[..., Dict[str, Any]])
 
+
+def _shared_counts(fn: _F) -> _F:
+    """Run a serializer with subtree counts memoized for the whole (read-only) pass."""
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with step_count_memo():
+            return fn(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+@_shared_counts
 def step_to_dict(
     step: Step,
     path: str = "s:0",
@@ -118,6 +134,7 @@ def step_to_dict(
     return data
 
 
+@_shared_counts
 def plan_node_to_dict(
     plan: PlanNode,
     *,
@@ -160,6 +177,7 @@ def plan_node_to_dict(
     return data
 
 
+@_shared_counts
 def task_node_to_dict(
     task: TaskNode,
     *,
@@ -313,6 +331,7 @@ def plan_to_dict(plan: TaskDetail, *, compact: bool = False) -> Dict[str, Any]:
     return data
 
 
+@_shared_counts
 def task_to_dict(
     task: TaskDetail, include_steps: bool = False, compact: bool = False
 ) -> Dict[str, Any]:
@@ -118,6 +118,7 @@ def _update_depends_on_in_task_file(task_file: Path, mapping: dict[str, str]) ->
     task.depends_on = updated
     try:
         task_file.write_text(task.to_file_content(), encoding="utf-8")
+        TaskFileParser.clear_cache(task_file)
     except Exception:
         return
 
@@ -141,6 +142,7 @@ def _update_parent_in_task_file(task_file: Path, mapping: dict[str, str]) -> Non
     task.parent = updated
     try:
         task_file.write_text(task.to_file_content(), encoding="utf-8")
+        TaskFileParser.clear_cache(task_file)
     except Exception:
         return
 
@@ -263,6 +265,7 @@ def _migrate_legacy_github_namespace_dir(tasks_root: Path, legacy_dir: Path, tar
         plan.id = new_id
         dst_file = dst_parent / f"{new_id}.task"
         dst_file.write_text(plan.to_file_content(), encoding="utf-8")
+        TaskFileParser.clear_cache(dst_file)
         try:
             src_file.unlink()
         except Exception:
@@ -306,6 +309,7 @@ def _migrate_legacy_github_namespace_dir(tasks_root: Path, legacy_dir: Path, tar
             task.parent = plan_id_mapping[parent]
         dst_file = dst_parent / f"{new_id}.task"
         dst_file.write_text(task.to_file_content(), encoding="utf-8")
+        TaskFileParser.clear_cache(dst_file)
         try:
             src_file.unlink()
         except Exception:
@@ -166,8 +166,7 @@ def delete_current_item(tui) -> None:
             root_domain = getattr(tui.current_task_detail, "domain", "") or ""
             path_prefix = ""
         full_path = f"{path_prefix}.{path}" if path_prefix else path
-        leaf = full_path.split(".")[-1] if full_path else ""
-        if leaf.startswith("t:"):
+        if full_path.startswith("t:", full_path.rfind(".") + 1):
             ok, _code, _deleted = tui.manager.delete_task_node(root_task_id, path=full_path, domain=root_domain)
         else:
             ok, _code, _deleted = tui.manager.delete_step_node(root_task_id, path=full_path, domain=root_domain)
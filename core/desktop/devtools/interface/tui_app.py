@@ -9,6 +9,7 @@ from types import SimpleNamespace
 import subprocess
 import threading
 import time
+from bisect import bisect_left
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +19,7 @@ import webbrowser
 from wcwidth import wcwidth
 
 from core import Status, Step, TaskDetail
+from core.step import step_count_memo
 from core.desktop.devtools.application.task_manager import TaskManager, _find_step_by_path, _find_task_by_path
 from core.desktop.devtools.application.context import derive_domain_explicit, get_last_task, save_last_task
 from core.desktop.devtools.application.plan_semantics import is_plan_task as _is_plan_task, normalize_tag as _normalize_tag
@@ -66,9 +68,9 @@ from core.desktop.devtools.interface.tasks_dir_resolver import (
 )
 from infrastructure.file_repository import FileTaskRepository
 from core.desktop.devtools.interface.tui_loader import (
-    apply_context_filters,
     build_task_models,
     select_index_after_load,
+    task_view_predicate,
 )
 from core.desktop.devtools.interface.tui_preview import build_side_preview_text
 from core.desktop.devtools.interface.tui_confirm import render_confirm_dialog
@@ -122,6 +124,20 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
     }
     SPINNER_FRAMES: List[str] = ["⣿", "⡇", "⡏", "⡗", "⡟", "⡧", "⡯", "⡷", "⡿", "⢇", "⢏", "⢗", "⢟", "⢧", "⢯", "⢷", "⢿"]
 
+    # Renderer caches and footer hover state that tui_footer/tui_preview read with
+    # getattr(tui, name, default) (unit-test doubles lack them). Declared here so
+    # real frames never take the missing-attribute path.
+    _footer_cache: Optional[Tuple[Any, ...]] = None
+    _footer_labels_cache: Optional[Tuple[Any, Dict[str, str]]] = None
+    _footer_desc_prefix: Optional[Tuple[Any, ...]] = None
+    _footer_desc_hover_last_at: float = 0.0
+    _footer_desc_hover_y: Optional[int] = None
+    _footer_desc_hover_since: float = 0.0
+    _preview_labels_cache: Optional[Tuple[Any, Dict[str, str]]] = None
+    _preview_cache: Optional[Tuple[Any, ...]] = None
+    # (flat list, len, key -> index) for _select_step_by_path.
+    _detail_key_index_cache: Optional[Tuple[Any, int, Dict[str, int]]] = None
+
     @staticmethod
     def get_theme_palette(theme: str) -> Dict[str, str]:
         from .tui_themes import get_theme_palette as _get_theme_palette
@@ -207,6 +223,8 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
         # Radar is the primary "cockpit" screen in detail view.
         self.detail_tab: str = "radar"
         self.detail_tab_scroll_offsets: Dict[str, int] = {"radar": 0, "notes": 0, "plan": 0, "contract": 0, "meta": 0}
+        # Tab bar click targets, published by the detail renderers.
+        self._detail_tab_hitboxes: Optional[Dict[str, Any]] = None
         self.task_details_cache: Dict[str, TaskDetail] = {}
         # Cached radar payload to keep rendering snappy (linting can be expensive).
         self._radar_cache_focus_id: str = ""
@@ -1072,11 +1090,32 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
         except Exception as exc:  # pragma: no cover - best effort
             self.set_status_message(self._t("STATUS_MESSAGE_BOOTSTRAP_FAILED", error=exc), ttl=6)
 
+    # force_render() calls inside batch_render() are coalesced into one invalidate on exit.
+    _render_batch_depth: int = 0
+    _render_pending: bool = False
+    # Wheel steps accumulated by tui_mouse until the next loop tick.
+    _pending_scroll: int = 0
+    _scroll_flush_scheduled: bool = False
+
     def force_render(self) -> None:
+        if self._render_batch_depth:
+            self._render_pending = True
+            return
         app = getattr(self, "app", None)
         if app:
             app.invalidate()
 
+    @contextmanager
+    def batch_render(self):
+        self._render_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._render_batch_depth -= 1
+            if self._render_batch_depth == 0 and self._render_pending:
+                self._render_pending = False
+                self.force_render()
+
     def _start_spinner(self, message: str):
         self.spinner_message = message
         self.spinner_active = True
@@ -1246,46 +1285,48 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
         steps = list(getattr(self.current_task_detail, "steps", []) or [])
         flat: List[DetailNodeEntry] = []
         stats: Dict[str, DetailNodeStats] = {}
-        for idx, step in enumerate(steps):
-            key = f"s:{idx}"
-            plan = getattr(step, "plan", None)
-            plan_tasks = list(getattr(plan, "tasks", []) or []) if plan else []
-            total = len(plan_tasks)
-            done = sum(1 for t in plan_tasks if getattr(t, "is_done", lambda: False)())
-            if getattr(step, "completed", False):
-                progress = 100
-            else:
-                progress = int((done / total) * 100) if total else 0
-            status = step.status_value() if hasattr(step, "status_value") else Status.TODO
-
-            flat.append(
-                DetailNodeEntry(
-                    key=key,
-                    kind="step",
-                    node=step,
-                    level=0,
-                    # No inline expansion/collapse: Enter/→ always drills down.
-                    collapsed=False,
-                    has_children=False,
-                    parent_key=None,
+        # Plan-task is_done() and step readiness both count subtrees; share them per rebuild.
+        with step_count_memo():
+            for idx, step in enumerate(steps):
+                key = f"s:{idx}"
+                plan = getattr(step, "plan", None)
+                plan_tasks = list(getattr(plan, "tasks", []) or []) if plan else []
+                total = len(plan_tasks)
+                done = sum(1 for t in plan_tasks if getattr(t, "is_done", lambda: False)())
+                if getattr(step, "completed", False):
+                    progress = 100
+                else:
+                    progress = int((done / total) * 100) if total else 0
+                status = step.status_value() if hasattr(step, "status_value") else Status.TODO
+
+                flat.append(
+                    DetailNodeEntry(
+                        key=key,
+                        kind="step",
+                        node=step,
+                        level=0,
+                        # No inline expansion/collapse: Enter/→ always drills down.
+                        collapsed=False,
+                        has_children=False,
+                        parent_key=None,
+                    )
+                )
+                stats[key] = DetailNodeStats(
+                    progress=progress,
+                    children_done=done,
+                    children_total=total,
+                    status=status,
                 )
-            )
-            stats[key] = DetailNodeStats(
-                progress=progress,
-                children_done=done,
-                children_total=total,
-                status=status,
-            )
 
         self.detail_flat_subtasks = flat
         self.detail_stats_by_key = stats
 
         if selected_path:
-            for idx, entry in enumerate(flat):
-                if entry.key == selected_path:
-                    self.detail_selected_index = idx
-                    self.detail_selected_path = entry.key
-                    return
+            idx = self._detail_key_index().get(selected_path)
+            if idx is not None:
+                self.detail_selected_index = idx
+                self.detail_selected_path = selected_path
+                return
         if not flat:
             self.detail_selected_index = 0
             self.detail_selected_path = ""
@@ -1312,17 +1353,29 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
         self.detail_selected_path = entry.key
         return entry
 
+    def _detail_key_index(self) -> Dict[str, int]:
+        """key -> first index in detail_flat_subtasks; rebuilt when the flat list is replaced."""
+        flat = self.detail_flat_subtasks
+        cached = self._detail_key_index_cache
+        if cached is not None and cached[0] is flat and cached[1] == len(flat):
+            return cached[2]
+        index: Dict[str, int] = {}
+        for idx, entry in enumerate(flat):
+            index.setdefault(entry.key, idx)
+        self._detail_key_index_cache = (flat, len(flat), index)
+        return index
+
     def _select_step_by_path(self, path: str) -> None:
         if not self.detail_flat_subtasks:
             self.detail_selected_index = 0
             self.detail_selected_path = ""
             return
         probe = str(path or "")
-        for idx, entry in enumerate(self.detail_flat_subtasks):
-            if entry.key == probe:
-                self.detail_selected_index = idx
-                self.detail_selected_path = entry.key
-                return
+        idx = self._detail_key_index().get(probe)
+        if idx is not None:
+            self.detail_selected_index = idx
+            self.detail_selected_path = probe
+            return
         self.detail_selected_index = max(0, min(self.detail_selected_index, len(self.detail_flat_subtasks) - 1))
         self.detail_selected_path = self.detail_flat_subtasks[self.detail_selected_index].key
 
@@ -1456,8 +1509,7 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
     def _derive_nested_detail(self, root_detail: TaskDetail, root_task_id: str, path_prefix: str) -> Optional[TaskDetail]:
         if not path_prefix:
             return root_detail
-        last_segment = path_prefix.split(".")[-1]
-        if last_segment.startswith("t:"):
+        if path_prefix.startswith("t:", path_prefix.rfind(".") + 1):
             task_node, _, _ = _find_task_by_path(root_detail.steps, path_prefix)
             if task_node:
                 return self._task_node_to_task_detail(task_node, root_task_id, path_prefix)
@@ -1610,8 +1662,9 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
                 blocked=det.blocked,
             )
 
-        self.tasks = build_task_models(details, _task_factory)
-        self.selected_index = select_index_after_load(self.tasks, preserve_selection, selected_task_file or "")
+        index_by_file: Dict[str, int] = {}
+        self.tasks = build_task_models(details, _task_factory, index_by_file=index_by_file)
+        self.selected_index = select_index_after_load(self.tasks, preserve_selection, selected_task_file or "", index_by_file)
         self.detail_mode = False
         self.current_task = None
         self.current_task_detail = None
@@ -2259,16 +2312,13 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
     def _snap_cursor(desired: int, focusables: List[int]) -> int:
         if not focusables:
             return max(0, desired)
-        if desired in focusables:
-            return desired
-        # ищем ближайший выше, затем ниже
-        above = [i for i in focusables if i < desired]
-        below = [i for i in focusables if i > desired]
-        if below:
-            return below[0]
-        if above:
-            return above[-1]
-        return focusables[0]
+        # focusables отсортированы: бинарный поиск вместо двух проходов по списку
+        pos = bisect_left(focusables, desired)
+        if pos < len(focusables):
+            # точное совпадение или ближайший ниже
+            return focusables[pos]
+        # ниже ничего нет — ближайший выше
+        return focusables[-1]
 
     @staticmethod
     def _formatted_line_count(items: List[Tuple[str, str]]) -> int:
@@ -2451,18 +2501,13 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
             self._last_rate_wait = wait
 
         # Task view excludes plan tasks by default.
+        keep = None
         if plan_parent:
             details = [d for d in details if str(getattr(d, "parent", "") or "") == str(plan_parent) and not self._is_plan_detail(d)]
         else:
-            details = apply_context_filters(details, self.phase_filter, self.component_filter)
             # Unfiltered Tasks view is intentionally "below plans": hide plans and show only tasks
-            # that belong to a plan (parent is set).
-            details = [
-                d
-                for d in details
-                if not self._is_plan_detail(d)
-                and (str(getattr(d, "parent", "") or "").strip())
-            ]
+            # that belong to a plan (parent is set). Filtering happens inside build_task_models.
+            keep = task_view_predicate(self.phase_filter, self.component_filter, self._is_plan_detail)
 
         def _task_factory(det, derived_status, calc_progress, children_completed, children_total):
             task_file = f".tasks/{det.domain + '/' if det.domain else ''}{det.id}.task"
@@ -2485,8 +2530,9 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
                 blocked=det.blocked,
             )
 
-        self.tasks = build_task_models(details, _task_factory)
-        self.selected_index = select_index_after_load(self.tasks, preserve_selection, selected_task_file or "")
+        index_by_file: Dict[str, int] = {}
+        self.tasks = build_task_models(details, _task_factory, keep, index_by_file)
+        self.selected_index = select_index_after_load(self.tasks, preserve_selection, selected_task_file or "", index_by_file)
         self.detail_mode = False
         self.current_task = None
         self.current_task_detail = None
@@ -2512,6 +2558,7 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
         section = getattr(self, "project_section", "tasks") or "tasks"
         plan_parent = getattr(self, "plan_filter_id", None) if section == "tasks" else None
         plan_counts = None
+        keep = None
         if section == "plans":
             details = self.manager.list_tasks("", skip_sync=skip_sync)
             plan_counts = self._plan_task_counts(details)
@@ -2534,13 +2581,7 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
             else:
                 domain_path = derive_domain_explicit(self.domain_filter, self.phase_filter, self.component_filter)
                 details = self.manager.list_tasks(domain_path, skip_sync=skip_sync)
-                details = apply_context_filters(details, self.phase_filter, self.component_filter)
-                details = [
-                    d
-                    for d in details
-                    if not self._is_plan_detail(d)
-                    and (str(getattr(d, "parent", "") or "").strip())
-                ]
+                keep = task_view_predicate(self.phase_filter, self.component_filter, self._is_plan_detail)
 
         def _task_factory(det, derived_status, calc_progress, children_completed, children_total):
             task_file = f".tasks/{det.domain + '/' if det.domain else ''}{det.id}.task"
@@ -2567,7 +2608,7 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
                 blocked=det.blocked,
             )
 
-        self.tasks = build_task_models(details, _task_factory)
+        self.tasks = build_task_models(details, _task_factory, keep)
         # Keep section cache in sync so back navigation remains instant.
         cache_key = self._section_key() if section == "plans" else (f"tasks:{plan_parent}" if plan_parent else "tasks")
         self._section_cache[cache_key] = list(self.tasks)
@@ -2762,21 +2803,38 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
         order = {"ACTIVE": 0, "TODO": 1, "DONE": 2}.get(status, 99)
         return order, prog, str(getattr(detail, "id", "") or "")
 
-    def _plan_detail_tasks(self) -> List[TaskDetail]:
+    def _plan_detail_tasks_key(self) -> Optional[Tuple[Any, ...]]:
+        """Cache key of the plan task list for the current detail (None when not a plan)."""
         detail = self.current_task_detail
         if not detail or getattr(detail, "kind", "task") != "plan":
-            self.detail_plan_tasks = []
-            self._detail_plan_tasks_cache_key = None
-            self._detail_plan_tasks_dirty = True
-            return []
+            return None
         embedded = getattr(detail, "_embedded_plan_tasks", None)
         if embedded is not None:
-            embedded_key = (
+            return (
                 "embedded",
                 str(getattr(detail, "id", "") or ""),
                 str(getattr(detail, "_nested_path_prefix", "") or ""),
                 id(embedded),
             )
+        return (str(getattr(detail, "id", "") or ""), str(getattr(detail, "domain", "") or ""))
+
+    @property
+    def plan_detail_tasks(self) -> List[TaskDetail]:
+        """Plan tasks for navigation: the cached list while clean, else `_plan_detail_tasks()`."""
+        if not self._detail_plan_tasks_dirty and self._detail_plan_tasks_cache_key == self._plan_detail_tasks_key():
+            return self.detail_plan_tasks
+        return self._plan_detail_tasks()
+
+    def _plan_detail_tasks(self) -> List[TaskDetail]:
+        detail = self.current_task_detail
+        if not detail or getattr(detail, "kind", "task") != "plan":
+            self.detail_plan_tasks = []
+            self._detail_plan_tasks_cache_key = None
+            self._detail_plan_tasks_dirty = True
+            return []
+        embedded = getattr(detail, "_embedded_plan_tasks", None)
+        if embedded is not None:
+            embedded_key = self._plan_detail_tasks_key()
             if not self._detail_plan_tasks_dirty and self._detail_plan_tasks_cache_key == embedded_key:
                 plan_tasks = self.detail_plan_tasks or []
                 if self.detail_selected_task_id:
@@ -2837,8 +2895,7 @@ class TaskTrackerTUI(ClipboardMixin, CheckpointMixin, EditingMixin, DisplayMixin
             return plan_tasks
 
         plan_id = str(getattr(detail, "id", "") or "")
-        plan_domain = str(getattr(detail, "domain", "") or "")
-        cache_key = (plan_id, plan_domain)
+        cache_key = self._plan_detail_tasks_key()
 
         if not self._detail_plan_tasks_dirty and self._detail_plan_tasks_cache_key == cache_key:
             plan_tasks = self.detail_plan_tasks or []
@@ -74,8 +74,10 @@ class CheckpointMixin:
         if 0 <= self.checkpoint_selected_index < len(checkpoints):
             key = checkpoints[self.checkpoint_selected_index]
             current = False
+            root_task_id, root_domain, path_prefix = self._get_root_task_context()
+            detail_kind = getattr(detail, "kind", "task")
 
-            target_kind = "task_detail" if getattr(detail, "kind", "task") == "plan" else ""
+            target_kind = "task_detail" if detail_kind == "plan" else ""
             local_key = ""
             target: object | None = None
             full_path: str | None = None
@@ -101,7 +103,6 @@ class CheckpointMixin:
                     return
 
                 # Build full path from root for persistence.
-                root_task_id, root_domain, path_prefix = self._get_root_task_context()
                 full_path = f"{path_prefix}.{canonical}" if path_prefix else canonical
 
             if key == "criteria":
@@ -109,8 +110,6 @@ class CheckpointMixin:
             elif key == "tests":
                 current = bool(getattr(target, "tests_confirmed", False))
 
-            root_task_id, root_domain, path_prefix = self._get_root_task_context()
-
             # Save changes
             try:
                 ok, msg = self.manager.update_checkpoint(
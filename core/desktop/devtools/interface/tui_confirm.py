@@ -1,10 +1,18 @@
 """Confirmation dialog renderer for TaskTrackerTUI."""
 
+from functools import lru_cache
 from typing import List, Tuple
 
 from prompt_toolkit.formatted_text import FormattedText
 
 
+@lru_cache(maxsize=32)
+def _borders(box_width: int) -> Tuple[str, str, str]:
+    """Return (top, rule, bottom) border strings for a box of `box_width`."""
+    heavy = "+" + "=" * box_width + "+"
+    return heavy + "\n", "+" + "-" * box_width + "+\n", heavy
+
+
 def render_confirm_dialog(tui) -> FormattedText:
     title = (getattr(tui, "confirm_title", "") or "").strip() or tui._t("CONFIRM_TITLE")
     lines = list(getattr(tui, "confirm_lines", []) or [])
@@ -14,33 +22,33 @@ def render_confirm_dialog(tui) -> FormattedText:
     term_width = max(40, int(getattr(tui, "get_terminal_width", lambda: 80)()))
     box_width = max(44, min(96, term_width - 6))
     inner = box_width - 2
+    top, rule, bottom = _borders(box_width)
+    pad = " " * inner
 
     def _clip(text: str) -> str:
         if len(text) <= inner:
-            return text
+            return text + pad[len(text):]
         if inner <= 1:
             return text[:inner]
         return text[: inner - 1] + "…"
 
-    out: List[Tuple[str, str]] = []
-    out.append(("class:border", "+" + "=" * box_width + "+\n"))
-    out.append(("class:border", "| "))
-    out.append(("class:header", _clip(title).ljust(inner)))
-    out.append(("class:border", " |\n"))
-    out.append(("class:border", "+" + "-" * box_width + "+\n"))
-
-    for raw in lines:
-        for line in str(raw).splitlines() or [""]:
-            out.append(("class:border", "| "))
-            out.append(("class:text", _clip(line).ljust(inner)))
-            out.append(("class:border", " |\n"))
-
-    out.append(("class:border", "+" + "-" * box_width + "+\n"))
+    body = [_clip(line) for raw in lines for line in (str(raw).splitlines() or [""])]
     hint = tui._t("CONFIRM_HINT")
-    out.append(("class:border", "| "))
-    out.append(("class:text.dim", _clip(hint).ljust(inner)))
-    out.append(("class:border", " |\n"))
-    out.append(("class:border", "+" + "=" * box_width + "+"))
+
+    # Adjacent border pieces are merged into one fragment (" |\n| " between rows).
+    out: List[Tuple[str, str]] = [
+        ("class:border", top + "| "),
+        ("class:header", _clip(title)),
+        ("class:border", " |\n" + rule + "| "),
+    ]
+    row_sep = ("class:border", " |\n| ")
+    for idx, row in enumerate(body):
+        if idx:
+            out.append(row_sep)
+        out.append(("class:text", row))
+    out.append(("class:border", " |\n" + rule + "| "))
+    out.append(("class:text.dim", _clip(hint)))
+    out.append(("class:border", " |\n" + bottom))
     return FormattedText(out)
 
 
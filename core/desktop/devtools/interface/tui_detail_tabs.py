@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 
-from typing import List, Tuple
+from typing import Any, Dict, List, Sequence, Tuple
 
 from prompt_toolkit.formatted_text import FormattedText
 
@@ -51,7 +51,7 @@ def _render_radar_tab(tui) -> FormattedText:
     content_width = tui._detail_content_width()
     header_lines = _header_lines(tui, detail, content_width)
     tab_lines, tab_hitboxes = _tab_bar_lines(tui, content_width)
-    tui._detail_tab_hitboxes = {"y": len(header_lines), "ranges": tab_hitboxes}
+    tui._detail_tab_hitboxes = make_tab_hitboxes(len(header_lines), tab_hitboxes)
     footer_lines = _footer_lines(tui, content_width)
 
     body_lines: List[List[Tuple[str, str]]] = []
@@ -166,7 +166,7 @@ def _render_plan_tab(tui) -> FormattedText:
     content_width = tui._detail_content_width()
     header_lines = _header_lines(tui, detail, content_width)
     tab_lines, tab_hitboxes = _tab_bar_lines(tui, content_width)
-    tui._detail_tab_hitboxes = {"y": len(header_lines), "ranges": tab_hitboxes}
+    tui._detail_tab_hitboxes = make_tab_hitboxes(len(header_lines), tab_hitboxes)
     footer_lines = _footer_lines(tui, content_width)
 
     body_lines: List[List[Tuple[str, str]]] = []
@@ -234,7 +234,7 @@ def _render_notes_tab(tui) -> FormattedText:
     content_width = tui._detail_content_width()
     header_lines = _header_lines(tui, detail, content_width)
     tab_lines, tab_hitboxes = _tab_bar_lines(tui, content_width)
-    tui._detail_tab_hitboxes = {"y": len(header_lines), "ranges": tab_hitboxes}
+    tui._detail_tab_hitboxes = make_tab_hitboxes(len(header_lines), tab_hitboxes)
     footer_lines = _footer_lines(tui, content_width)
 
     body_lines: List[List[Tuple[str, str]]] = []
@@ -272,7 +272,7 @@ def _render_contract_tab(tui) -> FormattedText:
     content_width = tui._detail_content_width()
     header_lines = _header_lines(tui, detail, content_width)
     tab_lines, tab_hitboxes = _tab_bar_lines(tui, content_width)
-    tui._detail_tab_hitboxes = {"y": len(header_lines), "ranges": tab_hitboxes}
+    tui._detail_tab_hitboxes = make_tab_hitboxes(len(header_lines), tab_hitboxes)
     footer_lines = _footer_lines(tui, content_width)
 
     body_lines: List[List[Tuple[str, str]]] = []
@@ -324,7 +324,7 @@ def _render_meta_tab(tui) -> FormattedText:
     content_width = tui._detail_content_width()
     header_lines = _header_lines(tui, detail, content_width)
     tab_lines, tab_hitboxes = _tab_bar_lines(tui, content_width)
-    tui._detail_tab_hitboxes = {"y": len(header_lines), "ranges": tab_hitboxes}
+    tui._detail_tab_hitboxes = make_tab_hitboxes(len(header_lines), tab_hitboxes)
     footer_lines = _footer_lines(tui, content_width)
 
     body_lines: List[List[Tuple[str, str]]] = []
@@ -445,6 +445,17 @@ def _header_lines(tui, detail, content_width: int) -> List[List[Tuple[str, str]]
     return lines
 
 
+def make_tab_hitboxes(y: int, ranges: Sequence[Tuple[int, int, str]]) -> Dict[str, Any]:
+    """Tab bar click targets: row `y` plus parallel sorted `starts`/`ends`/`ids` for bisect lookup."""
+    return {
+        "y": int(y),
+        "ranges": list(ranges),
+        "starts": tuple(int(start) for start, _, _ in ranges),
+        "ends": tuple(int(end) for _, end, _ in ranges),
+        "ids": tuple(tab_id for _, _, tab_id in ranges),
+    }
+
+
 def _tab_bar_lines(tui, content_width: int) -> tuple[List[List[Tuple[str, str]]], List[Tuple[int, int, str]]]:
     inner = max(0, content_width - 2)
     current = getattr(tui, "detail_tab", "overview") or "overview"
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Dict, Iterable, List, Literal, Optional, Sequence, Set, Tuple
 
 from core import PlanNode, Status, Step, TaskNode
@@ -10,18 +12,67 @@ from core import PlanNode, Status, Step, TaskNode
 
 DetailNodeKind = Literal["step", "plan", "task"]
 
+# Interned key segments ("s:0", "t:3", …), grown on demand by _child_key().
+_STEP_SEGMENTS: List[str] = [sys.intern(f"s:{i}") for i in range(1024)]
+_TASK_SEGMENTS: List[str] = [sys.intern(f"t:{i}") for i in range(256)]
+
+
+def _child_key(prefix: str, segments: List[str], tag: str, idx: int) -> str:
+    if idx >= len(segments):
+        segments.extend(sys.intern(f"{tag}:{i}") for i in range(len(segments), idx + 1))
+    segment = segments[idx]
+    return sys.intern(prefix + "." + segment) if prefix else segment
+
+
+def _step_key(prefix: str, idx: int) -> str:
+    return _child_key(prefix, _STEP_SEGMENTS, "s", idx)
+
+
+def _task_key(prefix: str, idx: int) -> str:
+    return _child_key(prefix, _TASK_SEGMENTS, "t", idx)
+
+
+# One C-level call per node instead of several getattr(..., default) lookups.
+_STEP_FIELDS = attrgetter("completed", "blocked", "criteria_confirmed", "tests_confirmed", "tests_auto_confirmed", "plan")
+_TASK_FIELDS = attrgetter("blocked", "status_manual", "status")
+
+
+def _step_fields(st: object) -> Tuple[bool, bool, bool, bool, bool, Optional[PlanNode]]:
+    try:
+        return _STEP_FIELDS(st)
+    except AttributeError:
+        return (
+            getattr(st, "completed", False),
+            getattr(st, "blocked", False),
+            getattr(st, "criteria_confirmed", False),
+            getattr(st, "tests_confirmed", False),
+            getattr(st, "tests_auto_confirmed", False),
+            getattr(st, "plan", None),
+        )
+
+
+def _task_fields(task: object) -> Tuple[bool, bool, object]:
+    try:
+        return _TASK_FIELDS(task)
+    except AttributeError:
+        return (
+            getattr(task, "blocked", False),
+            getattr(task, "status_manual", False),
+            getattr(task, "status", ""),
+        )
+
 
 def plan_key(step_path: str) -> str:
     step_path = str(step_path or "").strip()
-    return f"p:{step_path}" if step_path else "p:"
+    return sys.intern("p:" + step_path) if step_path else "p:"
 
 
 def node_kind(key: str) -> DetailNodeKind:
     key = str(key or "")
     if key.startswith("p:"):
         return "plan"
-    leaf = key.split(".")[-1]
-    if leaf.startswith("t:"):
+    # Leaf segment via rfind: no list allocation (rfind == -1 → whole key).
+    if key.startswith("t:", key.rfind(".") + 1):
         return "task"
     return "step"
 
@@ -34,7 +85,7 @@ def canonical_path(key: str, kind: Optional[DetailNodeKind] = None) -> str:
     return k
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DetailNodeEntry:
     key: str
     kind: DetailNodeKind
@@ -49,7 +100,7 @@ class DetailNodeEntry:
         return canonical_path(self.key, self.kind)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DetailNodeStats:
     progress: int
     children_done: int
@@ -57,12 +108,27 @@ class DetailNodeStats:
     status: Status
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _StepAgg:
     total: int
     done: int
 
 
+def _collapsed_prefixes(collapsed: Set[str]) -> Set[str]:
+    """All ancestor paths (inclusive) of collapsed keys; plan keys map to their step path.
+
+    A subtree rooted at path P can contain a collapsed node only if P is in this set.
+    """
+    prefixes: Set[str] = set()
+    for key in collapsed:
+        path = key[2:] if key.startswith("p:") else key
+        end = len(path)
+        while end > 0 and path[:end] not in prefixes:
+            prefixes.add(path[:end])
+            end = path.rfind(".", 0, end)
+    return prefixes
+
+
 def first_child_key(entry: DetailNodeEntry) -> Optional[str]:
     if entry.kind == "step":
         step = entry.node if isinstance(entry.node, Step) else None
@@ -75,13 +141,13 @@ def first_child_key(entry: DetailNodeEntry) -> Optional[str]:
         tasks = list(getattr(plan, "tasks", []) or []) if plan else []
         if not tasks:
             return None
-        return f"{canonical_path(entry.key, entry.kind)}.t:0"
+        return _task_key(canonical_path(entry.key, entry.kind), 0)
     if entry.kind == "task":
         task = entry.node if isinstance(entry.node, TaskNode) else None
         steps = list(getattr(task, "steps", []) or []) if task else []
         if not steps:
             return None
-        return f"{entry.key}.s:0"
+        return _step_key(entry.key, 0)
     return None
 
 
@@ -101,169 +167,143 @@ def flatten_detail_tree(
     - Plan key == p:<canonical step path>
     """
     out: List[DetailNodeEntry] = []
+    collapsed_set = set(collapsed or set())
+    collapsed_prefixes = _collapsed_prefixes(collapsed_set)
+    # `check` is False for subtrees that cannot contain a collapsed key: skip membership tests there.
     frames: List[Tuple[str, object]] = [
-        ("steps", (list(root_steps or []), str(prefix or ""), int(level or 0), parent_key, 0))
+        ("steps", (list(root_steps or []), str(prefix or ""), int(level or 0), parent_key, 0, bool(collapsed_set)))
     ]
-    collapsed_set = set(collapsed or set())
 
     while frames:
         kind, payload = frames.pop()
         if kind == "task":
-            task, task_key, task_steps, task_level, task_parent_key = payload
+            task, task_key, task_steps, task_level, task_parent_key, check = payload
             task_children = list(task_steps or [])
             task_has_children = bool(task_children)
-            task_collapsed = task_key in collapsed_set
-            out.append(
-                DetailNodeEntry(
-                    key=task_key,
-                    kind="task",
-                    node=task,
-                    level=task_level,
-                    collapsed=task_collapsed,
-                    has_children=task_has_children,
-                    parent_key=task_parent_key,
-                )
-            )
+            task_collapsed = check and task_key in collapsed_set
+            out.append(DetailNodeEntry(task_key, "task", task, task_level, task_collapsed, task_has_children, task_parent_key))
             if task_collapsed or not task_children:
                 continue
-            frames.append(("steps", (task_children, task_key, task_level + 1, task_key, 0)))
+            frames.append(("steps", (task_children, task_key, task_level + 1, task_key, 0, check)))
             continue
 
-        steps, cur_prefix, cur_level, cur_parent_key, idx = payload
+        steps, cur_prefix, cur_level, cur_parent_key, idx, check = payload
         if idx >= len(steps):
             continue
         st = steps[idx]
-        frames.append(("steps", (steps, cur_prefix, cur_level, cur_parent_key, idx + 1)))
+        frames.append(("steps", (steps, cur_prefix, cur_level, cur_parent_key, idx + 1, check)))
 
-        step_path = f"{cur_prefix}.s:{idx}" if cur_prefix else f"s:{idx}"
+        step_path = _step_key(cur_prefix, idx)
         step_key = step_path
+        step_check = check and step_path in collapsed_prefixes
         plan = getattr(st, "plan", None)
         step_has_children = bool(plan)
-        step_collapsed = step_key in collapsed_set
-        out.append(
-            DetailNodeEntry(
-                key=step_key,
-                kind="step",
-                node=st,
-                level=cur_level,
-                collapsed=step_collapsed,
-                has_children=step_has_children,
-                parent_key=cur_parent_key,
-            )
-        )
+        step_collapsed = step_check and step_key in collapsed_set
+        out.append(DetailNodeEntry(step_key, "step", st, cur_level, step_collapsed, step_has_children, cur_parent_key))
         if step_collapsed or not plan:
             continue
 
         p_key = plan_key(step_path)
         plan_tasks = list(getattr(plan, "tasks", []) or [])
         plan_has_children = bool(plan_tasks)
-        plan_collapsed = p_key in collapsed_set
-        out.append(
-            DetailNodeEntry(
-                key=p_key,
-                kind="plan",
-                node=plan,
-                level=cur_level + 1,
-                collapsed=plan_collapsed,
-                has_children=plan_has_children,
-                parent_key=step_key,
-            )
-        )
+        plan_collapsed = step_check and p_key in collapsed_set
+        out.append(DetailNodeEntry(p_key, "plan", plan, cur_level + 1, plan_collapsed, plan_has_children, step_key))
         if plan_collapsed:
             continue
 
         # LIFO: push in reverse order so t:0 is processed first.
         for t_idx in reversed(range(len(plan_tasks))):
             task = plan_tasks[t_idx]
-            task_key = f"{step_path}.t:{t_idx}"
+            task_key = _task_key(step_path, t_idx)
             task_steps = list(getattr(task, "steps", []) or [])
-            frames.append(("task", (task, task_key, task_steps, cur_level + 2, p_key)))
+            task_check = step_check and task_key in collapsed_prefixes
+            frames.append(("task", (task, task_key, task_steps, cur_level + 2, p_key, task_check)))
 
     return out
 
 
 def compute_detail_stats(root_steps: Sequence[Step], *, prefix: str = "") -> Dict[str, DetailNodeStats]:
     """Compute cached %/Σ/status for every node under `root_steps` (iterative, no recursion)."""
-    step_by_key: Dict[str, Step] = {}
+    roots = list(root_steps or [])
+    prefix = str(prefix or "")
     plan_by_key: Dict[str, PlanNode] = {}
     task_by_key: Dict[str, TaskNode] = {}
-    step_children: Dict[str, List[str]] = {}
-    task_children: Dict[str, List[str]] = {}
     plan_children_tasks: Dict[str, List[str]] = {}
-    step_agg: Dict[str, _StepAgg] = {}
-
-    stack: List[Tuple[Step, str, bool]] = []
-    roots = list(root_steps or [])
-    prefix = str(prefix or "")
+    # Per-step flags in parallel arrays (SoA), read once during traversal.
+    step_keys: List[str] = []
+    step_parent_idx: List[int] = []
+    step_task_key: List[Optional[str]] = []  # owning task node (None for roots)
+    step_completed: List[bool] = []
+    step_blocked: List[bool] = []
+    step_criteria: List[bool] = []
+    step_tests: List[bool] = []
+
+    # Pass 1 — pre-order walk: every step is recorded before its descendants.
+    stack: List[Tuple[Step, str, int, Optional[str]]] = []
     for idx in reversed(range(len(roots))):
-        root_key = f"{prefix}.s:{idx}" if prefix else f"s:{idx}"
-        stack.append((roots[idx], root_key, False))
+        root_key = _step_key(prefix, idx)
+        stack.append((roots[idx], root_key, -1, None))
 
     while stack:
-        st, step_key, expanded = stack.pop()
-        if expanded:
-            total = 1
-            done = 1 if getattr(st, "completed", False) else 0
-            for child_key in step_children.get(step_key, []):
-                agg = step_agg.get(child_key)
-                if agg:
-                    total += agg.total
-                    done += agg.done
-            step_agg[step_key] = _StepAgg(total=total, done=done)
+        st, step_key, parent_idx, owner_key = stack.pop()
+        step_idx = len(step_keys)
+        step_keys.append(step_key)
+        step_parent_idx.append(parent_idx)
+        step_task_key.append(owner_key)
+        completed, blocked, criteria_ok, tests_ok, tests_auto, plan = _step_fields(st)
+        step_completed.append(bool(completed))
+        step_blocked.append(bool(blocked))
+        step_criteria.append(bool(criteria_ok))
+        step_tests.append(bool(tests_ok) or bool(tests_auto))
+        if plan is None:
             continue
-
-        step_by_key[step_key] = st
-        children: List[str] = []
-        plan = getattr(st, "plan", None)
-        tasks = list(getattr(plan, "tasks", []) or []) if plan else []
-        if plan is not None:
-            p_key = plan_key(step_key)
-            plan_by_key[p_key] = plan
-            plan_children_tasks[p_key] = []
-            for t_idx, task in enumerate(tasks):
-                task_key = f"{step_key}.t:{t_idx}"
-                task_by_key[task_key] = task
-                plan_children_tasks[p_key].append(task_key)
-                task_steps = list(getattr(task, "steps", []) or [])
-                direct: List[str] = []
-                for s_idx in range(len(task_steps)):
-                    child_key = f"{task_key}.s:{s_idx}"
-                    children.append(child_key)
-                    direct.append(child_key)
-                task_children[task_key] = direct
-
-        step_children[step_key] = children
-
-        # Post-order: aggregate after children.
-        stack.append((st, step_key, True))
-        # Push children for processing.
-        for t_idx in reversed(range(len(tasks))):
-            task = tasks[t_idx]
-            task_key = f"{step_key}.t:{t_idx}"
-            task_steps = list(getattr(task, "steps", []) or [])
-            for s_idx in reversed(range(len(task_steps))):
-                child_key = f"{task_key}.s:{s_idx}"
-                stack.append((task_steps[s_idx], child_key, False))
-
+        tasks = list(getattr(plan, "tasks", []) or [])
+        p_key = plan_key(step_key)
+        plan_by_key[p_key] = plan
+        plan_task_keys: List[str] = []
+        plan_children_tasks[p_key] = plan_task_keys
+        pushes: List[Tuple[Step, str, int, Optional[str]]] = []
+        for t_idx, task in enumerate(tasks):
+            task_key = _task_key(step_key, t_idx)
+            task_by_key[task_key] = task
+            plan_task_keys.append(task_key)
+            for s_idx, child in enumerate(getattr(task, "steps", []) or []):
+                pushes.append((child, _step_key(task_key, s_idx), step_idx, task_key))
+
+        # Push children for processing (LIFO: reversed so t:0.s:0 is visited first).
+        stack.extend(reversed(pushes))
+
+    # Pass 2 — reverse sweep over the pre-order arrays (children before parents).
+    totals = [1] * len(step_keys)
+    dones = [1 if c else 0 for c in step_completed]
+    for i in range(len(step_keys) - 1, -1, -1):
+        parent = step_parent_idx[i]
+        if parent >= 0:
+            totals[parent] += totals[i]
+            dones[parent] += dones[i]
+    task_totals: Dict[str, int] = dict.fromkeys(task_by_key, 0)
+    task_dones: Dict[str, int] = dict.fromkeys(task_by_key, 0)
+    for owner_key, total, done in zip(step_task_key, totals, dones):
+        if owner_key is not None:
+            task_totals[owner_key] += total
+            task_dones[owner_key] += done
+
+    status_done, status_active, status_todo = Status.DONE, Status.ACTIVE, Status.TODO
+    task_flags: Dict[str, Tuple[bool, bool, object]] = {}
     task_step_agg: Dict[str, _StepAgg] = {}
     task_done: Dict[str, bool] = {}
     for task_key, task in task_by_key.items():
-        total = 0
-        done = 0
-        for child_key in task_children.get(task_key, []):
-            agg = step_agg.get(child_key)
-            if not agg:
-                continue
-            total += agg.total
-            done += agg.done
+        total = task_totals[task_key]
+        done = task_dones[task_key]
         task_step_agg[task_key] = _StepAgg(total=total, done=done)
 
-        blocked = bool(getattr(task, "blocked", False))
-        status_manual = bool(getattr(task, "status_manual", False))
+        flags = _task_fields(task)
+        task_flags[task_key] = flags
+        blocked, status_manual, raw_status = flags
         if blocked:
             done_bool = False
         elif status_manual:
-            done_bool = str(getattr(task, "status", "") or "").strip().upper() == "DONE"
+            done_bool = str(raw_status or "").strip().upper() == "DONE"
         else:
             done_bool = total > 0 and done == total
         task_done[task_key] = done_bool
@@ -277,59 +317,56 @@ def compute_detail_stats(root_steps: Sequence[Step], *, prefix: str = "") -> Dic
         done = sum(1 for tk in task_keys if task_done.get(tk, False))
         progress = int((done / total) * 100) if total else 0
         if total and done == total:
-            status = Status.DONE
+            status = status_done
             progress = 100
         elif done > 0:
-            status = Status.ACTIVE
+            status = status_active
         else:
-            status = Status.TODO
+            status = status_todo
         out[p_key] = DetailNodeStats(progress=progress, children_done=done, children_total=total, status=status)
 
     # Task nodes: Σ = done/total steps (deep, including nested plans).
-    for task_key, task in task_by_key.items():
+    for task_key in task_by_key:
         agg = task_step_agg.get(task_key, _StepAgg(total=0, done=0))
         total = agg.total
         done = agg.done
         progress = int((done / total) * 100) if total else 0
-        blocked = bool(getattr(task, "blocked", False))
-        status_manual = bool(getattr(task, "status_manual", False))
+        blocked, status_manual, raw_status = task_flags[task_key]
         if blocked:
-            status = Status.TODO
+            status = status_todo
         elif status_manual:
-            status = Status.from_string(str(getattr(task, "status", "") or "TODO"))
+            status = Status.from_string(str(raw_status or "TODO"))
         else:
             if total and done == total:
-                status = Status.DONE
+                status = status_done
                 progress = 100
             elif done > 0:
-                status = Status.ACTIVE
+                status = status_active
             else:
-                status = Status.TODO
+                status = status_todo
         out[task_key] = DetailNodeStats(progress=progress, children_done=done, children_total=total, status=status)
 
     # Step nodes: Σ = done/total descendant steps; status = readiness (criteria/tests + plan tasks done).
-    for step_key, step in step_by_key.items():
-        agg = step_agg.get(step_key, _StepAgg(total=1, done=1 if getattr(step, "completed", False) else 0))
-        total = agg.total
-        done_total = agg.done
+    step_ready = [
+        criteria and tests and not blocked and not completed
+        for completed, blocked, criteria, tests in zip(step_completed, step_blocked, step_criteria, step_tests)
+    ]
+    for i, step_key in enumerate(step_keys):
+        self_done = 1 if step_completed[i] else 0
+        total = totals[i]
+        done_total = dones[i]
         progress = int((done_total / total) * 100) if total else 0
-        self_done = 1 if getattr(step, "completed", False) else 0
         children_total = max(0, total - 1)
         children_done = max(0, done_total - self_done)
 
-        if getattr(step, "completed", False):
-            status = Status.DONE
+        if self_done:
+            status = status_done
+        elif step_ready[i]:
+            plan_task_keys = plan_children_tasks.get(plan_key(step_key)) or []
+            plan_ready = all(task_done.get(tk, False) for tk in plan_task_keys)
+            status = status_active if plan_ready else status_todo
         else:
-            blocked = bool(getattr(step, "blocked", False))
-            if blocked:
-                status = Status.TODO
-            else:
-                criteria_ok = bool(getattr(step, "criteria_confirmed", False))
-                tests_ok = bool(getattr(step, "tests_confirmed", False)) or bool(getattr(step, "tests_auto_confirmed", False))
-                p_key = plan_key(step_key)
-                plan_task_keys = list(plan_children_tasks.get(p_key, []) or [])
-                plan_ready = all(task_done.get(tk, False) for tk in plan_task_keys) if plan_task_keys else True
-                status = Status.ACTIVE if (criteria_ok and tests_ok and plan_ready) else Status.TODO
+            status = status_todo
 
         out[step_key] = DetailNodeStats(
             progress=progress,
@@ -381,3 +418,9 @@ def iter_children(entries: Sequence[DetailNodeEntry], parent_key: str) -> Iterab
     for entry in entries:
         if entry.parent_key == pk:
             yield entry
+
+
+def children_count(entries: Sequence[DetailNodeEntry], parent_key: str) -> int:
+    """Number of direct children of `parent_key`."""
+    pk = str(parent_key or "")
+    return sum(1 for entry in entries if entry.parent_key == pk)
@@ -1,76 +1,114 @@
 """Footer renderer for TaskTrackerTUI."""
 
 import time
-from typing import List, Tuple
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from prompt_toolkit.formatted_text import FormattedText
 from wcwidth import wcwidth
 
+# Per-codepoint column width cache (wcwidth clamped to >= 0); ASCII printable is pre-seeded.
+_cwidth: Dict[str, int] = {chr(c): 1 for c in range(0x20, 0x7F)}
+
+
+def _cw(ch: str) -> int:
+    w = _cwidth.get(ch)
+    if w is None:
+        w = wcwidth(ch)
+        w = 0 if w is None or w < 0 else w
+        _cwidth[ch] = w
+    return w
+
+
+def _is_plain_ascii(text: str) -> bool:
+    """True when every char is printable ASCII (one column each, no tabs/controls)."""
+    return text.isascii() and text.isprintable()
+
 
 def _display_width(text: str) -> int:
-    text = (text or "").expandtabs(4)
+    text = text or ""
+    if _is_plain_ascii(text):
+        return len(text)
+    text = text.expandtabs(4)
     width = 0
     for ch in text:
-        w = wcwidth(ch)
-        if w is None or w < 0:
-            w = 0
-        width += w
+        width += _cw(ch)
     return width
 
 
-def _trim_display(text: str, width: int) -> str:
-    text = (text or "").expandtabs(4)
+def _trim_measure(text: str, width: int, prefix: Optional[List[int]] = None) -> Tuple[str, int]:
+    """Trim to ``width`` columns and return ``(trimmed, used_cols)``.
+
+    ``prefix`` may carry ``_prefix_widths`` of the tab-expanded text; the cut
+    point is then a binary search instead of a walk.
+    """
+    text = text or ""
+    if _is_plain_ascii(text):
+        trimmed = text[: max(0, width)]
+        return trimmed, len(trimmed)
+    text = text.expandtabs(4)
+    if prefix is not None:
+        i = max(0, bisect_right(prefix, width) - 1)
+        return text[:i], prefix[i]
     acc: List[str] = []
     used = 0
     for ch in text:
-        w = wcwidth(ch)
-        if w is None or w < 0:
-            w = 0
+        w = _cw(ch)
         if used + w > width:
             break
         acc.append(ch)
         used += w
-    return "".join(acc)
+    return "".join(acc), used
+
+
+def _trim_display(text: str, width: int, prefix: Optional[List[int]] = None) -> str:
+    return _trim_measure(text, width, prefix)[0]
 
 
 def _pad_display(text: str, width: int) -> str:
-    trimmed = _trim_display(text, width)
-    pad = max(0, width - _display_width(trimmed))
-    return trimmed + (" " * pad)
+    text = text or ""
+    if _is_plain_ascii(text):
+        return text[: max(0, width)].ljust(width)
+    trimmed, used = _trim_measure(text, width)
+    return trimmed + " " * max(0, width - used)
+
+
+def _prefix_widths(text: str) -> List[int]:
+    """Cumulative column widths: ``out[i]`` is the width of ``text[:i]``."""
+    out = [0]
+    total = 0
+    for ch in text:
+        total += _cw(ch)
+        out.append(total)
+    return out
+
 
+def _col_to_index(prefix: List[int], cols: int, lo: int = 0) -> int:
+    # First index landing exactly on `cols`, else the char straddling it.
+    i = bisect_left(prefix, cols, lo)
+    if i == len(prefix) or prefix[i] > cols:
+        i -= 1
+    return i
 
-def _slice_display(text: str, start_cols: int, width_cols: int) -> str:
-    """Slice text by display-width columns (wcwidth-aware)."""
+
+def _slice_display(text: str, start_cols: int, width_cols: int, prefix: Optional[List[int]] = None) -> str:
+    """Slice text by display-width columns (wcwidth-aware).
+
+    ``prefix`` may carry precomputed ``_prefix_widths(text)`` so repeated
+    slices of the same text (hover scroll) are two binary searches.
+    """
     if width_cols <= 0:
         return ""
     text = str(text or "")
     start_cols = max(0, start_cols)
-
-    # Advance to start.
-    i = 0
-    cols = 0
-    while i < len(text) and cols < start_cols:
-        w = wcwidth(text[i])
-        if w is None or w < 0:
-            w = 0
-        if cols + w > start_cols:
-            break
-        cols += w
-        i += 1
-
-    # Take up to width_cols.
-    out: List[str] = []
-    used = 0
-    while i < len(text) and used < width_cols:
-        w = wcwidth(text[i])
-        if w is None or w < 0:
-            w = 0
-        if used + w > width_cols:
-            break
-        out.append(text[i])
-        used += w
-        i += 1
-    return "".join(out)
+    if _is_plain_ascii(text):
+        return text[start_cols : start_cols + width_cols]
+    if prefix is None:
+        prefix = _prefix_widths(text)
+    i = _col_to_index(prefix, start_cols)
+    j = _col_to_index(prefix, prefix[i] + width_cols, i)
+    return text[i:j]
 
 
 def _allocate_pair(inner_width: int, *, left_weight: int, right_weight: int) -> tuple[int, int]:
@@ -121,65 +159,148 @@ def _allocate_triple(
             right = min_seg
         overflow = (left + middle + right) - avail
         if overflow > 0:
-            # Trim from the largest segment first.
-            sizes = [("left", left), ("middle", middle), ("right", right)]
-            sizes.sort(key=lambda x: x[1], reverse=True)
-            for name, _size in sizes:
-                if overflow <= 0:
-                    break
-                if name == "left" and left > min_seg:
-                    take = min(overflow, left - min_seg)
-                    left -= take
-                    overflow -= take
-                if name == "middle" and middle > min_seg:
-                    take = min(overflow, middle - min_seg)
-                    middle -= take
-                    overflow -= take
-                if name == "right" and right > min_seg:
-                    take = min(overflow, right - min_seg)
-                    right -= take
-                    overflow -= take
+            # Take the overflow from each segment's excess over min_seg, proportionally;
+            # the (at most 2 column) rounding remainder comes off the largest segment.
+            ex_l, ex_m, ex_r = left - min_seg, middle - min_seg, right - min_seg
+            total_excess = ex_l + ex_m + ex_r
+            take_l = overflow * ex_l // total_excess
+            take_m = overflow * ex_m // total_excess
+            take_r = overflow * ex_r // total_excess
+            left -= take_l
+            middle -= take_m
+            right -= take_r
+            for _ in range(overflow - take_l - take_m - take_r):
+                if left >= middle and left >= right:
+                    left -= 1
+                elif middle >= right:
+                    middle -= 1
+                else:
+                    right -= 1
     return left, middle, right
 
 
-def _fit_kv(label: str, value: str, width: int) -> str:
+def _fit_kv(label: str, value: str, width: int, label_w: Optional[int] = None) -> str:
     label = str(label or "")
     value = str(value or "—")
-    label_w = _display_width(label)
     if width <= 0:
         return ""
-    if _display_width(label + value) <= width:
-        return _pad_display(label + value, width)
+    if label_w is None:
+        label_w = _display_width(label)
+    used = label_w + _display_width(value)
+    if used <= width:
+        return label + value + " " * (width - used)
     avail = max(0, width - label_w)
     if avail <= 1:
-        return _pad_display(_trim_display(label + value, width), width)
+        return _pad_display(label + value, width)
     trimmed = _trim_display(value, max(0, avail - 1)) + "…"
     return _pad_display(label + trimmed, width)
 
 
+@lru_cache(maxsize=64)
+def _collapse_ws(text: str) -> str:
+    """Collapse whitespace runs to single spaces (cached: the same text repeats every frame)."""
+    return " ".join(text.split())
+
+
+_ID_PREFIXES = ("PLAN-", "TASK-", "STEP-", "NODE-")
+
+
 def _strip_id_prefix(value: str) -> str:
     raw = str(value or "").strip()
     if not raw:
         return ""
-    for prefix in ("PLAN-", "TASK-", "STEP-", "NODE-"):
-        if raw.upper().startswith(prefix):
+    head = raw[:5].upper()
+    for prefix in _ID_PREFIXES:
+        if head == prefix:
             return raw[len(prefix):]
     return raw
 
 
+_ROW_OPEN = ("class:border", "| ")
+_ROW_CLOSE = ("class:border", " |\n")
+
+
+@lru_cache(maxsize=16)
+def _border(inner_width: int) -> Tuple[Tuple[str, str], Tuple[str, str]]:
+    line = "+" + "-" * (inner_width + 2) + "+"
+    return ("class:border", line + "\n"), ("class:border", line)
+
+
+_NO_CHECKS = ("—", "—", "—")
+
+
+def _checks_row(criteria_label: str, tests_label: str, blockers_label: str, checks: Tuple[str, str, str], width: int) -> str:
+    criteria, tests, blockers = checks
+    line = "".join((criteria_label, criteria, " | ", tests_label, tests, " | ", blockers_label, blockers))
+    # One prefix-width pass yields both the total width and the cut point.
+    prefix = None
+    if _is_plain_ascii(line):
+        line_w = len(line)
+    else:
+        prefix = _prefix_widths(line.expandtabs(4))
+        line_w = prefix[-1]
+    if line_w > width:
+        return _pad_display(_trim_display(line, max(0, width - 1), prefix) + "…", width)
+    return line + " " * (width - line_w)
+
+
+@lru_cache(maxsize=8)
+def _empty_checks_row(criteria_label: str, tests_label: str, blockers_label: str, width: int) -> str:
+    return _checks_row(criteria_label, tests_label, blockers_label, _NO_CHECKS, width)
+
+
+_LABEL_KEYS = ("DOMAIN", "FOOTER_TIME", "FOOTER_DURATION", "DESCRIPTION", "CRITERIA", "TESTS", "BLOCKERS")
+
+
+def _footer_labels(tui) -> Dict[str, str]:
+    """Translated ``"<label>: "`` prefixes, cached on the TUI per language."""
+    lang = getattr(tui, "language", None)
+    cached = getattr(tui, "_footer_labels_cache", None)
+    if cached is not None and cached[0] == lang:
+        return cached[1]
+    labels = {key: f"{tui._t(key)}: " for key in _LABEL_KEYS}
+    labels["LIST_EDITOR_SCOPE_SUBTASK"] = f"{tui._t('LIST_EDITOR_SCOPE_SUBTASK', fallback='Step')}: "
+    labels["DESCRIPTION_MISSING"] = tui._t("DESCRIPTION_MISSING")
+    setattr(tui, "_footer_labels_cache", (lang, labels))
+    return labels
+
+
+def _sync_footer_height(tui, row_count: int) -> None:
+    if hasattr(tui, "_set_footer_height"):
+        if not any(
+            getattr(tui, flag, False)
+            for flag in ("confirm_mode", "settings_mode", "checkpoint_mode", "list_editor_mode")
+        ):
+            desired_height = row_count + 2
+            if int(getattr(tui, "footer_height", 0) or 0) != desired_height:
+                tui._set_footer_height(desired_height)
+
+
 def build_footer_text(tui) -> FormattedText:
     term_width = max(20, int(getattr(tui, "get_terminal_width")() if hasattr(tui, "get_terminal_width") else 80))
     inner_width = max(0, term_width - 4)
-    border = "+" + "-" * (inner_width + 2) + "+"
+    border_top, border_bottom = _border(inner_width)
+    # Helpers called several times per frame, bound as locals.
+    pad, fit, slice_cols, collapse, measure = _pad_display, _fit_kv, _slice_display, _collapse_ws, _display_width
+
+    # Frame-local width memo: labels and values are measured once per repaint.
+    widths: Dict[str, int] = {}
+
+    def dw(text: str) -> int:
+        w = widths.get(text)
+        if w is None:
+            w = widths[text] = measure(text)
+        return w
 
     def boxed(rows: List[str]) -> FormattedText:
-        parts: List[Tuple[str, str]] = []
-        parts.append(("class:border", border + "\n"))
+        parts: List[Tuple[str, str]] = [_ROW_OPEN] * (3 * len(rows) + 2)
+        parts[0] = border_top
+        i = 1
         for row in rows:
-            parts.append(("class:border", "| "))
-            parts.append(("class:text", _pad_display(row, inner_width)))
-            parts.append(("class:border", " |\n"))
-        parts.append(("class:border", border))
+            parts[i + 1] = ("class:text", pad(row, inner_width))
+            parts[i + 2] = _ROW_CLOSE
+            i += 3
+        parts[i] = border_bottom
         return FormattedText(parts)
 
     # Empty-state CTA footer (keep height stable and compact).
@@ -192,7 +313,7 @@ def build_footer_text(tui) -> FormattedText:
     detail = tui._current_task_detail_obj()
     desc_full = tui._current_description_snippet()
     if not desc_full and not detail_mode:
-        desc_full = tui._t("DESCRIPTION_MISSING")
+        desc_full = _footer_labels(tui)["DESCRIPTION_MISSING"]
     domain = "-"
     start_time = "-"
     finish_time = "-"
@@ -216,47 +337,9 @@ def build_footer_text(tui) -> FormattedText:
         hover_since = now
         setattr(tui, "_footer_desc_hover_since", now)
 
-    sep = " | "
-
-    time_value = f"{start_time} → {finish_time}"
-
-    # Row 1: Folder | Time | Duration (requested order).
-    # Allocate a bit more room to Duration so even long i18n keys remain readable on ~80-col terminals.
-    row1_left_w, row1_mid_w, row1_right_w = _allocate_triple(inner_width, left_weight=3, middle_weight=2, right_weight=2)
-    row1_left = _fit_kv(f"{tui._t('DOMAIN')}: ", domain, row1_left_w)
-    row1_mid = _fit_kv(f"{tui._t('FOOTER_TIME')}: ", time_value, row1_mid_w)
-    row1_right = _fit_kv(f"{tui._t('FOOTER_DURATION')}: ", str(duration_value or "—"), row1_right_w)
-
-    show_desc = True
-    if detail_mode and detail:
-        title_value = " ".join(str(getattr(detail, "title", "") or "").split()).strip()
-        desc_value = " ".join(str(desc_full or "").split()).strip()
-        if desc_value and title_value and desc_value.lower() == title_value.lower():
-            desc_full = ""
-    if detail_mode and not desc_full:
-        show_desc = False
-
-    row2 = ""
-    if show_desc:
-        # Row 2: Description (hover-scroll).
-        desc_label = f"{tui._t('DESCRIPTION')}: "
-        desc_label_w = _display_width(desc_label)
-        desc_value_w = max(0, inner_width - desc_label_w)
-        desc_value = str(desc_full or "").strip()
-        desc_value = " ".join(desc_value.split())
-        desc_total_w = _display_width(desc_value)
-        if desc_total_w <= desc_value_w or desc_value_w <= 0:
-            desc_rendered = _slice_display(desc_value, 0, desc_value_w)
-        else:
-            if hovered and hover_since > 0:
-                max_offset = max(0, desc_total_w - desc_value_w)
-                offset = int((now - hover_since) * 3.0) % (max_offset + 1)
-                desc_rendered = _slice_display(desc_value, offset, desc_value_w)
-            else:
-                desc_rendered = _slice_display(desc_value, 0, max(0, desc_value_w - 1)) + "…"
-        row2 = _pad_display(desc_label + desc_rendered, inner_width)
-
-    extra_rows: List[str] = []
+    # Detail-mode inputs: the selected step (if any) and its checks.
+    step_value = None
+    checks: Optional[Tuple[str, str, str]] = None
     if detail_mode and detail and getattr(detail, "kind", "task") != "plan":
         selected_entry = None
         if hasattr(tui, "_selected_subtask_entry"):
@@ -267,17 +350,12 @@ def build_footer_text(tui) -> FormattedText:
             except Exception:
                 selected_entry = None
         target = None
-        step_label = tui._t("LIST_EDITOR_SCOPE_SUBTASK", fallback="Step")
         if selected_entry and getattr(selected_entry, "kind", "") == "step":
             target = selected_entry.node
             step_id = _strip_id_prefix(getattr(target, "id", ""))
-            step_title = str(getattr(target, "title", "") or "").strip()
-            step_title = " ".join(step_title.split())
-            step_prefix = f"{step_label}: "
+            step_title = collapse(str(getattr(target, "title", "") or ""))
             # Avoid duplicating the selected row title (it is already visible in the list).
-            step_value = step_id or step_title
-            step_row = _fit_kv(step_prefix, step_value or "—", inner_width)
-            extra_rows.append(step_row)
+            step_value = step_id or step_title or "—"
         if target is None:
             target = detail
         criteria = "; ".join(list(getattr(target, "success_criteria", []) or [])) or "—"
@@ -287,27 +365,105 @@ def build_footer_text(tui) -> FormattedText:
             for item in list(getattr(detail, "blockers", []) or []):
                 if item not in blockers_list:
                     blockers_list.append(item)
-        blockers = "; ".join(blockers_list) or "—"
-        checks_line = f"{tui._t('CRITERIA')}: {criteria} | {tui._t('TESTS')}: {tests} | {tui._t('BLOCKERS')}: {blockers}"
-        if _display_width(checks_line) > inner_width:
-            checks_line = _trim_display(checks_line, max(0, inner_width - 1)) + "…"
-        extra_rows.append(_pad_display(checks_line, inner_width))
+        checks = (criteria, tests, "; ".join(blockers_list) or "—")
+
+    # Skip the layout when nothing visible changed since the last repaint; while
+    # hovered, the scroll tick is part of the key so frames still advance.
+    hover_tick = int((now - hover_since) * 3.0) if hovered and hover_since > 0 else -1
+    cache_key = (
+        inner_width,
+        detail_mode,
+        getattr(tui, "language", None),
+        desc_full,
+        str(getattr(detail, "title", "") or "") if detail else "",
+        domain,
+        start_time,
+        finish_time,
+        duration_value,
+        hover_tick,
+        step_value,
+        checks,
+    )
+    cached = getattr(tui, "_footer_cache", None)
+    if cached is not None and cached[0] == cache_key:
+        _sync_footer_height(tui, cached[1])
+        return cached[2]
+
+    sep = " | "
+
+    time_value = "".join((start_time, " → ", finish_time))
+
+    # Row 1: Folder | Time | Duration (requested order).
+    # Allocate a bit more room to Duration so even long i18n keys remain readable on ~80-col terminals.
+    row1_left_w, row1_mid_w, row1_right_w = _allocate_triple(inner_width, left_weight=3, middle_weight=2, right_weight=2)
+    labels = _footer_labels(tui)
+    domain_label = labels["DOMAIN"]
+    time_label = labels["FOOTER_TIME"]
+    duration_label = labels["FOOTER_DURATION"]
+    row1_left = fit(domain_label, domain, row1_left_w, dw(domain_label))
+    row1_mid = fit(time_label, time_value, row1_mid_w, dw(time_label))
+    row1_right = fit(duration_label, str(duration_value or "—"), row1_right_w, dw(duration_label))
+
+    show_desc = True
+    if detail_mode and detail:
+        title_value = collapse(str(getattr(detail, "title", "") or ""))
+        desc_value = collapse(str(desc_full or ""))
+        if desc_value and title_value and desc_value.lower() == title_value.lower():
+            desc_full = ""
+    if detail_mode and not desc_full:
+        show_desc = False
 
-    rows = [f"{row1_left}{sep}{row1_mid}{sep}{row1_right}" if inner_width > 0 else ""]
+    row2 = ""
+    if show_desc:
+        # Row 2: Description (hover-scroll).
+        desc_label = labels["DESCRIPTION"]
+        desc_label_w = dw(desc_label)
+        desc_value_w = max(0, inner_width - desc_label_w)
+        desc_value = collapse(str(desc_full or ""))
+        desc_total_w = dw(desc_value)
+        if desc_total_w <= desc_value_w and desc_value_w > 0:
+            # Whole description fits: pad from the widths already known.
+            row2 = desc_label + desc_value + " " * (inner_width - desc_label_w - desc_total_w)
+        elif desc_value_w <= 0:
+            row2 = pad(desc_label, inner_width)
+        else:
+            # Prefix widths survive across hover frames while the description is unchanged.
+            prefix = None
+            if not _is_plain_ascii(desc_value):
+                cached_prefix = getattr(tui, "_footer_desc_prefix", None)
+                if cached_prefix and cached_prefix[0] == desc_value:
+                    prefix = cached_prefix[1]
+                else:
+                    prefix = _prefix_widths(desc_value)
+                    setattr(tui, "_footer_desc_prefix", (desc_value, prefix))
+            if hover_tick >= 0:
+                max_offset = max(0, desc_total_w - desc_value_w)
+                offset = hover_tick % (max_offset + 1)
+                desc_rendered = slice_cols(desc_value, offset, desc_value_w, prefix)
+            else:
+                desc_rendered = slice_cols(desc_value, 0, max(0, desc_value_w - 1), prefix) + "…"
+            row2 = pad(desc_label + desc_rendered, inner_width)
+
+    extra_rows: List[str] = []
+    if checks is not None:
+        if step_value is not None:
+            step_prefix = labels["LIST_EDITOR_SCOPE_SUBTASK"]
+            extra_rows.append(fit(step_prefix, step_value, inner_width, dw(step_prefix)))
+        if checks == _NO_CHECKS:
+            # Common case: nothing defined, the row only depends on labels and width.
+            extra_rows.append(_empty_checks_row(labels["CRITERIA"], labels["TESTS"], labels["BLOCKERS"], inner_width))
+        else:
+            extra_rows.append(_checks_row(labels["CRITERIA"], labels["TESTS"], labels["BLOCKERS"], checks, inner_width))
+
+    rows = [sep.join((row1_left, row1_mid, row1_right)) if inner_width > 0 else ""]
     if row2:
         rows.append(row2 if inner_width > 0 else "")
     rows += extra_rows
 
-    if hasattr(tui, "_set_footer_height"):
-        if not any(
-            getattr(tui, flag, False)
-            for flag in ("confirm_mode", "settings_mode", "checkpoint_mode", "list_editor_mode")
-        ):
-            desired_height = len(rows) + 2
-            if int(getattr(tui, "footer_height", 0) or 0) != desired_height:
-                tui._set_footer_height(desired_height)
-
-    return boxed(rows)
+    _sync_footer_height(tui, len(rows))
+    result = boxed(rows)
+    setattr(tui, "_footer_cache", (cache_key, len(rows), result))
+    return result
 
 
 __all__ = ["build_footer_text"]
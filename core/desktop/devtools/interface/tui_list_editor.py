@@ -6,6 +6,9 @@ from typing import Any, Dict, List, Tuple
 
 from prompt_toolkit.formatted_text import FormattedText
 
+_BORDER_L = ("class:border", "| ")
+_BORDER_R = ("class:border", " |")
+
 
 def render_list_editor_dialog(tui) -> FormattedText:
     content_width = tui._detail_content_width()
@@ -89,16 +92,20 @@ def render_list_editor_dialog(tui) -> FormattedText:
     start = view_offset
     end = min(total, start + visible)
     for idx in range(start, end):
-        is_selected = idx == selected and stage != "menu"
-        # In menu stage, selection is also meaningful.
-        if stage == "menu":
-            is_selected = idx == selected
+        # Selection is highlighted in both the menu and list stages.
+        is_selected = idx == selected
         row_style = "class:header" if is_selected else "class:text"
         prefix = "> " if is_selected else "  "
         text_fragments = rows[idx]
-        rendered = "".join(frag for _, frag in text_fragments)
-        line_text = tui._trim_display(prefix + rendered, inner)
-        composed.append([("class:border", "| "), (row_style, tui._pad_display(line_text, inner)), ("class:border", " |")])
+        # Row builders emit a single fragment; join only when that ever changes.
+        rendered = text_fragments[0][1] if len(text_fragments) == 1 else "".join(frag for _, frag in text_fragments)
+        line_text = prefix + rendered
+        if line_text.isascii() and line_text.isprintable():
+            # Printable ASCII: one column per char, no wcwidth pass needed.
+            padded = line_text[:inner].ljust(inner)
+        else:
+            padded = tui._pad_display(line_text, inner)
+        composed.append([_BORDER_L, (row_style, padded), _BORDER_R])
 
     if hidden_below:
         composed.append([("class:border", "| "), ("class:text.dim", f"↓ +{hidden_below}".ljust(inner)), ("class:border", " |")])
@@ -1,11 +1,14 @@
 """Helpers to load and filter steps for the TUI."""
 
-from typing import Callable, List, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
 
-from core.desktop.devtools.application.task_manager import TaskManager, _flatten_steps
+from core.desktop.devtools.application.task_manager import TaskManager
 from core.desktop.devtools.interface.i18n import translate
 from core import Status, TaskDetail
 from core.status import normalize_status_code, status_label
+from core.step import _iter_step_tree
 
 
 _STATUS_SORT_ORDER = {"ACTIVE": 0, "TODO": 1, "DONE": 2}
@@ -14,7 +17,7 @@ _STATUS_SORT_ORDER = {"ACTIVE": 0, "TODO": 1, "DONE": 2}
 def _status_token(task: object) -> str:
     raw = getattr(task, "status", "")
     if isinstance(raw, Status):
-        return raw.value[0]
+        return raw.code
     if isinstance(raw, str):
         return raw.strip().upper()
     if hasattr(raw, "name"):
@@ -29,25 +32,28 @@ def _status_code_safe(raw: str) -> str:
         return raw
 
 
+@lru_cache(maxsize=32)
+def _status_code_for_token(token: str) -> str:
+    return _status_code_safe(status_label(token))
+
+
 def load_tasks_snapshot(manager: TaskManager, domain_filter: str, current_filter) -> List[TaskDetail]:
     items = manager.list_tasks(domain_filter)
+    wanted = None
     if current_filter:
         wanted_raw = current_filter.value[0] if hasattr(current_filter, "value") else str(current_filter)
         wanted = _status_code_safe(str(wanted_raw).strip().upper())
-        items = [
-            t
-            for t in items
-            if _status_code_safe(status_label(_status_token(t))) == wanted
-        ]
-
-    def _key(task: TaskDetail) -> tuple[int, int]:
-        code = _status_code_safe(status_label(_status_token(task)))
-        order = _STATUS_SORT_ORDER.get(code, 99)
-        progress = int(getattr(task, "progress", 0) or 0)
-        return order, progress
 
-    items.sort(key=_key, reverse=False)
-    return items
+    # One pass computes each task's status code once for both the filter and the sort key.
+    decorated = []
+    for idx, task in enumerate(items):
+        code = _status_code_for_token(_status_token(task))
+        if wanted is not None and code != wanted:
+            continue
+        progress = int(getattr(task, "progress", 0) or 0)
+        decorated.append((_STATUS_SORT_ORDER.get(code, 99), progress, idx, task))
+    decorated.sort(key=itemgetter(0, 1, 2))
+    return [entry[3] for entry in decorated]
 
 
 def load_tasks_with_state(tui) -> Tuple[List, str]:
@@ -67,30 +73,84 @@ def load_tasks_with_state(tui) -> Tuple[List, str]:
 
 
 def apply_context_filters(details: List[TaskDetail], phase_filter: str, component_filter: str) -> List[TaskDetail]:
-    filtered = details
-    if phase_filter:
-        filtered = [d for d in filtered if d.phase == phase_filter]
-    if component_filter:
-        filtered = [d for d in filtered if d.component == component_filter]
-    return filtered
-
-
-def build_task_models(details: List[TaskDetail], factory: Callable) -> List:
+    if not phase_filter and not component_filter:
+        return details
+    return [
+        d
+        for d in details
+        if (not phase_filter or d.phase == phase_filter) and (not component_filter or d.component == component_filter)
+    ]
+
+
+def task_view_predicate(phase_filter: str, component_filter: str, is_plan: Callable[[TaskDetail], bool]) -> Callable[[TaskDetail], bool]:
+    """Predicate for the unfiltered Tasks view: context filters, no plans, parent set.
+
+    Pass it to `build_task_models` so filtering and model building share one pass.
+    """
+
+    def _keep(d: TaskDetail) -> bool:
+        if phase_filter and d.phase != phase_filter:
+            return False
+        if component_filter and d.component != component_filter:
+            return False
+        return not is_plan(d) and bool(str(getattr(d, "parent", "") or "").strip())
+
+    return _keep
+
+
+@lru_cache(maxsize=32)
+def _status_from_token(token: str) -> Status:
+    return Status.from_string(token)
+
+
+def _step_counts(steps) -> Tuple[int, int]:
+    """Return (total, completed) over the nested step tree in one pass."""
+    total = 0
+    done = 0
+    for st in _iter_step_tree(steps):
+        total += 1
+        if getattr(st, "completed", False):
+            done += 1
+    return total, done
+
+
+def build_task_models(
+    details: List[TaskDetail],
+    factory: Callable,
+    keep: Optional[Callable[[TaskDetail], bool]] = None,
+    index_by_file: Optional[Dict[str, int]] = None,
+) -> List:
+    """Build list models; optionally record `task_file -> index` (first wins) in `index_by_file`."""
     tasks = []
     for det in details:
-        calc_progress = det.calculate_progress() if hasattr(det, "calculate_progress") else int(getattr(det, "progress", 0) or 0)
+        if keep is not None and not keep(det):
+            continue
+        steps_total, steps_completed = _step_counts(getattr(det, "steps", []) or [])
+        if type(det) is TaskDetail and getattr(det, "kind", "task") != "plan":
+            # Same result as det.calculate_progress(), reusing the counts above.
+            calc_progress = int((steps_completed / steps_total) * 100) if steps_total else det.progress
+        elif hasattr(det, "calculate_progress"):
+            calc_progress = det.calculate_progress()
+        else:
+            calc_progress = int(getattr(det, "progress", 0) or 0)
         blocked = bool(getattr(det, "blocked", False))
-        derived_status = Status.DONE if calc_progress == 100 and not blocked else Status.from_string(_status_token(det))
-        steps = getattr(det, "steps", []) or []
-        flat = list(_flatten_steps(list(steps)))
-        steps_total = len(flat)
-        steps_completed = sum(1 for _, st in flat if getattr(st, "completed", False))
-        tasks.append(factory(det, derived_status, calc_progress, steps_completed, steps_total))
+        derived_status = Status.DONE if calc_progress == 100 and not blocked else _status_from_token(_status_token(det))
+        model = factory(det, derived_status, calc_progress, steps_completed, steps_total)
+        if index_by_file is not None:
+            index_by_file.setdefault(getattr(model, "task_file", None), len(tasks))
+        tasks.append(model)
     return tasks
 
 
-def select_index_after_load(tasks: List, preserve_selection: bool, selected_task_file: str) -> int:
+def select_index_after_load(
+    tasks: List,
+    preserve_selection: bool,
+    selected_task_file: str,
+    index_by_file: Optional[Dict[str, int]] = None,
+) -> int:
     if preserve_selection and selected_task_file:
+        if index_by_file is not None:
+            return index_by_file.get(selected_task_file, 0)
         for idx, t in enumerate(tasks):
             if getattr(t, "task_file", None) == selected_task_file:
                 return idx
@@ -101,6 +161,7 @@ __all__ = [
     "load_tasks_snapshot",
     "load_tasks_with_state",
     "apply_context_filters",
+    "task_view_predicate",
     "build_task_models",
     "select_index_after_load",
 ]
@@ -10,9 +10,9 @@ from prompt_toolkit.mouse_events import MouseEvent
 from core import Status, TaskDetail
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
-    """TUI task model."""
+    """TUI task model (slotted: one per list row, read on every repaint)."""
     name: str
     status: Status
     description: str
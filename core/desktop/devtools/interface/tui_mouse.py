@@ -1,96 +1,152 @@
 """Mouse event handling helpers for TaskTrackerTUI."""
 
-from prompt_toolkit.mouse_events import MouseEventType, MouseButton, MouseModifier
+from bisect import bisect_right
+from operator import attrgetter
+from typing import Any, Optional, Tuple
 
+from prompt_toolkit.mouse_events import MouseEventType, MouseButton, MouseModifier
 
-def _handle_middle_paste(tui, mouse_event):
-    if (
-        mouse_event.event_type == MouseEventType.MOUSE_UP
-        and mouse_event.button == MouseButton.MIDDLE
-        and getattr(tui, "editing_mode", False)
-        and getattr(tui, "edit_context", "") == "token"
-    ):
+from core.desktop.devtools.interface.tui_detail_tabs import make_tab_hitboxes
+from core.desktop.devtools.interface.tui_navigation import _clamp
+from core.desktop.devtools.interface.tui_state import batch_render
+
+# Mode flags read on every mouse event: (editing_mode, edit_context, settings_mode, detail_mode, current_task_detail).
+_MOUSE_FIELDS = ("editing_mode", "edit_context", "settings_mode", "detail_mode", "current_task_detail")
+_MOUSE_DEFAULTS = (False, "", False, False, None)
+_MOUSE_STATE = attrgetter(*_MOUSE_FIELDS)
+# Enum members are singletons: compare with `is` against module-level bindings.
+_MOUSE_UP = MouseEventType.MOUSE_UP
+_SCROLL_UP = MouseEventType.SCROLL_UP
+_SCROLL_DOWN = MouseEventType.SCROLL_DOWN
+_LEFT = MouseButton.LEFT
+_MIDDLE = MouseButton.MIDDLE
+_SHIFT = MouseModifier.SHIFT
+_SCROLL = frozenset({_SCROLL_UP, _SCROLL_DOWN})
+
+MouseState = Tuple[Any, ...]
+
+
+def _mouse_state(tui) -> MouseState:
+    """Fetch the routing flags in one call (TaskTrackerTUI initializes them all)."""
+    try:
+        return _MOUSE_STATE(tui)
+    except AttributeError:
+        return tuple(getattr(tui, name, default) for name, default in zip(_MOUSE_FIELDS, _MOUSE_DEFAULTS))
+
+
+def _handle_middle_paste(tui, mouse_event, state: Optional[MouseState] = None):
+    if mouse_event.event_type is not _MOUSE_UP or mouse_event.button is not _MIDDLE:
+        return False
+    editing, edit_context = (state or _mouse_state(tui))[:2]
+    if editing and edit_context == "token":
         tui._paste_from_clipboard()
         return True
     return False
 
 
-def _handle_settings_mode(tui, mouse_event):
-    if not getattr(tui, "settings_mode", False) or getattr(tui, "editing_mode", False):
+def _handle_settings_mode(tui, mouse_event, state: Optional[MouseState] = None):
+    editing, _, settings_mode = (state or _mouse_state(tui))[:3]
+    if not settings_mode or editing:
         return None
-    if mouse_event.event_type == MouseEventType.SCROLL_DOWN:
+    et = mouse_event.event_type
+    if et is _SCROLL_DOWN:
         tui.move_settings_selection(1)
         return True
-    if mouse_event.event_type == MouseEventType.SCROLL_UP:
+    if et is _SCROLL_UP:
         tui.move_settings_selection(-1)
         return True
-    if mouse_event.event_type == MouseEventType.MOUSE_UP and mouse_event.button == MouseButton.LEFT:
+    if et is _MOUSE_UP and mouse_event.button is _LEFT:
         tui.activate_settings_option()
         return True
     return True
 
 
+def _queue_vertical_scroll(tui, delta: int) -> None:
+    """Accumulate wheel steps and apply them as one move on the next loop tick.
+
+    Trackpad bursts deliver many events per frame; this turns N single-row moves
+    into one `move_vertical_selection(N)`. Without a running loop, move immediately.
+    """
+    loop = getattr(getattr(tui, "app", None), "loop", None)
+    if loop is None or not loop.is_running():
+        tui.move_vertical_selection(delta)
+        return
+    tui._pending_scroll = getattr(tui, "_pending_scroll", 0) + delta
+    if not getattr(tui, "_scroll_flush_scheduled", False):
+        tui._scroll_flush_scheduled = True
+        loop.call_soon(_flush_vertical_scroll, tui)
+
+
+def _flush_vertical_scroll(tui) -> None:
+    delta = getattr(tui, "_pending_scroll", 0)
+    tui._pending_scroll = 0
+    tui._scroll_flush_scheduled = False
+    if delta:
+        tui.move_vertical_selection(delta)
+
+
 def _handle_scroll(tui, mouse_event):
-    shift = MouseModifier.SHIFT in mouse_event.modifiers
-    vertical_step = 1
-    horizontal_step = 5
-    if mouse_event.event_type == MouseEventType.SCROLL_DOWN:
-        if shift:
-            tui.horizontal_offset = min(200, getattr(tui, "horizontal_offset", 0) + horizontal_step)
-        else:
-            tui.move_vertical_selection(vertical_step)
-        return True
-    if mouse_event.event_type == MouseEventType.SCROLL_UP:
-        if shift:
-            tui.horizontal_offset = max(0, getattr(tui, "horizontal_offset", 0) - horizontal_step)
-        else:
-            tui.move_vertical_selection(-vertical_step)
-        return True
-    return False
+    et = mouse_event.event_type
+    if et not in _SCROLL:
+        return False
+    # Modifiers are usually empty: skip the membership hash in the common case.
+    mods = mouse_event.modifiers
+    shift = bool(mods) and _SHIFT in mods
+    down = et is _SCROLL_DOWN
+    if not shift:
+        _queue_vertical_scroll(tui, 1 if down else -1)
+    elif down:
+        tui.horizontal_offset = min(200, getattr(tui, "horizontal_offset", 0) + 5)
+    else:
+        tui.horizontal_offset = max(0, getattr(tui, "horizontal_offset", 0) - 5)
+    return True
 
 
-def _handle_detail_click(tui, mouse_event):
-    if not getattr(tui, "detail_mode", False):
+def _handle_detail_click(tui, mouse_event, state: Optional[MouseState] = None):
+    detail_mode, detail = (state or _mouse_state(tui))[3:5]
+    if not detail_mode:
         return None
-    if not getattr(tui, "current_task_detail", None):
+    if not detail:
         return True
 
+    # prompt_toolkit positions are Point(x: int, y: int); no coercion needed.
+    pos = mouse_event.position
+    y = pos.y
+
     # Detail tab bar click (hitboxes are computed by the renderer).
-    if mouse_event.event_type == MouseEventType.MOUSE_UP and mouse_event.button == MouseButton.LEFT:
+    if mouse_event.event_type is _MOUSE_UP and mouse_event.button is _LEFT:
         hitboxes = getattr(tui, "_detail_tab_hitboxes", None)
         if isinstance(hitboxes, dict):
-            try:
-                y = int(getattr(mouse_event.position, "y", -1))
-                x = int(getattr(mouse_event.position, "x", -1))
-            except Exception:
-                y = -1
-                x = -1
-            if y == int(hitboxes.get("y", -2)):
-                for start, end, tab_id in list(hitboxes.get("ranges", []) or []):
-                    try:
-                        if int(start) <= x < int(end):
-                            current = getattr(tui, "detail_tab", "overview") or "overview"
-                            if tab_id != current:
-                                tui.detail_tab = tab_id
-                                if tab_id != "overview":
-                                    getattr(tui, "detail_tab_scroll_offsets", {}).setdefault(tab_id, 0)
-                            tui.force_render()
-                            return True
-                    except Exception:
-                        continue
+            if y == hitboxes.get("y", -2):
+                starts = hitboxes.get("starts")
+                if starts is None:
+                    hitboxes = make_tab_hitboxes(hitboxes.get("y", -2), hitboxes.get("ranges", []) or [])
+                    starts = hitboxes["starts"]
+                x = pos.x
+                i = bisect_right(starts, x) - 1
+                if i >= 0 and x < hitboxes["ends"][i]:
+                    tab_id = hitboxes["ids"][i]
+                    current = getattr(tui, "detail_tab", "overview") or "overview"
+                    if tab_id != current:
+                        tui.detail_tab = tab_id
+                        if tab_id != "overview":
+                            getattr(tui, "detail_tab_scroll_offsets", {}).setdefault(tab_id, 0)
+                    tui.force_render()
+                    return True
                 # Click on the tab bar line, but not on a tab.
                 return True
 
-    idx = tui._subtask_index_from_y(mouse_event.position.y)
+    idx = tui._subtask_index_from_y(y)
     if idx is None:
         return True
 
-    detail = getattr(tui, "current_task_detail", None)
-    if detail and getattr(detail, "kind", "task") == "plan" and getattr(tui, "detail_tab", "overview") == "overview":
-        plan_tasks = tui._plan_detail_tasks() if hasattr(tui, "_plan_detail_tasks") else []
+    if getattr(detail, "kind", "task") == "plan" and getattr(tui, "detail_tab", "overview") == "overview":
+        plan_tasks = getattr(tui, "plan_detail_tasks", None)
+        if plan_tasks is None:
+            plan_tasks = tui._plan_detail_tasks() if hasattr(tui, "_plan_detail_tasks") else []
         if not plan_tasks:
             return True
-        idx = max(0, min(idx, len(plan_tasks) - 1))
+        idx = _clamp(idx, len(plan_tasks) - 1)
         if getattr(tui, "detail_selected_index", None) == idx:
             if hasattr(tui, "_open_selected_plan_task_detail"):
                 tui._open_selected_plan_task_detail()
@@ -102,7 +158,7 @@ def _handle_detail_click(tui, mouse_event):
 
     if not getattr(tui, "detail_flat_subtasks", None):
         return True
-    idx = max(0, min(idx, len(tui.detail_flat_subtasks) - 1))
+    idx = _clamp(idx, len(tui.detail_flat_subtasks) - 1)
     path = tui.detail_flat_subtasks[idx].key
     if getattr(tui, "detail_selected_index", None) == idx:
         tui.show_subtask_details(path)
@@ -112,8 +168,8 @@ def _handle_detail_click(tui, mouse_event):
     return True
 
 
-def _handle_list_click(tui, mouse_event):
-    if getattr(tui, "detail_mode", False):
+def _handle_list_click(tui, mouse_event, state: Optional[MouseState] = None):
+    if (state or _mouse_state(tui))[3]:
         return None
     idx = tui._task_index_from_y(mouse_event.position.y)
     if idx is None:
@@ -127,22 +183,32 @@ def _handle_list_click(tui, mouse_event):
 
 
 def handle_body_mouse(tui, mouse_event):
-    """Route mouse events for TaskTrackerTUI body."""
-    if _handle_middle_paste(tui, mouse_event):
-        return None
-    if getattr(tui, "editing_mode", False):
+    """Route mouse events for TaskTrackerTUI body (at most one render per event)."""
+    # Drop wheel storms while editing before any routing (scroll never pastes).
+    if mouse_event.event_type in _SCROLL and _mouse_state(tui)[0]:
         return NotImplemented
-    settings = _handle_settings_mode(tui, mouse_event)
-    if settings is True:
+    with batch_render(tui):
+        return _route_body_mouse(tui, mouse_event)
+
+
+def _route_body_mouse(tui, mouse_event):
+    state = _mouse_state(tui)
+    if _handle_middle_paste(tui, mouse_event, state):
         return None
-    if settings is not None:
+    if state[0]:
         return NotImplemented
+    if state[2]:
+        settings = _handle_settings_mode(tui, mouse_event, state)
+        if settings is True:
+            return None
+        if settings is not None:
+            return NotImplemented
     if _handle_scroll(tui, mouse_event):
         return None
-    if mouse_event.event_type == MouseEventType.MOUSE_UP and mouse_event.button == MouseButton.LEFT:
-        if _handle_detail_click(tui, mouse_event):
+    if mouse_event.event_type is _MOUSE_UP and mouse_event.button is _LEFT:
+        if _handle_detail_click(tui, mouse_event, state):
             return None
-        if _handle_list_click(tui, mouse_event):
+        if _handle_list_click(tui, mouse_event, state):
             return None
     return NotImplemented
 
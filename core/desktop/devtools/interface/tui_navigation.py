@@ -1,5 +1,24 @@
 """Navigation helpers for TaskTrackerTUI to keep tasks_app slim."""
 
+from operator import attrgetter
+
+from core.desktop.devtools.interface.tui_state import batch_render
+
+_NAV_FIELDS = ("detail_mode", "current_task_detail", "detail_tab", "settings_mode")
+_NAV_DEFAULTS = (False, None, "overview", False)
+_NAV_STATE = attrgetter(*_NAV_FIELDS)
+
+
+def _nav_state(tui):
+    try:
+        return _NAV_STATE(tui)
+    except AttributeError:
+        return tuple(getattr(tui, name, default) for name, default in zip(_NAV_FIELDS, _NAV_DEFAULTS))
+
+
+def _clamp(value: int, hi: int) -> int:
+    """Clamp to [0, hi] (hi >= 0) with plain compares instead of max(0, min(...))."""
+    return 0 if value < 0 else (hi if value > hi else value)
 
 
 def move_vertical_selection(tui, delta: int) -> None:
@@ -8,20 +27,23 @@ def move_vertical_selection(tui, delta: int) -> None:
 
     Works both in list mode (task rows) and detail mode (subtasks/dependencies).
     """
-    if getattr(tui, "detail_mode", False):
-        detail = getattr(tui, "current_task_detail", None)
-        if detail and getattr(detail, "kind", "task") == "plan" and getattr(tui, "detail_tab", "overview") == "overview":
-            cached = getattr(tui, "detail_plan_tasks", []) or []
-            if cached and not getattr(tui, "_detail_plan_tasks_dirty", False):
-                plan_tasks = cached
-            else:
-                plan_tasks = tui._plan_detail_tasks() if hasattr(tui, "_plan_detail_tasks") else cached
+    with batch_render(tui):
+        _move_vertical_selection(tui, delta)
+
+
+def _move_vertical_selection(tui, delta: int) -> None:
+    detail_mode, detail, detail_tab, settings_mode = _nav_state(tui)
+    if detail_mode:
+        if detail and getattr(detail, "kind", "task") == "plan" and detail_tab == "overview":
+            plan_tasks = getattr(tui, "plan_detail_tasks", None)
+            if plan_tasks is None:
+                plan_tasks = tui._plan_detail_tasks() if hasattr(tui, "_plan_detail_tasks") else []
             items = len(plan_tasks)
             if items <= 0:
                 tui.detail_selected_index = 0
                 tui.detail_selected_task_id = None
                 return
-            new_index = max(0, min(tui.detail_selected_index + delta, items - 1))
+            new_index = _clamp(tui.detail_selected_index + delta, items - 1)
             tui.detail_selected_index = new_index
             tui.detail_selected_task_id = getattr(plan_tasks[new_index], "id", None)
             tui.force_render()
@@ -33,23 +55,25 @@ def move_vertical_selection(tui, delta: int) -> None:
         if items <= 0:
             tui.detail_selected_index = 0
             return
-        new_index = max(0, min(tui.detail_selected_index + delta, items - 1))
+        new_index = _clamp(tui.detail_selected_index + delta, items - 1)
         tui.detail_selected_index = new_index
         tui._selected_subtask_entry()
-    elif getattr(tui, "settings_mode", False):
+    elif settings_mode:
         options = tui._settings_options()
         total = len(options)
         if total <= 0:
             tui.settings_selected_index = 0
             return
-        tui.settings_selected_index = max(0, min(tui.settings_selected_index + delta, total - 1))
+        tui.settings_selected_index = _clamp(tui.settings_selected_index + delta, total - 1)
         tui._ensure_settings_selection_visible(total)
     else:
         total = len(tui.filtered_tasks)
         if total <= 0:
             tui.selected_index = 0
             return
-        tui.selected_index = max(0, min(tui.selected_index + delta, total - 1))
+        # Hottest path (every arrow key / wheel tick in the list): clamp inline.
+        n = tui.selected_index + delta
+        tui.selected_index = 0 if n < 0 else (total - 1 if n >= total else n)
         tui._ensure_selection_visible()
     tui.force_render()
 
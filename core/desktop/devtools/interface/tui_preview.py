@@ -1,24 +1,65 @@
 """Side preview renderer extracted from TaskTrackerTUI."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from prompt_toolkit.formatted_text import FormattedText
 
 from core import Status
 from infrastructure.task_file_parser import TaskFileParser
 
+_BORDER = "class:border"
+_TXT = "class:text"
+_DIM = "class:text.dim"
+_HDR = "class:header"
+_RULE = "+" + "-" * 42 + "+"
+_RULE_NL = _RULE + "\n"
+_NARROW_RULE = "+" + "-" * 30 + "+"
+_NARROW_RULE_NL = _NARROW_RULE + "\n"
+_EMPTY_ROW = ("".ljust(40),)
+# Progress bar per filled-cell count (0..30).
+_BARS = tuple("#" * k + "-" * (30 - k) for k in range(31))
+
 
 def _empty_box(message: str) -> FormattedText:
     return FormattedText(
         [
-            ("class:border", "+------------------------------+\n"),
-            ("class:text.dim", "| " + message.ljust(26) + " |\n"),
-            ("class:border", "+------------------------------+"),
+            (_BORDER, _NARROW_RULE_NL),
+            (_DIM, "| " + message.ljust(26) + " |\n"),
+            (_BORDER, _NARROW_RULE),
         ]
     )
 
 
+@lru_cache(maxsize=512)
+def _wrap_rows(text: str, max_rows: Optional[int] = None) -> Tuple[str, ...]:
+    """Hard-wrap text into 38-char slices padded to the 40-col preview body (memoized per text)."""
+    rows = tuple(text[i : i + 38].ljust(40) for i in range(0, len(text), 38))
+    return rows if max_rows is None else rows[:max_rows]
+
+
+@lru_cache(maxsize=256)
+def _description_rows(text: str) -> Tuple[str, ...]:
+    """First 5 description lines, each wrapped to at most 3 rows."""
+    return tuple(row for line in text.split("\n")[:5] for row in _wrap_rows(line, 3))
+
+
+_LABEL_KEYS = ("COMPLETED_SUFFIX", "SIDE_EMPTY_TASKS", "SIDE_NO_DATA")
+
+
+def _preview_labels(tui) -> Dict[str, str]:
+    """Constant-key translations used per frame, cached on the TUI per language."""
+    lang = getattr(tui, "language", None)
+    cached = getattr(tui, "_preview_labels_cache", None)
+    if cached is not None and cached[0] == lang:
+        return cached[1]
+    labels = {key: tui._t(key) for key in _LABEL_KEYS}
+    labels["TABLE_HEADER_PROJECT"] = f"{tui._t('TABLE_HEADER_PROJECT')} "
+    setattr(tui, "_preview_labels_cache", (lang, labels))
+    return labels
+
+
 def _status_chunk(detail) -> List:
     if detail.status == "DONE":
         return [("class:icon.check", "DONE ")]
@@ -30,7 +71,7 @@ def _status_chunk(detail) -> List:
 def _project_status_chunk(status) -> List:
     code = ""
     if isinstance(status, Status):
-        code = status.value[0]
+        code = status.code
     elif isinstance(status, bool):
         code = "DONE" if status else "TODO"
     elif isinstance(status, str):
@@ -43,57 +84,89 @@ def _project_status_chunk(status) -> List:
     return [("class:icon.fail", "TODO ")]
 
 
+def _body_rows(rows: Tuple[str, ...], style: str = _TXT) -> List:
+    """Frame pre-padded rows as `| row |` fragments."""
+    out: List = []
+    for row in rows:
+        out += ((_BORDER, "| "), (style, row), (_BORDER, " |\n"))
+    return out
+
+
+@lru_cache(maxsize=128)
+def _progress_row(prog: int) -> Tuple:
+    bar = _BARS[max(0, min(30, int(prog * 30 / 100)))]
+    return ((_BORDER, "| "), (_DIM, f"{prog:3d}% ["), (_DIM, bar), (_DIM, "]"), (_BORDER, "    |\n"))
+
+
 def _build_project_preview_text(tui, task) -> FormattedText:
     done = int(getattr(task, "children_completed", 0) or 0)
     total = int(getattr(task, "children_count", 0) or 0)
     prog = int(getattr(task, "progress", 0) or 0)
     prog = max(0, min(100, prog))
 
-    result: List = []
-    result.append(("class:border", "+------------------------------------------+\n"))
-    result.append(("class:border", "| "))
-    result.append(("class:header", f"{tui._t('TABLE_HEADER_PROJECT')} "))
-    result.append(("class:text.dim", "| "))
-    result.extend(_project_status_chunk(getattr(task, "status", None)))
-    summary = f"{done}/{total} {tui._t('COMPLETED_SUFFIX')}" if total else tui._t("SIDE_EMPTY_TASKS")
-    result.append(("class:text.dim", summary[:20].ljust(20)))
-    result.append(("class:border", " |\n"))
-    result.append(("class:border", "+------------------------------------------+\n"))
-
+    labels = _preview_labels(tui)
+    summary = f"{done}/{total} {labels['COMPLETED_SUFFIX']}" if total else labels["SIDE_EMPTY_TASKS"]
     title = str(getattr(task, "name", "") or "")
-    title_lines = [title[i : i + 38] for i in range(0, len(title), 38)] or [""]
-    for tline in title_lines[:3]:
-        result.append(("class:border", "| "))
-        result.append(("class:text", tline.ljust(40)))
-        result.append(("class:border", " |\n"))
-
-    bar_width = 30
-    filled = int(prog * bar_width / 100)
-    bar = "#" * filled + "-" * (bar_width - filled)
-    result.append(("class:border", "| "))
-    result.append(("class:text.dim", f"{prog:3d}% ["))
-    result.append(("class:text.dim", bar[:30]))
-    result.append(("class:text.dim", "]"))
-    result.append(("class:border", "    |\n"))
+    result: List = [
+        (_BORDER, _RULE_NL),
+        (_BORDER, "| "),
+        (_HDR, labels["TABLE_HEADER_PROJECT"]),
+        (_DIM, "| "),
+        *_project_status_chunk(getattr(task, "status", None)),
+        (_DIM, summary[:20].ljust(20)),
+        (_BORDER, " |\n"),
+        (_BORDER, _RULE_NL),
+        *_body_rows(_wrap_rows(title, 3) or _EMPTY_ROW),
+        *_progress_row(prog),
+    ]
 
     path_raw = str(getattr(task, "task_file", "") or "").strip()
     if path_raw:
         tail = Path(path_raw).name
-        result.append(("class:border", "+------------------------------------------+\n"))
-        result.append(("class:border", "| "))
-        result.append(("class:text.dim", tail[:40].ljust(40)))
-        result.append(("class:border", " |\n"))
+        result += ((_BORDER, _RULE_NL), (_BORDER, "| "), (_DIM, tail[:40].ljust(40)), (_BORDER, " |\n"))
 
-    result.append(("class:border", "+------------------------------------------+"))
+    result.append((_BORDER, _RULE))
     return FormattedText(result)
 
 
+_PROJECT_FIELDS = ("name", "progress", "children_count", "children_completed", "status", "task_file")
+_DETAIL_FIELDS = (
+    "updated", "_source_mtime", "id", "title", "status", "priority",
+    "description", "contract", "domain", "phase", "component",
+)
+
+
+def _preview_stamp(tui, task, detail) -> Optional[Tuple]:
+    """Everything the preview shows for this row, or None when it must be re-read from disk."""
+    if getattr(task, "category", "") == "project":
+        fields: Tuple = tuple(getattr(task, name, None) for name in _PROJECT_FIELDS)
+    elif detail:
+        fields = tuple(getattr(detail, name, None) for name in _DETAIL_FIELDS) + (getattr(task, "progress", 0),)
+    else:
+        return None
+    return (getattr(tui, "language", None), getattr(tui, "project_section", "tasks"), fields)
+
+
 def build_side_preview_text(tui) -> FormattedText:
     if not tui.filtered_tasks:
-        return _empty_box(tui._t("SIDE_EMPTY_TASKS"))
+        return _empty_box(_preview_labels(tui)["SIDE_EMPTY_TASKS"])
 
     idx = min(tui.selected_index, len(tui.filtered_tasks) - 1)
     task = tui.filtered_tasks[idx]
+    # Repaints that don't change the selected row (scrolling, spinner, footer hover)
+    # reuse the last FormattedText. Reloads replace Task objects, which misses here.
+    detail = getattr(task, "detail", None)
+    stamp = _preview_stamp(tui, task, detail)
+    cached = getattr(tui, "_preview_cache", None)
+    if stamp is not None and cached is not None and cached[0] is task and cached[1] is detail and cached[2] == stamp:
+        return cached[3]
+    text = _build_task_preview_text(tui, task)
+    if stamp is not None:
+        setattr(tui, "_preview_cache", (task, detail, stamp, text))
+    return text
+
+
+def _build_task_preview_text(tui, task) -> FormattedText:
     if getattr(task, "category", "") == "project":
         return _build_project_preview_text(tui, task)
     detail = task.detail
@@ -106,39 +179,25 @@ def build_side_preview_text(tui) -> FormattedText:
         except Exception:
             detail = None
     if not detail:
-        return _empty_box(tui._t("SIDE_NO_DATA"))
-
-    result = []
-    result.append(("class:border", "+------------------------------------------+\n"))
-    result.append(("class:border", "| "))
-    result.append(("class:header", f"{detail.id} "))
-    result.append(("class:text.dim", "| "))
-    result.extend(_status_chunk(detail))
-    result.append(("class:text.dim", f"| {detail.priority}"))
-    result.append(("class:border", "                   |\n"))
-    result.append(("class:border", "+------------------------------------------+\n"))
-
-    title_lines = [detail.title[i : i + 38] for i in range(0, len(detail.title), 38)]
-    for tline in title_lines:
-        result.append(("class:border", "| "))
-        result.append(("class:text", tline.ljust(40)))
-        result.append(("class:border", " |\n"))
+        return _empty_box(_preview_labels(tui)["SIDE_NO_DATA"])
+
+    result: List = [
+        (_BORDER, _RULE_NL),
+        (_BORDER, "| "),
+        (_HDR, f"{detail.id} "),
+        (_DIM, "| "),
+        *_status_chunk(detail),
+        (_DIM, f"| {detail.priority}"),
+        (_BORDER, "                   |\n"),
+        (_BORDER, _RULE_NL),
+        *_body_rows(_wrap_rows(detail.title)),
+    ]
 
     ctx = detail.domain or detail.phase or detail.component
     if ctx:
-        result.append(("class:border", "| "))
-        result.append(("class:text.dim", tui._t("STATUS_CONTEXT", ctx=ctx[:32]).ljust(40)))
-        result.append(("class:border", " |\n"))
-
-    prog = detail.calculate_progress()
-    bar_width = 30
-    filled = int(prog * bar_width / 100)
-    bar = "#" * filled + "-" * (bar_width - filled)
-    result.append(("class:border", "| "))
-    result.append(("class:text.dim", f"{prog:3d}% ["))
-    result.append(("class:text.dim", bar[:30]))
-    result.append(("class:text.dim", "]"))
-    result.append(("class:border", "    |\n"))
+        result += ((_BORDER, "| "), (_DIM, tui._t("STATUS_CONTEXT", ctx=ctx[:32]).ljust(40)), (_BORDER, " |\n"))
+
+    result += _progress_row(detail.calculate_progress())
 
     preview_text = getattr(detail, "description", "")
     contract_text = getattr(detail, "contract", "") or ""
@@ -147,16 +206,10 @@ def build_side_preview_text(tui) -> FormattedText:
     elif not preview_text:
         preview_text = contract_text
     if preview_text:
-        result.append(("class:border", "+------------------------------------------+\n"))
-        desc_lines = preview_text.split("\n")
-        for dline in desc_lines[:5]:
-            chunks = [dline[i : i + 38] for i in range(0, len(dline), 38)]
-            for chunk in chunks[:3]:
-                result.append(("class:border", "| "))
-                result.append(("class:text", chunk.ljust(40)))
-                result.append(("class:border", " |\n"))
-
-    result.append(("class:border", "+------------------------------------------+"))
+        result.append((_BORDER, _RULE_NL))
+        result += _body_rows(_description_rows(preview_text))
+
+    result.append((_BORDER, _RULE))
     return FormattedText(result)
 
 
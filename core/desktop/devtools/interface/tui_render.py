@@ -7,6 +7,7 @@ from prompt_toolkit.formatted_text import FormattedText
 
 from core import Status
 from util.responsive import ResponsiveLayoutManager
+from core.desktop.devtools.interface.tui_detail_tabs import make_tab_hitboxes
 from core.desktop.devtools.interface.tui_detail_tree import canonical_path as _detail_canonical_path, node_kind as _detail_node_kind
 
 
@@ -414,7 +415,7 @@ def render_detail_text_impl(tui) -> FormattedText:
     row.append(("class:border", " |\n"))
     result.extend(row)
     result.append(('class:border', '+' + '-'*content_width + '+\n'))
-    tui._detail_tab_hitboxes = {"y": tabbar_y, "ranges": tab_hitboxes}
+    tui._detail_tab_hitboxes = make_tab_hitboxes(tabbar_y, tab_hitboxes)
 
     # Flagship density: keep the subtasks list as the primary content.
     # ---------------- Overview list with scrolling window -----------------
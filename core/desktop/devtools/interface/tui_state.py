@@ -1,10 +1,18 @@
 """Small helpers to keep TaskTrackerTUI methods slim."""
 
-from typing import Optional
+from contextlib import nullcontext
+from itertools import islice
+from typing import ContextManager, Optional, Set
 
 from core.desktop.devtools.interface.tui_detail_tree import canonical_path, first_child_key, plan_key
 
 
+def batch_render(tui) -> ContextManager[None]:
+    """`tui.batch_render()` when the TUI supports it, else a no-op context."""
+    cm = getattr(tui, "batch_render", None)
+    return cm() if cm is not None else nullcontext()
+
+
 def toggle_collapse_selected(tui) -> None:
     if tui.detail_mode or not tui.filtered_tasks:
         return
@@ -20,93 +28,103 @@ def toggle_subtask_collapse(tui, expand: bool) -> None:
     entry = tui._selected_subtask_entry()
     if not entry:
         return
+    # Bound once: held Left/Right keys hit this on every repeat.
+    select = tui._select_subtask_by_path
+    rebuild = tui._rebuild_detail_flat
     key = entry.key
     collapsed = bool(getattr(entry, "collapsed", False))
     has_children = bool(getattr(entry, "has_children", False))
+    parent = getattr(entry, "parent_key", None)
 
     if not has_children:
-        if not expand and getattr(entry, "parent_key", None):
-            tui._select_subtask_by_path(entry.parent_key)
+        if not expand and parent:
+            select(parent)
             tui.force_render()
         return
 
     if expand:
         if collapsed:
             tui.detail_collapsed.discard(key)
-            tui._rebuild_detail_flat(key)
+            rebuild(key)
             return
         child = first_child_key(entry)
         if child:
-            tui._select_subtask_by_path(child)
-            tui._rebuild_detail_flat(child)
+            select(child)
+            rebuild(child)
         return
 
     # collapse
     if not collapsed:
         tui.detail_collapsed.add(key)
-        tui._rebuild_detail_flat(key)
+        rebuild(key)
         return
-    parent = getattr(entry, "parent_key", None)
     if parent:
-        tui._select_subtask_by_path(parent)
+        select(parent)
         tui.force_render()
 
 
 def _iter_subtree_nodes(entry):
-    """Iterate nodes in the subtree rooted at entry (includes root), deterministic DFS."""
+    """Iterate nodes in the subtree rooted at entry (includes root), deterministic DFS.
+
+    Nodes are core Step/PlanNode/TaskNode dataclasses, so fields are read directly.
+    """
     stack = [(entry.kind, entry.key, entry.node)]
+    push = stack.append
+    pop = stack.pop
     while stack:
-        kind, key, node = stack.pop()
+        kind, key, node = pop()
         yield kind, key, node
         if kind == "step":
-            plan = getattr(node, "plan", None)
+            plan = node.plan
             if plan is not None:
-                stack.append(("plan", plan_key(key), plan))
-            continue
-        if kind == "plan":
-            plan = node
-            tasks = list(getattr(plan, "tasks", []) or [])
+                push(("plan", plan_key(key), plan))
+        elif kind == "plan":
+            tasks = node.tasks or ()
             base = canonical_path(key, "plan")
-            for t_idx in reversed(range(len(tasks))):
-                stack.append(("task", f"{base}.t:{t_idx}", tasks[t_idx]))
-            continue
-        # task
-        task = node
-        steps = list(getattr(task, "steps", []) or [])
-        for s_idx in reversed(range(len(steps))):
-            stack.append(("step", f"{key}.s:{s_idx}", steps[s_idx]))
+            for t_idx in range(len(tasks) - 1, -1, -1):
+                push(("task", f"{base}.t:{t_idx}", tasks[t_idx]))
+        else:
+            steps = node.steps or ()
+            for s_idx in range(len(steps) - 1, -1, -1):
+                push(("step", f"{key}.s:{s_idx}", steps[s_idx]))
 
 
 def _has_children(kind: str, node) -> bool:
     if kind == "step":
-        return getattr(node, "plan", None) is not None
+        return node.plan is not None
     if kind == "plan":
-        return bool(list(getattr(node, "tasks", []) or []))
+        return bool(node.tasks)
     if kind == "task":
-        return bool(list(getattr(node, "steps", []) or []))
+        return bool(node.steps)
     return False
 
 
+def _parent_keys(nodes) -> Set[str]:
+    """Keys of the nodes that have children (the only ones worth collapsing)."""
+    return {key for kind, key, node in nodes if _has_children(kind, node)}
+
+
+def _remember_collapsed(tui, collapsed: Set[str]) -> None:
+    """Snapshot the collapsed set for the current task (restored when it is reopened)."""
+    detail = getattr(tui, "current_task_detail", None)
+    by_task = getattr(tui, "collapsed_by_task", None)
+    if detail and by_task is not None:
+        by_task[detail.id] = collapsed.copy()
+
+
 def collapse_subtask_descendants(tui) -> None:
     """Collapse all descendants of the selected node (keeps the node itself expanded)."""
     entry = tui._selected_subtask_entry()
     if not entry:
         return
     root_key = entry.key
-    first = True
-    changed = False
-    for kind, key, node in _iter_subtree_nodes(entry):
-        if first:
-            first = False
-            continue
-        if _has_children(kind, node) and key not in tui.detail_collapsed:
-            tui.detail_collapsed.add(key)
-            changed = True
-
-    if not changed:
+    # Skip the root itself: it stays expanded.
+    collapsed = tui.detail_collapsed
+    new = _parent_keys(islice(_iter_subtree_nodes(entry), 1, None)) - collapsed
+    if not new:
         return
-    if getattr(tui, "current_task_detail", None) and getattr(tui, "collapsed_by_task", None) is not None:
-        tui.collapsed_by_task[tui.current_task_detail.id] = set(tui.detail_collapsed)
+    collapsed |= new
+    _remember_collapsed(tui, collapsed)
     tui._rebuild_detail_flat(root_key)
     tui.force_render()
 
@@ -117,16 +135,12 @@ def expand_subtask_descendants(tui) -> None:
     if not entry:
         return
     root_key = entry.key
-    changed = False
-    for kind, key, node in _iter_subtree_nodes(entry):
-        if _has_children(kind, node) and key in tui.detail_collapsed:
-            tui.detail_collapsed.discard(key)
-            changed = True
-
-    if not changed:
+    collapsed = tui.detail_collapsed
+    to_remove = _parent_keys(_iter_subtree_nodes(entry)) & collapsed
+    if not to_remove:
         return
-    if getattr(tui, "current_task_detail", None) and getattr(tui, "collapsed_by_task", None) is not None:
-        tui.collapsed_by_task[tui.current_task_detail.id] = set(tui.detail_collapsed)
+    collapsed -= to_remove
+    _remember_collapsed(tui, collapsed)
     tui._rebuild_detail_flat(root_key)
     tui.force_render()
 
@@ -167,6 +181,7 @@ def maybe_reload(tui, now: Optional[float] = None) -> None:
 
 
 __all__ = [
+    "batch_render",
     "toggle_collapse_selected",
     "toggle_subtask_collapse",
     "collapse_subtask_descendants",
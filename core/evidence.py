@@ -1,13 +1,29 @@
 import hashlib
 import json
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last stamp; one tuple so threads never see a torn pair.
+_ISO_SECOND = (-1, "")
+
+
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    """UTC now, formatted exactly like datetime.now(timezone.utc).isoformat().
+
+    The date/time prefix is rebuilt once per second; within a second only the
+    microsecond tail is formatted.
+    """
+    global _ISO_SECOND
+    sec, us = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_sec, prefix = _ISO_SECOND
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _ISO_SECOND = (sec, prefix)
+    return f"{prefix}.{us:06d}+00:00" if us else f"{prefix}+00:00"
 
 
 _SENSITIVE_KEYWORDS = {
@@ -83,6 +99,14 @@ def redact(value: Any, *, depth: int = 6) -> Any:
     return _redact(value, depth=depth)
 
 
+def _text_field(data: Dict[str, Any], key: str) -> str:
+    """`str(data.get(key) or "").strip()` without the coercions for absent/str values."""
+    value = data.get(key)
+    if not value:
+        return ""
+    return value.strip() if type(value) is str else str(value).strip()
+
+
 def _digest_for_check(kind: str, spec: str, outcome: str, preview: str, details: Dict[str, Any]) -> str:
     payload = {"kind": kind, "spec": spec, "outcome": outcome, "preview": preview, "details": details}
     return _sha256_hex(_canonical_json(payload))
@@ -93,7 +117,7 @@ def _digest_for_attachment(kind: str, path: str, uri: str, external_uri: str, si
     return _sha256_hex(_canonical_json(payload))
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationCheck:
     kind: str
     spec: str
@@ -104,42 +128,50 @@ class VerificationCheck:
     details: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        payload = {
-            "kind": self.kind,
-            "spec": self.spec,
-            "outcome": self.outcome,
-            "observed_at": self.observed_at or "",
-            "digest": self.digest or "",
-            "preview": self.preview or "",
-            "details": dict(self.details or {}),
-        }
-        return {k: v for k, v in payload.items() if v not in ("", {}, None)}
+        # Emit only non-empty fields directly (hot in large step-tree exports):
+        # no intermediate payload dict and no copy of empty details.
+        out: Dict[str, Any] = {}
+        if self.kind:
+            out["kind"] = self.kind
+        if self.spec:
+            out["spec"] = self.spec
+        if self.outcome:
+            out["outcome"] = self.outcome
+        if self.observed_at:
+            out["observed_at"] = self.observed_at
+        if self.digest:
+            out["digest"] = self.digest
+        if self.preview:
+            out["preview"] = self.preview
+        if self.details:
+            out["details"] = dict(self.details)
+        return out
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "VerificationCheck":
         if not isinstance(data, dict):
             raise ValueError("verification check must be object")
-        raw_details = dict(data.get("details", {}) or {})
-        details = _redact(raw_details)
-        preview = _redact_text(str(data.get("preview", "") or "").strip())
-        kind = str(data.get("kind", "") or "").strip()
-        spec = str(data.get("spec", "") or "").strip()
-        outcome = str(data.get("outcome", "") or "").strip()
-        digest = str(data.get("digest", "") or "").strip()
+        raw_details = data.get("details")
+        details = _redact(dict(raw_details)) if raw_details else {}
+        preview = _redact_text(_text_field(data, "preview"))
+        kind = _text_field(data, "kind")
+        spec = _text_field(data, "spec")
+        outcome = _text_field(data, "outcome")
+        digest = _text_field(data, "digest")
         if not digest and (kind or spec or outcome or preview or details):
-            digest = _digest_for_check(kind, spec, outcome, preview, details if isinstance(details, dict) else {})
+            digest = _digest_for_check(kind, spec, outcome, preview, details)
         return cls(
             kind=kind,
             spec=spec,
             outcome=outcome,
-            observed_at=str(data.get("observed_at", "") or "").strip() or _now_iso(),
+            observed_at=_text_field(data, "observed_at") or _now_iso(),
             digest=digest,
             preview=preview,
-            details=details if isinstance(details, dict) else {},
+            details=details,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Attachment:
     kind: str
     path: str = ""
@@ -151,35 +183,41 @@ class Attachment:
     meta: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        payload = {
-            "kind": self.kind,
-            "path": self.path,
-            "uri": self.uri,
-            "external_uri": self.external_uri,
-            "size": int(self.size or 0),
-            "digest": self.digest or "",
-            "observed_at": self.observed_at or "",
-            "meta": dict(self.meta or {}),
-        }
-        return {k: v for k, v in payload.items() if v not in ("", 0, {}, None)}
+        out: Dict[str, Any] = {}
+        if self.kind:
+            out["kind"] = self.kind
+        if self.path:
+            out["path"] = self.path
+        if self.uri:
+            out["uri"] = self.uri
+        if self.external_uri:
+            out["external_uri"] = self.external_uri
+        size = int(self.size or 0)
+        if size:
+            out["size"] = size
+        if self.digest:
+            out["digest"] = self.digest
+        if self.observed_at:
+            out["observed_at"] = self.observed_at
+        if self.meta:
+            out["meta"] = dict(self.meta)
+        return out
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Attachment":
         if not isinstance(data, dict):
             raise ValueError("attachment must be object")
-        raw_meta = dict(data.get("meta", {}) or {})
-        meta = _redact(raw_meta)
-        kind = str(data.get("kind", "") or "").strip()
-        raw_path = str(data.get("path", "") or "").strip()
-        if not raw_path:
-            raw_path = str(data.get("file_path", "") or "").strip()
+        raw_meta = data.get("meta")
+        meta = _redact(dict(raw_meta)) if raw_meta else {}
+        kind = _text_field(data, "kind")
+        raw_path = _text_field(data, "path") or _text_field(data, "file_path")
         path = _redact_text(raw_path)
-        uri = _redact_text(str(data.get("uri", "") or "").strip())
-        external_uri = _redact_text(str(data.get("external_uri", "") or "").strip())
+        uri = _redact_text(_text_field(data, "uri"))
+        external_uri = _redact_text(_text_field(data, "external_uri"))
         size = int(data.get("size", 0) or 0)
-        digest = str(data.get("digest", "") or "").strip()
+        digest = _text_field(data, "digest")
         if not digest and (kind or path or uri or external_uri or size or meta):
-            digest = _digest_for_attachment(kind, path, uri, external_uri, size, meta if isinstance(meta, dict) else {})
+            digest = _digest_for_attachment(kind, path, uri, external_uri, size, meta)
         return cls(
             kind=kind,
             path=path,
@@ -187,6 +225,6 @@ class Attachment:
             external_uri=external_uri,
             size=size,
             digest=digest,
-            observed_at=str(data.get("observed_at", "") or "").strip() or _now_iso(),
-            meta=meta if isinstance(meta, dict) else {},
+            observed_at=_text_field(data, "observed_at") or _now_iso(),
+            meta=meta,
         )
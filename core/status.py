@@ -8,18 +8,22 @@ class Status(Enum):
     DONE = ("DONE", "green", "✓")
     UNKNOWN = ("?", "blue", "?")
 
+    def __init__(self, code: str, color: str, symbol: str) -> None:
+        # Plain instance attributes: `.code` skips the Enum `.value` descriptor on hot paths.
+        self.code = code
+        self.color = color
+        self.symbol = symbol
+
     @classmethod
     def from_string(cls, value: str) -> "Status":
-        val = normalize_status(value, allow_unknown=True)
-        for status in cls:
-            if status.value[0] == val:
-                return status
-        return cls.UNKNOWN
+        return _STATUS_BY_CODE.get(normalize_status(value, allow_unknown=True), cls.UNKNOWN)
 
 
-StatusCode = Literal["TODO", "ACTIVE", "DONE"]
+# Code -> member; "?" maps to UNKNOWN like the former linear scan over members.
+_STATUS_BY_CODE: Final[dict[str, Status]] = {status.code: status for status in Status}
 
-_CANONICAL_CODES: Final[frozenset[str]] = frozenset({"TODO", "ACTIVE", "DONE"})
+
+StatusCode = Literal["TODO", "ACTIVE", "DONE"]
 
 
 def normalize_status(value: str, *, allow_unknown: bool = False) -> str:
@@ -33,8 +37,14 @@ def normalize_status(value: str, *, allow_unknown: bool = False) -> str:
     token = (value or "").strip().upper().replace(" ", "_")
     if not token:
         return token
-    if token in _CANONICAL_CODES:
-        return token
+    # Three literal compares beat a hash lookup here and return the interned constant,
+    # so normalized results compare by identity downstream.
+    if token == "TODO":
+        return "TODO"
+    if token == "ACTIVE":
+        return "ACTIVE"
+    if token == "DONE":
+        return "DONE"
     if allow_unknown:
         return token
     raise ValueError(f"Invalid status: {value!r}")
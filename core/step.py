@@ -1,55 +1,63 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import List, Optional
-import uuid
+from typing import Dict, Iterator, List, Optional, Tuple
+import os
+import re
 from .status import Status
 from .evidence import Attachment, VerificationCheck
 
 
+# Phrases that mark a step title as several actions; one case-insensitive scan per title.
+_ATOMIC_VIOLATORS_RE = re.compile(
+    "|".join(map(re.escape, ("и затем", "потом", "после этого", "далее", ", и ", " and then", " then "))),
+    re.IGNORECASE,
+)
+
+
 def _new_node_id(prefix: str) -> str:
-    return f"{prefix}-{uuid.uuid4().hex[:8].upper()}"
+    # 32 random bits, same as the first 8 hex chars of a uuid4 (no UUID object needed).
+    return f"{prefix}-{os.urandom(4).hex().upper()}"
 
 
 def ensure_tree_ids(steps: List["Step"]) -> bool:
     """Ensure stable ids for steps/task-nodes across a tree.
 
-    Returns True if any ids were assigned or fixed.
+    Returns True if any ids were assigned or fixed. Nodes are visited in pre-order
+    (iterative, no recursion), so the first occurrence of a duplicate id keeps it.
     """
     changed = False
     seen_steps: set[str] = set()
     seen_tasks: set[str] = set()
-
-    def ensure_step(st: Step) -> None:
-        nonlocal changed
-        step_id = str(getattr(st, "id", "") or "").strip()
-        if not step_id or step_id in seen_steps:
-            st.id = _new_node_id("STEP")
-            changed = True
-        seen_steps.add(st.id)
-
-        plan = getattr(st, "plan", None)
-        tasks = list(getattr(plan, "tasks", []) or []) if plan else []
-        for task in tasks:
-            ensure_task(task)
-
-    def ensure_task(task: "TaskNode") -> None:
-        nonlocal changed
-        node_id = str(getattr(task, "id", "") or "").strip()
-        if not node_id or node_id in seen_tasks:
-            task.id = _new_node_id("NODE")
-            changed = True
-        seen_tasks.add(task.id)
-
-        for child in list(getattr(task, "steps", []) or []):
-            ensure_step(child)
-
-    for root in list(steps or []):
-        ensure_step(root)
+    # (is_step, node) work stack; children are pushed reversed to keep pre-order.
+    stack = [(True, st) for st in reversed(steps)] if steps else []
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        is_step, node = pop()
+        node_id = node.id.strip() if node.id else ""
+        if is_step:
+            if not node_id or node_id in seen_steps:
+                node.id = _new_node_id("STEP")
+                changed = True
+            seen_steps.add(node.id)
+            plan = getattr(node, "plan", None)
+            tasks = plan.tasks if plan else None
+            if tasks:
+                push([(False, task) for task in reversed(tasks)])
+        else:
+            if not node_id or node_id in seen_tasks:
+                node.id = _new_node_id("NODE")
+                changed = True
+            seen_tasks.add(node.id)
+            if node.steps:
+                push([(True, child) for child in reversed(node.steps)])
     return changed
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     completed: bool
     title: str
@@ -93,18 +101,18 @@ class Step:
 
     def __post_init__(self) -> None:
         self.ensure_plan()
-        if not getattr(self, "id", ""):
+        if not self.id:
             self.id = _new_node_id("STEP")
 
     def ensure_plan(self) -> "PlanNode":
-        plan = getattr(self, "plan", None)
+        plan = self.plan
         if plan is None:
             plan = PlanNode()
             self.plan = plan
-        if getattr(plan, "tasks", None) is None:
+        if plan.tasks is None:
             plan.tasks = []
         # Tests are optional; empty tests are auto-confirmed (mirrors file parser behavior).
-        if not getattr(plan, "tests", []) and not getattr(plan, "tests_confirmed", False):
+        if not plan.tests and not plan.tests_confirmed:
             plan.tests_auto_confirmed = True
         return plan
 
@@ -228,77 +236,89 @@ class Step:
 
     def is_valid_flagship(self) -> tuple[bool, list[str]]:
         """Quality checks matching legacy validation."""
+        title = self.title
         issues: list[str] = []
         if not self.success_criteria:
-            issues.append(f"'{self.title}': нет критериев выполнения")
+            issues.append(f"'{title}': нет критериев выполнения")
         if not self.tests:
-            issues.append(f"'{self.title}': нет тестов для проверки")
+            issues.append(f"'{title}': нет тестов для проверки")
         if not self.blockers:
-            issues.append(f"'{self.title}': нет блокеров/зависимостей")
-        if len(self.title) < 20:
-            issues.append(f"'{self.title}': слишком короткое описание (минимум 20 символов)")
-        atomic_violators = ["и затем", "потом", "после этого", "далее", ", и ", " and then", " then "]
-        if any(v in self.title.lower() for v in atomic_violators):
-            issues.append(f"'{self.title}': не атомарна (разбей на несколько шагов)")
+            issues.append(f"'{title}': нет блокеров/зависимостей")
+        if len(title) < 20:
+            issues.append(f"'{title}': слишком короткое описание (минимум 20 символов)")
+        if _ATOMIC_VIOLATORS_RE.search(title) is not None:
+            issues.append(f"'{title}': не атомарна (разбей на несколько шагов)")
         return len(issues) == 0, issues
 
     def to_markdown(self) -> str:
         lines = [f"- [{'x' if self.completed else ' '}] {self.title}"]
-        if self.success_criteria:
-            lines.append("  - Критерии: " + "; ".join(self.success_criteria))
-        if self.tests:
-            lines.append("  - Тесты: " + "; ".join(self.tests))
-        if self.blockers:
-            lines.append("  - Блокеры: " + "; ".join(self.blockers))
-        # Checkpoint status with auto-confirmed support
-        def _status(confirmed: bool, auto: bool) -> str:
-            if confirmed:
-                return "OK"
-            if auto:
-                return "AUTO"
-            return "TODO"
+        _append_md_fields(self, _MD_HEAD_FIELDS, lines)
+        # Checkpoint status with auto-confirmed support; extended checkpoints are explicit-only.
         status_tokens = [
-            f"Критерии={_status(self.criteria_confirmed, self.criteria_auto_confirmed)}",
-            f"Тесты={_status(self.tests_confirmed, self.tests_auto_confirmed)}",
+            f"Критерии={_md_checkpoint(self.criteria_confirmed, self.criteria_auto_confirmed)}",
+            f"Тесты={_md_checkpoint(self.tests_confirmed, self.tests_auto_confirmed)}",
+        ]
+        status_tokens += [
+            f"{label}={_md_checkpoint(confirmed, False)}"
+            for label, confirmed, notes in (
+                ("Безопасность", self.security_confirmed, self.security_notes),
+                ("Производительность", self.perf_confirmed, self.perf_notes),
+                ("Документация", self.docs_confirmed, self.docs_notes),
+            )
+            if confirmed or notes
         ]
-        # Extended checkpoints are explicit-only.
-        if self.security_confirmed or self.security_notes:
-            status_tokens.append(f"Безопасность={_status(self.security_confirmed, False)}")
-        if self.perf_confirmed or self.perf_notes:
-            status_tokens.append(f"Производительность={_status(self.perf_confirmed, False)}")
-        if self.docs_confirmed or self.docs_notes:
-            status_tokens.append(f"Документация={_status(self.docs_confirmed, False)}")
         lines.append("  - Чекпоинты: " + "; ".join(status_tokens))
-        if self.criteria_notes:
-            lines.append("  - Отметки критериев: " + "; ".join(self.criteria_notes))
-        if self.tests_notes:
-            lines.append("  - Отметки тестов: " + "; ".join(self.tests_notes))
-        if self.security_notes:
-            lines.append("  - Отметки безопасности: " + "; ".join(self.security_notes))
-        if self.perf_notes:
-            lines.append("  - Отметки производительности: " + "; ".join(self.perf_notes))
-        if self.docs_notes:
-            lines.append("  - Отметки документации: " + "; ".join(self.docs_notes))
-        if self.created_at:
-            lines.append(f"  - Создано: {self.created_at}")
-        if self.completed_at:
-            lines.append(f"  - Завершено: {self.completed_at}")
-        if self.progress_notes:
-            lines.append("  - Прогресс: " + "; ".join(self.progress_notes))
-        if self.started_at:
-            lines.append(f"  - Начато: {self.started_at}")
+        _append_md_fields(self, _MD_TAIL_FIELDS, lines)
         if self.blocked:
             lines.append(f"  - Заблокировано: {self.block_reason or 'да'}")
         return "\n".join(lines)
 
 
+# to_markdown sections in output order: (field, line prefix, is_list). Lists are "; "-joined.
+_MD_HEAD_FIELDS = (
+    ("success_criteria", "  - Критерии: ", True),
+    ("tests", "  - Тесты: ", True),
+    ("blockers", "  - Блокеры: ", True),
+)
+_MD_TAIL_FIELDS = (
+    ("criteria_notes", "  - Отметки критериев: ", True),
+    ("tests_notes", "  - Отметки тестов: ", True),
+    ("security_notes", "  - Отметки безопасности: ", True),
+    ("perf_notes", "  - Отметки производительности: ", True),
+    ("docs_notes", "  - Отметки документации: ", True),
+    ("created_at", "  - Создано: ", False),
+    ("completed_at", "  - Завершено: ", False),
+    ("progress_notes", "  - Прогресс: ", True),
+    ("started_at", "  - Начато: ", False),
+)
+
+
+def _md_checkpoint(confirmed: bool, auto: bool) -> str:
+    if confirmed:
+        return "OK"
+    if auto:
+        return "AUTO"
+    return "TODO"
+
+
+def _append_md_fields(step: Step, fields, lines: List[str]) -> None:
+    lines += [
+        prefix + ("; ".join(value) if is_list else str(value))
+        for name, prefix, is_list in fields
+        if (value := getattr(step, name))
+    ]
+
+
 def _flatten_step_tree(steps: List[Step]) -> List[Step]:
     return list(_iter_step_tree(steps))
 
 
 def _iter_step_tree(steps: List[Step]):
-    """Iterate nested steps in a deterministic pre-order (iterative, no recursion)."""
-    stack = [iter(list(steps or []))]
+    """Iterate nested steps in a deterministic pre-order (iterative, no recursion).
+
+    Walks the live lists (no copies): do not restructure the tree while iterating.
+    """
+    stack = [iter(steps)] if steps else []
     while stack:
         try:
             st = next(stack[-1])
@@ -307,24 +327,90 @@ def _iter_step_tree(steps: List[Step]):
             continue
         yield st
         plan = getattr(st, "plan", None)
-        tasks = list(getattr(plan, "tasks", []) or []) if plan else []
-        for task in reversed(tasks):
-            child_steps = list(getattr(task, "steps", []) or [])
-            if child_steps:
-                stack.append(iter(child_steps))
+        tasks = plan.tasks if plan else None
+        if tasks:
+            for task in reversed(tasks):
+                child_steps = task.steps
+                if child_steps:
+                    stack.append(iter(child_steps))
+
+
+# Per-pass memo of (total, done) keyed by id(TaskNode); see step_count_memo().
+_COUNT_MEMO: ContextVar[Optional[Dict[int, Tuple[int, int]]]] = ContextVar("step_count_memo", default=None)
+
+
+@contextmanager
+def step_count_memo() -> Iterator[None]:
+    """Share subtree counts across progress/readiness checks for one read-only pass.
+
+    Serializing a tree asks every nested TaskNode for its progress and every step for
+    readiness, which recounts each subtree once per ancestor. Inside this scope the
+    counts are memoized by node identity; the tree must not be mutated meanwhile.
+    Nested scopes reuse the outer memo.
+    """
+    if _COUNT_MEMO.get() is not None:
+        yield
+        return
+    token = _COUNT_MEMO.set({})
+    try:
+        yield
+    finally:
+        _COUNT_MEMO.reset(token)
+
+
+def _memo_steps_counts(steps, memo: Dict[int, Tuple[int, int]]) -> Tuple[int, int]:
+    total = 0
+    done = 0
+    for st in steps or ():
+        total += 1
+        if st.completed:
+            done += 1
+        plan = getattr(st, "plan", None)
+        for task in (plan.tasks or ()) if plan else ():
+            t_total, t_done = memo[id(task)]
+            total += t_total
+            done += t_done
+    return total, done
+
+
+def _memo_task_counts(root, memo: Dict[int, Tuple[int, int]]) -> Tuple[int, int]:
+    """Post-order fill of `memo` for `root` and its unseen descendants (iterative)."""
+    stack = [(root, False)]
+    while stack:
+        task, expanded = stack.pop()
+        if id(task) in memo:
+            continue
+        steps = task.steps or ()
+        if expanded:
+            memo[id(task)] = _memo_steps_counts(steps, memo)
+            continue
+        stack.append((task, True))
+        for st in steps:
+            plan = getattr(st, "plan", None)
+            for child in (plan.tasks or ()) if plan else ():
+                if id(child) not in memo:
+                    stack.append((child, False))
+    return memo[id(root)]
 
 
 def _count_step_tree(steps: List[Step]) -> tuple[int, int]:
+    memo = _COUNT_MEMO.get()
+    if memo is not None:
+        for st in steps or ():
+            plan = getattr(st, "plan", None)
+            for task in (plan.tasks or ()) if plan else ():
+                _memo_task_counts(task, memo)
+        return _memo_steps_counts(steps, memo)
     total = 0
     done = 0
     for st in _iter_step_tree(steps):
         total += 1
-        if getattr(st, "completed", False):
+        if st.completed:
             done += 1
     return total, done
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskNode:
     title: str
     status: str = "TODO"
@@ -362,14 +448,18 @@ class TaskNode:
     attachments: List[Attachment] = field(default_factory=list)
 
     def __post_init__(self) -> None:
-        if not getattr(self, "id", ""):
+        if not self.id:
             self.id = _new_node_id("NODE")
         # Auto-confirm tests if empty (Normal mode semantics).
-        if not getattr(self, "tests", []) and not getattr(self, "tests_confirmed", False):
+        if not self.tests and not self.tests_confirmed:
             self.tests_auto_confirmed = True
 
     def calculate_progress(self) -> int:
-        total, completed = _count_step_tree(list(self.steps or []))
+        memo = _COUNT_MEMO.get()
+        if memo is not None:
+            total, completed = _memo_task_counts(self, memo)
+        else:
+            total, completed = _count_step_tree(self.steps)
         if total <= 0:
             return 0
         return int((completed / total) * 100)
@@ -382,7 +472,7 @@ class TaskNode:
         return self.calculate_progress() == 100
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanNode:
     title: str = ""
     doc: str = ""
@@ -8,9 +8,19 @@ enabling:
 - Session restoration for AI agents
 """
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional
+
+from .evidence import _now_iso
+
+_timestamp_key = attrgetter("timestamp")
+
+
+def _intern(value: Any) -> Any:
+    # Loaded event types/actors repeat across thousands of events: share one string object.
+    return sys.intern(value) if type(value) is str else value
 
 
 # Event types
@@ -34,7 +44,7 @@ ACTOR_HUMAN = "human"
 ACTOR_SYSTEM = "system"
 
 
-@dataclass
+@dataclass(slots=True)
 class StepEvent:
     """A single event in step history.
 
@@ -51,12 +61,14 @@ class StepEvent:
     actor: str = ACTOR_AI
     target: str = ""  # "" = root level, "step:0.1.2" for nested
     data: Dict[str, Any] = field(default_factory=dict)
+    # (timestamp, display form) for format_timeline; revalidated by identity if timestamp is reassigned.
+    _display_ts: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def now(cls, event_type: str, actor: str = ACTOR_AI, target: str = "", **data) -> "StepEvent":
         """Create event with current timestamp."""
         return cls(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=_now_iso(),
             event_type=event_type,
             actor=actor,
             target=target,
@@ -147,8 +159,8 @@ class StepEvent:
         """Deserialize from dictionary."""
         return cls(
             timestamp=data.get("timestamp", ""),
-            event_type=data.get("event_type", ""),
-            actor=data.get("actor", ACTOR_AI),
+            event_type=_intern(data.get("event_type", "")),
+            actor=_intern(data.get("actor", ACTOR_AI)),
             target=data.get("target", ""),
             data=data.get("data", {}),
         )
@@ -159,10 +171,10 @@ class StepEvent:
 
         Legacy format: "2025-12-07: created" or just "created"
         """
-        # Try to parse timestamp prefix
-        if ": " in history_line and history_line[:10].replace("-", "").isdigit():
-            timestamp_part = history_line.split(": ", 1)[0]
-            text_part = history_line.split(": ", 1)[1] if ": " in history_line else history_line
+        # Try to parse timestamp prefix (one partition; the digit check only runs when ": " is present).
+        head, sep, rest = history_line.partition(": ")
+        if sep and history_line[:10].replace("-", "").isdigit():
+            timestamp_part, text_part = head, rest
         else:
             timestamp_part = ""
             text_part = history_line
@@ -177,67 +189,116 @@ class StepEvent:
 
     def format_timeline(self) -> str:
         """Format event for timeline display."""
-        ts = self.timestamp[:19].replace("T", " ") if self.timestamp else "unknown"
-
-        if self.event_type == EVENT_CREATED:
-            return f"[{ts}] Step created"
-        elif self.event_type == EVENT_CHECKPOINT:
-            checkpoint = self.data.get("checkpoint", "?")
-            note = self.data.get("note", "")
-            note_suffix = f" — {note}" if note else ""
-            return f"[{ts}] {self.target}: {checkpoint} confirmed{note_suffix}"
-        elif self.event_type == EVENT_STATUS:
-            return f"[{ts}] Status: {self.data.get('old')} → {self.data.get('new')}"
-        elif self.event_type == EVENT_STEP_DONE:
-            return f"[{ts}] {self.target} completed"
-        elif self.event_type == EVENT_BLOCKED:
-            reason = self.data.get("reason", "")
-            blocker = self.data.get("blocker_step", "")
-            return f"[{ts}] Blocked: {reason}" + (f" (by {blocker})" if blocker else "")
-        elif self.event_type == EVENT_UNBLOCKED:
-            return f"[{ts}] Unblocked"
-        elif self.event_type == EVENT_DEPENDENCY_ADDED:
-            return f"[{ts}] Dependency added: {self.data.get('depends_on')}"
-        elif self.event_type == EVENT_DEPENDENCY_RESOLVED:
-            return f"[{ts}] Dependency resolved: {self.data.get('depends_on')}"
-        elif self.event_type == EVENT_COMMENT:
-            return f"[{ts}] Note: {self.data.get('text', '')}"
-        elif self.event_type == EVENT_CONTRACT_UPDATED:
-            version = self.data.get("version", "?")
-            note = self.data.get("note", "")
-            note_suffix = f" — {note}" if note else ""
-            return f"[{ts}] Contract v{version} updated{note_suffix}"
-        elif self.event_type == EVENT_PLAN_UPDATED:
-            steps = self.data.get("steps", None)
-            steps_count = len(steps) if isinstance(steps, list) else self.data.get("steps_count", "?")
-            current = self.data.get("current", "?")
-            return f"[{ts}] Plan updated: {current}/{steps_count}"
-        elif self.event_type == EVENT_PLAN_ADVANCED:
-            current = self.data.get("current", "?")
-            total = self.data.get("total", "?")
-            return f"[{ts}] Plan advanced: {current}/{total}"
-        elif self.event_type == EVENT_OVERRIDE:
-            action = self.data.get("action", "?")
-            reason = self.data.get("reason", "")
-            target = self.target or ""
-            target_prefix = f"{target} " if target else ""
-            return f"[{ts}] {target_prefix}override: {action}" + (f" — {reason}" if reason else "")
-        elif self.event_type == "legacy":
-            return f"[{ts}] {self.data.get('text', '')}"
+        timestamp = self.timestamp
+        cached = self._display_ts
+        if cached is not None and cached[0] is timestamp:
+            ts = cached[1]
         else:
-            return f"[{ts}] {self.event_type}: {self.data}"
+            ts = timestamp[:19].replace("T", " ") if timestamp else "unknown"
+            self._display_ts = (timestamp, ts)
+        return _FORMATTERS.get(self.event_type, _fmt_other)(self, ts)
+
+
+def _note_suffix(data: Dict[str, Any]) -> str:
+    note = data.get("note", "")
+    return f" — {note}" if note else ""
+
+
+def _fmt_created(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] Step created"
+
+
+def _fmt_checkpoint(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] {e.target}: {e.data.get('checkpoint', '?')} confirmed{_note_suffix(e.data)}"
+
+
+def _fmt_status(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] Status: {e.data.get('old')} → {e.data.get('new')}"
+
+
+def _fmt_step_done(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] {e.target} completed"
+
+
+def _fmt_blocked(e: StepEvent, ts: str) -> str:
+    blocker = e.data.get("blocker_step", "")
+    return f"[{ts}] Blocked: {e.data.get('reason', '')}" + (f" (by {blocker})" if blocker else "")
+
+
+def _fmt_unblocked(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] Unblocked"
+
 
+def _fmt_dependency_added(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] Dependency added: {e.data.get('depends_on')}"
+
+
+def _fmt_dependency_resolved(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] Dependency resolved: {e.data.get('depends_on')}"
+
+
+def _fmt_comment(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] Note: {e.data.get('text', '')}"
+
+
+def _fmt_contract_updated(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] Contract v{e.data.get('version', '?')} updated{_note_suffix(e.data)}"
+
+
+def _fmt_plan_updated(e: StepEvent, ts: str) -> str:
+    steps = e.data.get("steps", None)
+    steps_count = len(steps) if isinstance(steps, list) else e.data.get("steps_count", "?")
+    return f"[{ts}] Plan updated: {e.data.get('current', '?')}/{steps_count}"
+
+
+def _fmt_plan_advanced(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] Plan advanced: {e.data.get('current', '?')}/{e.data.get('total', '?')}"
+
+
+def _fmt_override(e: StepEvent, ts: str) -> str:
+    reason = e.data.get("reason", "")
+    target_prefix = f"{e.target} " if e.target else ""
+    return f"[{ts}] {target_prefix}override: {e.data.get('action', '?')}" + (f" — {reason}" if reason else "")
+
+
+def _fmt_legacy(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] {e.data.get('text', '')}"
+
+
+def _fmt_other(e: StepEvent, ts: str) -> str:
+    return f"[{ts}] {e.event_type}: {e.data}"
+
+
+# event_type -> timeline formatter; unknown types fall back to _fmt_other.
+_FORMATTERS: Dict[str, Callable[[StepEvent, str], str]] = {
+    EVENT_CREATED: _fmt_created,
+    EVENT_CHECKPOINT: _fmt_checkpoint,
+    EVENT_STATUS: _fmt_status,
+    EVENT_STEP_DONE: _fmt_step_done,
+    EVENT_BLOCKED: _fmt_blocked,
+    EVENT_UNBLOCKED: _fmt_unblocked,
+    EVENT_DEPENDENCY_ADDED: _fmt_dependency_added,
+    EVENT_DEPENDENCY_RESOLVED: _fmt_dependency_resolved,
+    EVENT_COMMENT: _fmt_comment,
+    EVENT_CONTRACT_UPDATED: _fmt_contract_updated,
+    EVENT_PLAN_UPDATED: _fmt_plan_updated,
+    EVENT_PLAN_ADVANCED: _fmt_plan_advanced,
+    EVENT_OVERRIDE: _fmt_override,
+    "legacy": _fmt_legacy,
+}
 
 def events_to_timeline(events: List[StepEvent]) -> str:
     """Format list of events as human-readable timeline."""
     if not events:
         return "No events recorded."
 
-    lines = []
-    for event in sorted(events, key=lambda e: e.timestamp or ""):
-        lines.append(event.format_timeline())
-
-    return "\n".join(lines)
+    try:
+        # Timestamps are strings; the C-level key avoids a Python frame per element.
+        ordered = sorted(events, key=_timestamp_key)
+    except TypeError:
+        # Hand-edited stores may carry null timestamps: order them as "".
+        ordered = sorted(events, key=lambda e: e.timestamp or "")
+    return "\n".join([event.format_timeline() for event in ordered])
 
 
 __all__ = [
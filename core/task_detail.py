@@ -1,15 +1,75 @@
+import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 import yaml
 
-from .step import Step, _flatten_step_tree
+from .step import Step, _count_step_tree
 from .evidence import Attachment, VerificationCheck
 from .step_event import StepEvent
 
 
+# Strings PyYAML may emit unquoted or single-quoted verbatim: word chars, inner spaces, . - /
+_SIMPLE_SCALAR_RE = re.compile(r"\w(?:[\w .\-/]*[\w.\-/])?")
+_YAML_RESOLVER = yaml.resolver.Resolver()
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+# Past PyYAML's default best_width the emitter starts folding scalars.
+_YAML_WIDTH = 80
+
+
+def _yaml_scalar(value: Any) -> Optional[str]:
+    """Render `value` exactly as yaml.safe_dump would, or None when the emitter is needed."""
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    kind = type(value)
+    if kind is int:
+        return str(value)
+    if kind is not str:
+        return None
+    if not value:
+        return "''"
+    if not _SIMPLE_SCALAR_RE.fullmatch(value):
+        return None
+    # Plain unless it would read back as another type (bool/null/number/timestamp).
+    if _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == _YAML_STR_TAG:
+        return value
+    return f"'{value}'"
+
+
+def _dump_front_matter(metadata: Dict[str, Any]) -> str:
+    """yaml.safe_dump(metadata, allow_unicode=True, sort_keys=False) without the generic emitter.
+
+    Flat scalars and lists of simple strings are written directly; any other entry is
+    handed to yaml.safe_dump on its own, so the output stays byte-identical.
+    """
+    out: List[str] = []
+    emit = out.append
+    for key, value in metadata.items():
+        if type(value) is list:
+            if not value:
+                emit(f"{key}: []\n")
+                continue
+            items = [_yaml_scalar(v) for v in value]
+            if all(item is not None and len(item) + 2 <= _YAML_WIDTH for item in items):
+                emit(f"{key}:\n")
+                for item in items:
+                    emit(f"- {item}\n")
+                continue
+        else:
+            rendered = _yaml_scalar(value)
+            if rendered is not None and len(key) + len(rendered) + 2 <= _YAML_WIDTH:
+                emit(f"{key}: {rendered}\n")
+                continue
+        emit(yaml.safe_dump({key: value}, allow_unicode=True, default_flow_style=False, sort_keys=False))
+    return "".join(out)
+
+
 @dataclass
 class TaskDetail:
     id: str
@@ -83,11 +143,10 @@ class TaskDetail:
             current = max(0, min(current, len(steps)))
             return int((current / len(steps)) * 100)
 
-        flat = _flatten_step_tree(list(self.steps or []))
-        if not flat:
+        total, completed = _count_step_tree(self.steps)
+        if not total:
             return self.progress
-        completed = sum(1 for st in flat if st.completed)
-        return int((completed / len(flat)) * 100)
+        return int((completed / total) * 100)
 
     @property
     def folder(self) -> str:
@@ -139,7 +198,7 @@ class TaskDetail:
         # kind == "task"
         # DONE is explicit, but must remain consistent with core invariants.
         if current == "DONE":
-            has_steps = bool(_flatten_step_tree(list(getattr(self, "steps", []) or [])))
+            has_steps = bool(getattr(self, "steps", None))
             # Minimal DONE invariants (core-only, no app-layer lint):
             # - progress==100 when there are steps
             # - root success_criteria must exist
@@ -404,97 +463,98 @@ class TaskDetail:
 
             metadata["steps"] = [dump_step(st) for st in self.steps]
 
-        header = yaml.safe_dump(
-            metadata,
-            allow_unicode=True,
-            default_flow_style=False,
-            sort_keys=False,
-        ).strip()
-        lines = ["---", header, "---", ""]
-        lines.append(f"# {self.title}\n")
+        header = _dump_front_matter(metadata).strip()
+        lines = ["---", header, "---", "", f"# {self.title}\n"]
+        emit = lines.append
 
         def add_section(title: str, content: List[str]) -> None:
             if content:
-                lines.append(f"## {title}")
+                emit(f"## {title}")
                 lines.extend(content)
-                lines.append("")
-
-        if self.contract:
-            lines.append("## Контракт")
-            lines.append(self.contract)
-            lines.append("")
-        if self.plan_doc:
-            lines.append("## План")
-            lines.append(self.plan_doc)
-            lines.append("")
-        if self.description:
-            lines.append("## Описание")
-            lines.append(self.description)
-            lines.append("")
-        if self.context:
-            lines.append("## Контекст")
-            lines.append(self.context)
-            lines.append("")
+                emit("")
+
+        for title, text in (
+            ("Контракт", self.contract),
+            ("План", self.plan_doc),
+            ("Описание", self.description),
+            ("Контекст", self.context),
+        ):
+            if text:
+                lines += (f"## {title}", text, "")
         if self.steps:
-            lines.append("## Шаги")
+            emit("## Шаги")
 
-            def dump_step(st: Step, indent: int = 0):
+            def dump_step(st: Step, indent: int) -> None:
                 pad = "  " * indent
-                lines.append(f"{pad}- [{'x' if st.completed else ' '}] {st.title}")
-                pad_detail = pad + "  "
+                emit(f"{pad}- [{'x' if st.completed else ' '}] {st.title}")
+                item = pad + "  - "
                 if st.success_criteria:
-                    lines.append(f"{pad_detail}- Критерии: " + "; ".join(st.success_criteria))
+                    emit(f"{item}Критерии: " + "; ".join(st.success_criteria))
                 if st.tests:
-                    lines.append(f"{pad_detail}- Тесты: " + "; ".join(st.tests))
+                    emit(f"{item}Тесты: " + "; ".join(st.tests))
                 if st.blockers:
-                    lines.append(f"{pad_detail}- Блокеры: " + "; ".join(st.blockers))
+                    emit(f"{item}Блокеры: " + "; ".join(st.blockers))
+                # Optional checkpoint fields are read once and reused for the token and notes lines.
+                security_ok = getattr(st, "security_confirmed", False)
+                perf_ok = getattr(st, "perf_confirmed", False)
+                docs_ok = getattr(st, "docs_confirmed", False)
+                security_notes = getattr(st, "security_notes", None) or []
+                perf_notes = getattr(st, "perf_notes", None) or []
+                docs_notes = getattr(st, "docs_notes", None) or []
                 tests_value = "OK" if st.tests_confirmed else ("AUTO" if st.tests_auto_confirmed else "TODO")
                 status_tokens = [f"Критерии={'OK' if st.criteria_confirmed else 'TODO'}", f"Тесты={tests_value}"]
-                if getattr(st, "security_confirmed", False) or list(getattr(st, "security_notes", []) or []):
-                    status_tokens.append(f"Безопасность={'OK' if getattr(st, 'security_confirmed', False) else 'TODO'}")
-                if getattr(st, "perf_confirmed", False) or list(getattr(st, "perf_notes", []) or []):
-                    status_tokens.append(f"Производительность={'OK' if getattr(st, 'perf_confirmed', False) else 'TODO'}")
-                if getattr(st, "docs_confirmed", False) or list(getattr(st, "docs_notes", []) or []):
-                    status_tokens.append(f"Документация={'OK' if getattr(st, 'docs_confirmed', False) else 'TODO'}")
-                lines.append(f"{pad_detail}- Чекпоинты: " + "; ".join(status_tokens))
+                if security_ok or security_notes:
+                    status_tokens.append(f"Безопасность={'OK' if security_ok else 'TODO'}")
+                if perf_ok or perf_notes:
+                    status_tokens.append(f"Производительность={'OK' if perf_ok else 'TODO'}")
+                if docs_ok or docs_notes:
+                    status_tokens.append(f"Документация={'OK' if docs_ok else 'TODO'}")
+                emit(f"{item}Чекпоинты: " + "; ".join(status_tokens))
                 if st.criteria_notes:
-                    lines.append(f"{pad_detail}- Отметки критериев: " + "; ".join(st.criteria_notes))
+                    emit(f"{item}Отметки критериев: " + "; ".join(st.criteria_notes))
                 if st.tests_notes:
-                    lines.append(f"{pad_detail}- Отметки тестов: " + "; ".join(st.tests_notes))
-                if list(getattr(st, "security_notes", []) or []):
-                    lines.append(f"{pad_detail}- Отметки безопасности: " + "; ".join(list(getattr(st, "security_notes", []) or [])))
-                if list(getattr(st, "perf_notes", []) or []):
-                    lines.append(f"{pad_detail}- Отметки производительности: " + "; ".join(list(getattr(st, "perf_notes", []) or [])))
-                if list(getattr(st, "docs_notes", []) or []):
-                    lines.append(f"{pad_detail}- Отметки документации: " + "; ".join(list(getattr(st, "docs_notes", []) or [])))
+                    emit(f"{item}Отметки тестов: " + "; ".join(st.tests_notes))
+                if security_notes:
+                    emit(f"{item}Отметки безопасности: " + "; ".join(security_notes))
+                if perf_notes:
+                    emit(f"{item}Отметки производительности: " + "; ".join(perf_notes))
+                if docs_notes:
+                    emit(f"{item}Отметки документации: " + "; ".join(docs_notes))
                 # Phase 1 fields
                 if st.created_at:
-                    lines.append(f"{pad_detail}- Создано: {st.created_at}")
+                    emit(f"{item}Создано: {st.created_at}")
                 if st.completed_at:
-                    lines.append(f"{pad_detail}- Завершено: {st.completed_at}")
+                    emit(f"{item}Завершено: {st.completed_at}")
                 if st.progress_notes:
-                    lines.append(f"{pad_detail}- Прогресс: " + "; ".join(st.progress_notes))
+                    emit(f"{item}Прогресс: " + "; ".join(st.progress_notes))
                 if st.started_at:
-                    lines.append(f"{pad_detail}- Начато: {st.started_at}")
+                    emit(f"{item}Начато: {st.started_at}")
                 if st.blocked or st.block_reason:
                     block_value = "да" if st.blocked else "нет"
                     if st.block_reason:
-                        lines.append(f"{pad_detail}- Заблокировано: {block_value}; {st.block_reason}")
+                        emit(f"{item}Заблокировано: {block_value}; {st.block_reason}")
                     else:
-                        lines.append(f"{pad_detail}- Заблокировано: {block_value}")
+                        emit(f"{item}Заблокировано: {block_value}")
 
                 plan = getattr(st, "plan", None)
                 if plan and getattr(plan, "tasks", None):
-                    lines.append(f"{pad_detail}- План:")
-                    for task in plan.tasks:
-                        task_label = f"{task.title}".strip() or "Untitled task"
-                        lines.append(f"{pad_detail}  - [TASK] {task_label} ({getattr(task, 'status', 'TODO')})")
-                        for child in list(getattr(task, "steps", []) or []):
-                            dump_step(child, indent + 2)
-
-            for st in self.steps:
-                dump_step(st, 0)
-            lines.append("")
+                    emit(f"{item}План:")
+                    pad_detail = pad + "  "
+                    # Reversed pushes keep document order: task line, its steps, next task.
+                    for task in reversed(plan.tasks):
+                        stack.extend((True, child, indent + 2) for child in reversed(list(getattr(task, "steps", []) or [])))
+                        stack.append((False, task, pad_detail))
+
+            # Explicit pre-order work stack (no recursion): (True, step, indent) | (False, task, pad).
+            stack: List[Tuple[bool, Any, Any]] = [(True, st, 0) for st in reversed(self.steps)]
+            while stack:
+                is_step, node, where = stack.pop()
+                if is_step:
+                    dump_step(node, where)
+                else:
+                    task_label = f"{node.title}".strip() or "Untitled task"
+                    emit(f"{where}  - [TASK] {task_label} ({getattr(node, 'status', 'TODO')})")
+            emit("")
         add_section("Текущие проблемы", [f"{i + 1}. {p}" for i, p in enumerate(self.problems)])
         add_section("Следующие шаги", [f"- {s}" for s in self.next_steps])
         add_section("Критерии успеха", [f"- {c}" for c in self.success_criteria])
@@ -1,9 +1,17 @@
+import os
+import stat
+import threading
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml bindings when available
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from application.ports import TaskRepository
 from core import TaskDetail
 from core.status import normalize_status_code
@@ -11,10 +19,44 @@ from core.desktop.devtools.interface.tasks_dir_resolver import get_tasks_dir_for
 from infrastructure.task_file_parser import TaskFileParser
 
 
+_RESERVED_DIRS = frozenset({".snapshots", ".trash"})
+
+
 def _is_reserved_dir(path: Path) -> bool:
     return ".snapshots" in path.parts or ".trash" in path.parts
 
 
+def _iter_task_entries(root: Path, *, skip_reserved: bool = True) -> Iterator[os.DirEntry]:
+    """Yield `*.task` entries under `root` in rglob order, via os.scandir.
+
+    One scandir per directory; DirEntry caches its type (and stat on most platforms), so
+    there are no per-file Path objects or extra syscalls. Symlinked directories are not
+    followed, matching Path.rglob.
+    """
+    if skip_reserved and _is_reserved_dir(root):
+        return
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not (skip_reserved and entry.name in _RESERVED_DIRS):
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(".task"):
+                    yield entry
+        # Files of a directory come first, then each subdirectory's subtree in scan order.
+        stack.extend(reversed(subdirs))
+
+
+def _is_item_file(name: str) -> bool:
+    return name.startswith("TASK-") or name.startswith("PLAN-")
+
+
 class FileTaskRepository(TaskRepository):
     """File-backed repository for both Plans and Tasks.
 
@@ -25,6 +67,20 @@ class FileTaskRepository(TaskRepository):
 
     def __init__(self, tasks_dir: Path | None):
         self.tasks_dir = get_tasks_dir_for_project(use_global=True, create=False) if tasks_dir is None else tasks_dir
+        # path -> ((st_mtime_ns, st_size), revision) of our last write; any other writer changes the stamp.
+        self._rev_cache: Dict[str, Tuple[Tuple[int, int], int]] = {}
+        # item id -> `.task` paths in walk order; rebuilt by one walk when a lookup misses or goes stale.
+        self._id_index: Optional[Dict[str, List[str]]] = None
+        self._tasks_root_key: Optional[Path] = None
+        self._tasks_root_resolved = ""
+
+    def _tasks_root(self) -> str:
+        """Resolved tasks_dir; computed once per tasks_dir value instead of on every lookup."""
+        tasks_dir = self.tasks_dir
+        if self._tasks_root_key is not tasks_dir:
+            self._tasks_root_resolved = os.path.realpath(tasks_dir)
+            self._tasks_root_key = tasks_dir
+        return self._tasks_root_resolved
 
     def _resolve_path(self, item_id: str, domain: str = "") -> Path:
         if self.tasks_dir is None:
@@ -33,11 +89,26 @@ class FileTaskRepository(TaskRepository):
             raise ValueError(f"Invalid id: contains path traversal characters: {item_id}")
         if domain and (".." in domain or domain.startswith("/") or "\\" in domain):
             raise ValueError(f"Invalid domain: contains path traversal characters: {domain}")
-        base = self.tasks_dir / domain if domain else self.tasks_dir
-        resolved = (base / f"{item_id}.task").resolve()
-        if not resolved.is_relative_to(self.tasks_dir.resolve()):
+        root = self._tasks_root()
+        name = f"{item_id}.task"
+        resolved = os.path.realpath(os.path.join(root, domain, name) if domain else os.path.join(root, name))
+        if not resolved.startswith(root if root.endswith(os.sep) else root + os.sep):
             raise ValueError(f"Path traversal detected: {resolved} is outside {self.tasks_dir}")
-        return resolved
+        return Path(resolved)
+
+    def _find_item_files(self, item_id: str) -> List[Path]:
+        index = self._id_index
+        paths = index.get(item_id) if index is not None else None
+        if not paths or not all(os.path.isfile(p) for p in paths):
+            paths = self._build_id_index().get(item_id, ())
+        return [Path(p) for p in paths]
+
+    def _build_id_index(self) -> Dict[str, List[str]]:
+        index: Dict[str, List[str]] = {}
+        for entry in _iter_task_entries(self.tasks_dir):
+            index.setdefault(entry.name[:-5], []).append(entry.path)
+        self._id_index = index
+        return index
 
     def _assign_domain(self, detail: TaskDetail, path: Path) -> None:
         if detail.domain:
@@ -50,13 +121,13 @@ class FileTaskRepository(TaskRepository):
 
     def load(self, task_id: str, domain: str = "") -> Optional[TaskDetail]:
         path = self._resolve_path(task_id, domain)
-        if path.exists():
+        if os.path.isfile(path):
             detail = TaskFileParser.parse(path)
             if detail:
                 self._assign_domain(detail, path)
             return detail
 
-        candidates = [f for f in self.tasks_dir.rglob(f"{task_id}.task") if not _is_reserved_dir(f)]
+        candidates = self._find_item_files(task_id)
         for candidate in candidates:
             try:
                 detail = TaskFileParser.parse(candidate)
@@ -70,31 +141,71 @@ class FileTaskRepository(TaskRepository):
     def save(self, task: TaskDetail) -> None:
         path = self._resolve_path(task.id, task.domain)
         path.parent.mkdir(parents=True, exist_ok=True)
+        key = str(path)
         # Monotonic revision (etag-like): always bump on write.
         # Best-effort: if file exists but parsing fails, fall back to in-memory revision.
         disk_revision = 0
-        if path.exists():
-            try:
-                content = path.read_text(encoding="utf-8")
-                parts = content.split("---", 2)
-                if len(parts) >= 3:
-                    meta = yaml.safe_load(parts[1]) or {}
-                    disk_revision = int((meta or {}).get("revision", 0) or 0)
-            except Exception:
-                disk_revision = 0
+        try:
+            st = os.stat(key)
+        except OSError:
+            st = None
+            self._rev_cache.pop(key, None)
+        if st is not None:
+            cached = self._rev_cache.get(key)
+            if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+                disk_revision = cached[1]
+            else:
+                disk_revision = self._read_disk_revision(path)
         current_revision = int(getattr(task, "revision", 0) or 0)
         task.revision = max(0, max(current_revision, disk_revision)) + 1
-        path.write_text(task.to_file_content(), encoding="utf-8")
+        # Write beside the target and swap in: readers never see a half-written file.
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_text(task.to_file_content(), encoding="utf-8")
+            if st is not None:
+                # A fresh tmp file gets umask defaults; keep the mode of the file it replaces.
+                os.chmod(tmp, stat.S_IMODE(st.st_mode))
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            raise
+        TaskFileParser.clear_cache(path)
+        index = self._id_index
+        if index is not None:
+            paths = index.get(task.id)
+            if paths is None:
+                index[task.id] = [key]
+            elif key not in paths:
+                # Same id in another domain: drop the entry so the next lookup re-walks in order.
+                del index[task.id]
+        try:
+            st = os.stat(key)
+            self._rev_cache[key] = ((st.st_mtime_ns, st.st_size), task.revision)
+        except OSError:
+            self._rev_cache.pop(key, None)
+
+    @staticmethod
+    def _read_disk_revision(path: Path) -> int:
+        try:
+            content = path.read_text(encoding="utf-8")
+            parts = content.split("---", 2)
+            if len(parts) >= 3:
+                meta = yaml.load(parts[1], Loader=_YamlLoader) or {}
+                return int((meta or {}).get("revision", 0) or 0)
+        except Exception:
+            pass
+        return 0
 
     def list(self, domain_path: str = "", skip_sync: bool = False) -> List[TaskDetail]:
         root = self.tasks_dir / domain_path if domain_path else self.tasks_dir
         items: List[TaskDetail] = []
-        for file in root.rglob("*.task"):
-            if _is_reserved_dir(file):
-                continue
-            stem = file.stem
-            if not (stem.startswith("TASK-") or stem.startswith("PLAN-")):
+        for entry in _iter_task_entries(root):
+            if not _is_item_file(entry.name):
                 continue
+            file = Path(entry.path)
             parsed = TaskFileParser.parse(file)
             if parsed:
                 self._assign_domain(parsed, file)
@@ -103,13 +214,11 @@ class FileTaskRepository(TaskRepository):
 
     def compute_signature(self) -> int:
         sig = 0
-        for f in self.tasks_dir.rglob("*.task"):
-            if _is_reserved_dir(f):
-                continue
-            if not (f.stem.startswith("TASK-") or f.stem.startswith("PLAN-")):
+        for entry in _iter_task_entries(self.tasks_dir):
+            if not _is_item_file(entry.name):
                 continue
             try:
-                st = f.stat()
+                st = entry.stat()
                 sig ^= int(st.st_mtime_ns) ^ int(st.st_size)
             except OSError:
                 continue
@@ -117,10 +226,14 @@ class FileTaskRepository(TaskRepository):
 
     def _next_id_for_prefix(self, prefix: str) -> str:
         ids: list[int] = []
-        for f in self.tasks_dir.rglob(f"{prefix}-*.task"):
-            # Keep IDs monotonic: include `.trash` and `.snapshots` to avoid reusing IDs.
+        head = f"{prefix}-"
+        # Keep IDs monotonic: include `.trash` and `.snapshots` to avoid reusing IDs.
+        for entry in _iter_task_entries(self.tasks_dir, skip_reserved=False):
+            name = entry.name
+            if not name.startswith(head):
+                continue
             try:
-                ids.append(int(f.stem.split("-")[1]))
+                ids.append(int(name[:-5].split("-")[1]))
             except (IndexError, ValueError):
                 continue
         next_num = (max(ids) + 1) if ids else 1
@@ -136,11 +249,12 @@ class FileTaskRepository(TaskRepository):
         path = self._resolve_path(task_id, domain)
         candidates = (
             [path]
-            if path.exists()
-            else [f for f in self.tasks_dir.rglob(f"{task_id}.task") if not _is_reserved_dir(f)]
+            if os.path.isfile(path)
+            else self._find_item_files(task_id)
         )
         deleted = False
         for candidate in candidates:
+            TaskFileParser.clear_cache(candidate)
             try:
                 candidate.unlink()
                 deleted = True
@@ -157,6 +271,7 @@ class FileTaskRepository(TaskRepository):
         self.save(detail)
         dest_path = self._resolve_path(task_id, new_domain)
         if old_path.exists() and old_path != dest_path:
+            TaskFileParser.clear_cache(old_path)
             try:
                 old_path.unlink()
             except OSError:
@@ -165,9 +280,9 @@ class FileTaskRepository(TaskRepository):
 
     def move_glob(self, pattern: str, new_domain: str) -> int:
         moved = 0
-        for file in self.tasks_dir.rglob("*.task"):
-            if _is_reserved_dir(file):
-                continue
+        # Snapshot first: moving writes new files into the tree being walked.
+        for entry in list(_iter_task_entries(self.tasks_dir)):
+            file = Path(entry.path)
             try:
                 rel = file.relative_to(self.tasks_dir)
             except Exception:
@@ -180,9 +295,8 @@ class FileTaskRepository(TaskRepository):
 
     def delete_glob(self, pattern: str) -> int:
         removed = 0
-        for file in self.tasks_dir.rglob("*.task"):
-            if _is_reserved_dir(file):
-                continue
+        for entry in list(_iter_task_entries(self.tasks_dir)):
+            file = Path(entry.path)
             try:
                 rel = file.relative_to(self.tasks_dir)
             except Exception:
@@ -202,11 +316,10 @@ class FileTaskRepository(TaskRepository):
         norm_status = normalize_status_code(status) if status else ""
         norm_phase = phase.strip().lower() if phase else ""
 
-        for file in self.tasks_dir.rglob("*.task"):
-            if _is_reserved_dir(file):
-                continue
-            if not (file.stem.startswith("TASK-") or file.stem.startswith("PLAN-")):
+        for entry in list(_iter_task_entries(self.tasks_dir)):
+            if not _is_item_file(entry.name):
                 continue
+            file = Path(entry.path)
             parsed = TaskFileParser.parse(file)
             if not parsed:
                 continue
@@ -1,18 +1,145 @@
+import copy
+import os
 import re
+import sys
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml bindings when available
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 from datetime import date, datetime
 
 from core import PlanNode, Step, TaskDetail, TaskNode, StepEvent, ensure_tree_ids, Attachment, VerificationCheck
 from core.status import normalize_status_code
 
 
+
+def _intern(value: Any) -> Any:
+    """Share one string object per distinct low-cardinality value across loaded tasks."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_list(values: Any) -> Any:
+    return [_intern(v) for v in values] if isinstance(values, list) else values
+
+
+def _split_items(payload: str) -> List[str]:
+    return [item.strip() for item in payload.split(";") if item.strip()]
+
+
+def _list_setter(attr: str):
+    def _set(step: Step, payload: str) -> None:
+        setattr(step, attr, _split_items(payload))
+
+    return _set
+
+
+def _stamp_setter(attr: str):
+    def _set(step: Step, payload: str) -> None:
+        setattr(step, attr, payload.strip() or None)
+
+    return _set
+
+
+def _set_step_tests(step: Step, payload: str) -> None:
+    step.tests = _split_items(payload)
+    step.tests_auto_confirmed = not step.tests
+
+
+# "Чекпоинты:" token name -> checkpoint; English aliases are matched case-insensitively.
+_STEP_CHECKPOINT_TOKENS = {
+    "Критерии": "criteria",
+    "Тесты": "tests",
+    "Безопасность": "security",
+    "Производительность": "perf",
+    "Документация": "docs",
+}
+_STEP_CHECKPOINT_ALIASES = {"security": "security", "perf": "perf", "docs": "docs"}
+
+
+def _set_step_checkpoints(step: Step, payload: str) -> None:
+    for token in payload.split(";"):
+        key, sep, value = token.strip().partition("=")
+        if not sep:
+            continue
+        name = _STEP_CHECKPOINT_TOKENS.get(key) or _STEP_CHECKPOINT_ALIASES.get(key.lower())
+        if name is None:
+            continue
+        if name in ("criteria", "tests"):
+            # Legacy format: only the field up to the next "=" counts.
+            value = value.split("=", 1)[0]
+        value = value.strip().upper()
+        if name == "tests":
+            step.tests_confirmed = value == "OK"
+            step.tests_auto_confirmed = value == "AUTO"
+        else:
+            setattr(step, f"{name}_confirmed", value == "OK")
+
+
+def _set_step_blocked(step: Step, payload: str) -> None:
+    first, _, reason = payload.strip().partition(";")
+    first = first.strip().lower()
+    # Only an explicit yes/no changes the flag.
+    if first in ("да", "yes", "true", "1"):
+        step.blocked = True
+        step.block_reason = reason.strip()
+    elif first in ("нет", "no", "false", "0"):
+        step.blocked = False
+        step.block_reason = ""
+
+
+# Step detail line "- <head>: <payload>" -> handler(step, payload); one lookup per line.
+_STEP_DETAIL_HANDLERS = {
+    "Критерии": _list_setter("success_criteria"),
+    "Тесты": _set_step_tests,
+    "Блокеры": _list_setter("blockers"),
+    "Чекпоинты": _set_step_checkpoints,
+    "Отметки критериев": _list_setter("criteria_notes"),
+    "Отметки тестов": _list_setter("tests_notes"),
+    "Отметки безопасности": _list_setter("security_notes"),
+    "Отметки производительности": _list_setter("perf_notes"),
+    "Отметки документации": _list_setter("docs_notes"),
+    "Создано": _stamp_setter("created_at"),
+    "Завершено": _stamp_setter("completed_at"),
+    "Прогресс": _list_setter("progress_notes"),
+    "Начато": _stamp_setter("started_at"),
+    "Заблокировано": _set_step_blocked,
+}
+
+def _text_section(attr: str):
+    def _save(task: TaskDetail, lines: List[str]) -> None:
+        setattr(task, attr, "\n".join(lines).strip())
+
+    return _save
+
+
+def _list_section(attr: str):
+    def _save(task: TaskDetail, lines: List[str]) -> None:
+        setattr(task, attr, TaskFileParser._parse_list(lines))
+
+    return _save
+
+
+# "## <title>" body headers; one regex pass splits the body into sections.
+_SECTION_RE = re.compile(r"(?m)^## (.*)$")
+
+
 class TaskFileParser:
     STEP_PATTERN = re.compile(r"^-\s*\[(x|X| )\]\s*(.+)$")
     CURRENT_SCHEMA_VERSION = 9
+    # realpath -> ((st_mtime_ns, st_ctime_ns, st_size, st_ino), pristine TaskDetail); LRU-bounded,
+    # callers get deep copies. In-process writers also call clear_cache(path): on coarse-mtime
+    # filesystems a same-size rewrite within one tick leaves the stamp unchanged.
+    CACHE_LIMIT = 4096
+    _cache: "OrderedDict[str, Tuple[Tuple[int, int, int, int], TaskDetail]]" = OrderedDict()
+    _cache_lock = threading.Lock()
 
     @staticmethod
     def _coerce_timestamp(value: Any) -> str:
@@ -43,13 +170,55 @@ class TaskFileParser:
 
     @classmethod
     def parse(cls, filepath: Path) -> Optional[TaskDetail]:
-        if not filepath.exists():
+        """Parse a .task file, reusing the previous result while its stat stamp is unchanged."""
+        try:
+            st = filepath.stat()
+        except OSError:
+            return None
+        key = os.path.realpath(filepath)
+        stamp = (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+        with cls._cache_lock:
+            hit = cls._cache.get(key)
+            if hit is not None and hit[0] == stamp:
+                cls._cache.move_to_end(key)
+                return copy.deepcopy(hit[1])
+        task = cls._parse_file(filepath)
+        if task is not None:
+            pristine = copy.deepcopy(task)
+            with cls._cache_lock:
+                cls._cache[key] = (stamp, pristine)
+                cls._cache.move_to_end(key)
+                while len(cls._cache) > cls.CACHE_LIMIT:
+                    cls._cache.popitem(last=False)
+        return task
+
+    @classmethod
+    def clear_cache(cls, filepath: Optional[Path] = None) -> None:
+        """Drop the cached parse for `filepath` (or everything when omitted)."""
+        with cls._cache_lock:
+            if filepath is None:
+                cls._cache.clear()
+            else:
+                cls._cache.pop(os.path.realpath(filepath), None)
+
+    @classmethod
+    def _parse_file(cls, filepath: Path) -> Optional[TaskDetail]:
+        try:
+            content = filepath.read_text(encoding="utf-8")
+        except FileNotFoundError:
             return None
-        content = filepath.read_text(encoding="utf-8")
+        return cls.parse_text(content, filepath)
+
+    @classmethod
+    def parse_text(cls, content: str, filepath: Path) -> Optional[TaskDetail]:
+        """Parse already-read `.task` content; `filepath` is recorded as the source path.
+
+        Bypasses the parse cache, so bulk readers can supply text they fetched themselves.
+        """
         parts = content.split("---", 2)
         if len(parts) < 3:
             return None
-        metadata = yaml.safe_load(parts[1]) or {}
+        metadata = yaml.load(parts[1], Loader=_YamlLoader) or {}
         body = parts[2].strip()
 
         try:
@@ -76,15 +245,16 @@ class TaskFileParser:
             title=metadata.get("title", ""),
             status=cls._parse_status(metadata.get("status", "TODO"), progress=progress, blocked=blocked),
             status_manual=bool(metadata.get("status_manual", False)),
-            domain=metadata.get("domain", "") or "",
-            phase=metadata.get("phase", "") or "",
-            component=metadata.get("component", "") or "",
+            # Status comes back as an interned canonical code; intern the other repeated tokens too.
+            domain=_intern(metadata.get("domain", "") or ""),
+            phase=_intern(metadata.get("phase", "") or ""),
+            component=_intern(metadata.get("component", "") or ""),
             parent=(metadata.get("parent", None) or metadata.get("plan_id", None) or None),
-            priority=metadata.get("priority", "MEDIUM"),
+            priority=_intern(metadata.get("priority", "MEDIUM")),
             created=cls._coerce_timestamp(metadata.get("created", "")),
             updated=cls._coerce_timestamp(metadata.get("updated", "")),
-            tags=metadata.get("tags", []),
-            assignee=metadata.get("assignee", "ai"),
+            tags=_intern_list(metadata.get("tags", [])),
+            assignee=_intern(metadata.get("assignee", "ai")),
             progress=progress,
             blocked=blocked,
             blockers=metadata.get("blockers", []),
@@ -124,22 +294,14 @@ class TaskFileParser:
         except OSError:
             task._source_mtime = time.time()
 
-        section = None
-        buffer: List[str] = []
-
-        def flush():
-            if section is None:
-                return
-            cls._save_section(task, section, buffer.copy())
-
-        for line in body.splitlines():
-            if line.startswith("## "):
-                flush()
-                section = line[3:].strip()
-                buffer = []
-            else:
-                buffer.append(line)
-        flush()
+        headers = list(_SECTION_RE.finditer(body))
+        for idx, header in enumerate(headers):
+            handler = _SECTION_HANDLERS.get(header.group(1).strip())
+            if handler is None:
+                continue
+            # Section text runs from the line after its header to the next header.
+            end = headers[idx + 1].start() if idx + 1 < len(headers) else len(body)
+            handler(task, body[header.end() + 1:end].splitlines())
         # Metadata fields are the canonical source for checkpoints; body sections are best-effort.
         if "success_criteria" in metadata:
             task.success_criteria = [str(v).strip() for v in (metadata.get("success_criteria", []) or []) if str(v).strip()]
@@ -207,177 +369,112 @@ class TaskFileParser:
 
     @classmethod
     def _save_section(cls, task: TaskDetail, section: str, lines: List[str]) -> None:
-        content = "\n".join(lines).strip()
-        if section in {"Контракт", "Contract"}:
-            task.contract = content
-        elif section in {"План", "Plan"}:
-            task.plan_doc = content
-        elif section in {"Описание", "Description"}:
-            task.description = content
-        elif section in {"Контекст", "Context"}:
-            task.context = content
-        elif section in {"Шаги", "Steps"}:
-            if getattr(task, "_steps_from_metadata", False):
-                return
-            stack: list[tuple[int, Step]] = []
-
-            def _ensure_default_task(parent: Step) -> TaskNode:
-                plan = getattr(parent, "plan", None)
-                if not plan:
-                    plan = PlanNode(tasks=[TaskNode(title=parent.title or "Work")])
-                    parent.plan = plan
-                if not getattr(plan, "tasks", None):
-                    plan.tasks = [TaskNode(title=parent.title or "Work")]
-                return plan.tasks[0]
-
-            for raw_line in lines:
-                if not raw_line.strip():
-                    continue
-                indent = len(raw_line) - len(raw_line.lstrip(" "))
-                line = raw_line.strip()
-                match = cls.STEP_PATTERN.match(line)
-                if match:
-                    st = Step(match.group(1).lower() == "x", match.group(2))
-                    while stack and stack[-1][0] >= indent:
-                        stack.pop()
-                    if stack:
-                        parent_step = stack[-1][1]
-                        _ensure_default_task(parent_step).steps.append(st)
-                    else:
-                        task.steps.append(st)
-                    stack.append((indent, st))
-                    continue
-                if not stack:
-                    continue
-                current = stack[-1][1]
-                if not line.startswith("- "):
-                    continue
-                stripped = line[2:]
-                if stripped.startswith("Критерии:"):
-                    current.success_criteria = [c.strip() for c in stripped[len("Критерии:") :].split(";") if c.strip()]
-                elif stripped.startswith("Тесты:"):
-                    current.tests = [t.strip() for t in stripped[len("Тесты:") :].split(";") if t.strip()]
-                    current.tests_auto_confirmed = not current.tests
-                elif stripped.startswith("Блокеры:"):
-                    current.blockers = [b.strip() for b in stripped[len("Блокеры:") :].split(";") if b.strip()]
-                elif stripped.startswith("Чекпоинты:"):
-                    tokens = stripped[len("Чекпоинты:") :].split(";")
-                    for token in tokens:
-                        token = token.strip()
-                        if token.startswith("Критерии="):
-                            current.criteria_confirmed = token.split("=")[1].strip().upper() == "OK"
-                        elif token.startswith("Тесты="):
-                            value = token.split("=")[1].strip().upper()
-                            current.tests_confirmed = value == "OK"
-                            current.tests_auto_confirmed = value == "AUTO"
-                        elif token.startswith("Безопасность=") or token.lower().startswith("security="):
-                            value = token.split("=", 1)[1].strip().upper()
-                            current.security_confirmed = value == "OK"
-                        elif token.startswith("Производительность=") or token.lower().startswith("perf="):
-                            value = token.split("=", 1)[1].strip().upper()
-                            current.perf_confirmed = value == "OK"
-                        elif token.startswith("Документация=") or token.lower().startswith("docs="):
-                            value = token.split("=", 1)[1].strip().upper()
-                            current.docs_confirmed = value == "OK"
-                elif stripped.startswith("Отметки критериев:"):
-                    current.criteria_notes = [n.strip() for n in stripped.split(":", 1)[1].split(";") if n.strip()]
-                elif stripped.startswith("Отметки тестов:"):
-                    current.tests_notes = [n.strip() for n in stripped.split(":", 1)[1].split(";") if n.strip()]
-                elif stripped.startswith("Отметки безопасности:"):
-                    current.security_notes = [n.strip() for n in stripped.split(":", 1)[1].split(";") if n.strip()]
-                elif stripped.startswith("Отметки производительности:"):
-                    current.perf_notes = [n.strip() for n in stripped.split(":", 1)[1].split(";") if n.strip()]
-                elif stripped.startswith("Отметки документации:"):
-                    current.docs_notes = [n.strip() for n in stripped.split(":", 1)[1].split(";") if n.strip()]
-                elif stripped.startswith("Создано:"):
-                    value = stripped.split(":", 1)[1].strip()
-                    current.created_at = value or None
-                elif stripped.startswith("Завершено:"):
-                    value = stripped.split(":", 1)[1].strip()
-                    current.completed_at = value or None
-                elif stripped.startswith("Прогресс:"):
-                    current.progress_notes = [n.strip() for n in stripped.split(":", 1)[1].split(";") if n.strip()]
-                elif stripped.startswith("Начато:"):
-                    value = stripped.split(":", 1)[1].strip()
-                    current.started_at = value or None
-                elif stripped.startswith("Заблокировано:"):
-                    value = stripped.split(":", 1)[1].strip()
-                    parts = value.split(";", 1)
-                    first_part = parts[0].strip().lower()
-                    # Check if first part is explicit yes/no
-                    if first_part in ("да", "yes", "true", "1"):
-                        current.blocked = True
-                        current.block_reason = parts[1].strip() if len(parts) > 1 else ""
-                    elif first_part in ("нет", "no", "false", "0"):
-                        current.blocked = False
-                        current.block_reason = ""
-            # Normal mode: tests are optional; when empty, treat as auto-confirmed.
-            def _apply_auto_tests(nodes: List[Step]) -> None:
-                for node in nodes:
-                    if not node.tests and not node.tests_confirmed:
-                        node.tests_auto_confirmed = True
-                    plan = getattr(node, "plan", None)
-                    if plan and getattr(plan, "tasks", None):
-                        for task in plan.tasks:
-                            _apply_auto_tests(list(getattr(task, "steps", []) or []))
-
-            _apply_auto_tests(task.steps)
-        elif section == "Критерии успеха":
-            task.success_criteria = cls._parse_list(lines)
-        elif section in {"Тесты", "Tests"}:
-            task.tests = cls._parse_list(lines)
-            if not task.tests and not task.tests_confirmed:
-                task.tests_auto_confirmed = True
-        elif section in {"Блокеры", "Blockers"}:
-            task.blockers = cls._parse_list(lines)
-        elif section in {"Чекпоинты", "Checkpoints"}:
-            for raw_line in lines:
-                line = raw_line.strip()
-                if line.startswith("- "):
-                    line = line[2:].strip()
-                if not line:
-                    continue
-                if line.startswith("Критерии=") or line.lower().startswith("criteria="):
-                    value = line.split("=", 1)[1].strip().upper()
-                    task.criteria_confirmed = value == "OK"
-                elif line.startswith("Тесты=") or line.lower().startswith("tests="):
-                    value = line.split("=", 1)[1].strip().upper()
-                    task.tests_confirmed = value == "OK"
-                    task.tests_auto_confirmed = value == "AUTO"
-                elif line.startswith("Безопасность=") or line.lower().startswith("security="):
-                    value = line.split("=", 1)[1].strip().upper()
-                    task.security_confirmed = value == "OK"
-                elif line.startswith("Производительность=") or line.lower().startswith("perf="):
-                    value = line.split("=", 1)[1].strip().upper()
-                    task.perf_confirmed = value == "OK"
-                elif line.startswith("Документация=") or line.lower().startswith("docs="):
-                    value = line.split("=", 1)[1].strip().upper()
-                    task.docs_confirmed = value == "OK"
-                elif line.startswith("Отметки критериев:") or line.lower().startswith("criteria notes:"):
-                    rhs = line.split(":", 1)[1]
-                    task.criteria_notes = [n.strip() for n in rhs.split(";") if n.strip()]
-                elif line.startswith("Отметки тестов:") or line.lower().startswith("tests notes:"):
-                    rhs = line.split(":", 1)[1]
-                    task.tests_notes = [n.strip() for n in rhs.split(";") if n.strip()]
-                elif line.startswith("Отметки безопасности:"):
-                    rhs = line.split(":", 1)[1]
-                    task.security_notes = [n.strip() for n in rhs.split(";") if n.strip()]
-                elif line.startswith("Отметки производительности:"):
-                    rhs = line.split(":", 1)[1]
-                    task.perf_notes = [n.strip() for n in rhs.split(";") if n.strip()]
-                elif line.startswith("Отметки документации:"):
-                    rhs = line.split(":", 1)[1]
-                    task.docs_notes = [n.strip() for n in rhs.split(";") if n.strip()]
-        elif section == "Следующие шаги":
-            task.next_steps = cls._parse_list(lines)
-        elif section == "Зависимости":
-            task.dependencies = cls._parse_list(lines)
-        elif section == "Текущие проблемы":
-            task.problems = cls._parse_numbered(lines)
-        elif section == "Риски":
-            task.risks = cls._parse_list(lines)
-        elif section == "История":
-            task.history = cls._parse_list(lines)
+        handler = _SECTION_HANDLERS.get(section)
+        if handler is not None:
+            handler(task, lines)
+
+    @classmethod
+    def _save_steps(cls, task: TaskDetail, lines: List[str]) -> None:
+        if getattr(task, "_steps_from_metadata", False):
+            return
+        stack: list[tuple[int, Step]] = []
+
+        def _ensure_default_task(parent: Step) -> TaskNode:
+            plan = getattr(parent, "plan", None)
+            if not plan:
+                plan = PlanNode(tasks=[TaskNode(title=parent.title or "Work")])
+                parent.plan = plan
+            if not getattr(plan, "tasks", None):
+                plan.tasks = [TaskNode(title=parent.title or "Work")]
+            return plan.tasks[0]
+
+        for raw_line in lines:
+            if not raw_line.strip():
+                continue
+            indent = len(raw_line) - len(raw_line.lstrip(" "))
+            line = raw_line.strip()
+            match = cls.STEP_PATTERN.match(line)
+            if match:
+                st = Step(match.group(1).lower() == "x", match.group(2))
+                while stack and stack[-1][0] >= indent:
+                    stack.pop()
+                if stack:
+                    parent_step = stack[-1][1]
+                    _ensure_default_task(parent_step).steps.append(st)
+                else:
+                    task.steps.append(st)
+                stack.append((indent, st))
+                continue
+            if not stack:
+                continue
+            current = stack[-1][1]
+            if not line.startswith("- "):
+                continue
+            head, sep, payload = line[2:].partition(":")
+            handler = _STEP_DETAIL_HANDLERS.get(head) if sep else None
+            if handler is not None:
+                handler(current, payload)
+        # Normal mode: tests are optional; when empty, treat as auto-confirmed.
+        def _apply_auto_tests(nodes: List[Step]) -> None:
+            for node in nodes:
+                if not node.tests and not node.tests_confirmed:
+                    node.tests_auto_confirmed = True
+                plan = getattr(node, "plan", None)
+                if plan and getattr(plan, "tasks", None):
+                    for task in plan.tasks:
+                        _apply_auto_tests(list(getattr(task, "steps", []) or []))
+
+        _apply_auto_tests(task.steps)
+
+    @classmethod
+    def _save_tests(cls, task: TaskDetail, lines: List[str]) -> None:
+        task.tests = cls._parse_list(lines)
+        if not task.tests and not task.tests_confirmed:
+            task.tests_auto_confirmed = True
+
+    @classmethod
+    def _save_problems(cls, task: TaskDetail, lines: List[str]) -> None:
+        task.problems = cls._parse_numbered(lines)
+
+    @classmethod
+    def _save_checkpoints(cls, task: TaskDetail, lines: List[str]) -> None:
+        for raw_line in lines:
+            line = raw_line.strip()
+            if line.startswith("- "):
+                line = line[2:].strip()
+            if not line:
+                continue
+            if line.startswith("Критерии=") or line.lower().startswith("criteria="):
+                value = line.split("=", 1)[1].strip().upper()
+                task.criteria_confirmed = value == "OK"
+            elif line.startswith("Тесты=") or line.lower().startswith("tests="):
+                value = line.split("=", 1)[1].strip().upper()
+                task.tests_confirmed = value == "OK"
+                task.tests_auto_confirmed = value == "AUTO"
+            elif line.startswith("Безопасность=") or line.lower().startswith("security="):
+                value = line.split("=", 1)[1].strip().upper()
+                task.security_confirmed = value == "OK"
+            elif line.startswith("Производительность=") or line.lower().startswith("perf="):
+                value = line.split("=", 1)[1].strip().upper()
+                task.perf_confirmed = value == "OK"
+            elif line.startswith("Документация=") or line.lower().startswith("docs="):
+                value = line.split("=", 1)[1].strip().upper()
+                task.docs_confirmed = value == "OK"
+            elif line.startswith("Отметки критериев:") or line.lower().startswith("criteria notes:"):
+                rhs = line.split(":", 1)[1]
+                task.criteria_notes = [n.strip() for n in rhs.split(";") if n.strip()]
+            elif line.startswith("Отметки тестов:") or line.lower().startswith("tests notes:"):
+                rhs = line.split(":", 1)[1]
+                task.tests_notes = [n.strip() for n in rhs.split(";") if n.strip()]
+            elif line.startswith("Отметки безопасности:"):
+                rhs = line.split(":", 1)[1]
+                task.security_notes = [n.strip() for n in rhs.split(";") if n.strip()]
+            elif line.startswith("Отметки производительности:"):
+                rhs = line.split(":", 1)[1]
+                task.perf_notes = [n.strip() for n in rhs.split(";") if n.strip()]
+            elif line.startswith("Отметки документации:"):
+                rhs = line.split(":", 1)[1]
+                task.docs_notes = [n.strip() for n in rhs.split(";") if n.strip()]
 
     @classmethod
     def _parse_step_tree(cls, nodes: List[Dict[str, Any]]) -> List[Step]:
@@ -509,7 +606,7 @@ class TaskFileParser:
         task = TaskNode(
             title=title,
             status=status,
-            priority=str(node.get("priority", "MEDIUM") or "MEDIUM"),
+            priority=_intern(str(node.get("priority", "MEDIUM") or "MEDIUM")),
             description=str(node.get("description", "") or ""),
             context=str(node.get("context", "") or ""),
             attachments=attachments,
@@ -567,4 +664,31 @@ class TaskFileParser:
         return out
 
 
+# Body section title (ru/en) -> handler(task, lines); unknown sections are ignored.
+_SECTION_HANDLERS = {
+    "Контракт": _text_section("contract"),
+    "Contract": _text_section("contract"),
+    "План": _text_section("plan_doc"),
+    "Plan": _text_section("plan_doc"),
+    "Описание": _text_section("description"),
+    "Description": _text_section("description"),
+    "Контекст": _text_section("context"),
+    "Context": _text_section("context"),
+    "Шаги": TaskFileParser._save_steps,
+    "Steps": TaskFileParser._save_steps,
+    "Критерии успеха": _list_section("success_criteria"),
+    "Тесты": TaskFileParser._save_tests,
+    "Tests": TaskFileParser._save_tests,
+    "Блокеры": _list_section("blockers"),
+    "Blockers": _list_section("blockers"),
+    "Чекпоинты": TaskFileParser._save_checkpoints,
+    "Checkpoints": TaskFileParser._save_checkpoints,
+    "Следующие шаги": _list_section("next_steps"),
+    "Зависимости": _list_section("dependencies"),
+    "Текущие проблемы": TaskFileParser._save_problems,
+    "Риски": _list_section("risks"),
+    "История": _list_section("history"),
+}
+
+
 __all__ = ["TaskFileParser"]
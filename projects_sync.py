@@ -29,6 +29,7 @@ from infrastructure.projects_sync.graphql_client import (
 from infrastructure.projects_sync.issues_client import IssuesClient, IssuesPermissionError
 from infrastructure.projects_sync.rate_limiter import RateLimiter
 from infrastructure.projects_sync.schema_cache import SchemaCache
+from infrastructure.task_file_parser import TaskFileParser
 from infrastructure.token_status_cache import (
     should_show_projects_warning,
     mark_projects_warning_shown,
@@ -1040,8 +1041,10 @@ class ProjectsSync:
                 return False
             new_path.parent.mkdir(parents=True, exist_ok=True)
             new_path.write_text(new_text, encoding="utf-8")
+            TaskFileParser.clear_cache(new_path)
             if old_path != new_path and Path(old_path).exists():
                 Path(old_path).unlink()
+                TaskFileParser.clear_cache(Path(old_path))
             task._source_path = new_path
             task._source_mtime = new_path.stat().st_mtime
             if remote_updated:
@@ -1342,6 +1345,7 @@ class ProjectsSync:
                     info = self._record_conflict(metadata.get("id", file.stem), file, content, new_text, "Локальные правки новее удалённых", remote_updated, "webhook")
                     return {"conflict": info}
                 file.write_text(new_text, encoding="utf-8")
+                TaskFileParser.clear_cache(file)
                 return {"updated": str(file)}
             return {}
         return {}
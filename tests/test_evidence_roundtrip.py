@@ -37,3 +37,45 @@ def test_evidence_and_attachments_roundtrip(tmp_path):
     assert reloaded_step.verification_outcome == "pass"
     assert reloaded_step.plan.attachments and reloaded_step.plan.attachments[0].kind == "doc"
     assert reloaded_step.plan.tasks[0].attachments and reloaded_step.plan.tasks[0].attachments[0].kind == "report"
+
+
+def test_evidence_to_dict_skips_empty_fields():
+    check = VerificationCheck(kind="command", spec="", outcome="pass", details={})
+    assert check.to_dict() == {"kind": "command", "outcome": "pass"}
+    details = {"exit": 0}
+    out = VerificationCheck(kind="command", spec="pytest", outcome="pass", details=details).to_dict()
+    assert out["details"] == details and out["details"] is not details
+
+    attachment = Attachment(kind="log", path="a.log", size=0, meta={})
+    assert attachment.to_dict() == {"kind": "log", "path": "a.log"}
+    assert Attachment(kind="log", size=12).to_dict() == {"kind": "log", "size": 12}
+
+
+def test_now_iso_matches_datetime_isoformat(monkeypatch):
+    from datetime import datetime, timezone
+
+    import core.evidence as evidence
+
+    for ns in (1_700_000_000_123_456_789, 1_700_000_000_000_000_000, 1_700_000_001_000_001_000):
+        monkeypatch.setattr(evidence.time, "time_ns", lambda ns=ns: ns)
+        expected = datetime.fromtimestamp(ns // 1000 / 1_000_000, timezone.utc).isoformat()
+        assert evidence._now_iso() == expected
+
+
+def test_from_dict_normalizes_text_fields_and_skips_empty_payloads():
+    from core.evidence import Attachment, VerificationCheck
+
+    check = VerificationCheck.from_dict({"kind": " cmd ", "spec": 42, "outcome": None, "observed_at": "t"})
+    assert (check.kind, check.spec, check.outcome, check.details) == ("cmd", "42", "", {})
+    assert check.digest
+    att = Attachment.from_dict({"kind": "file", "file_path": " a.txt ", "observed_at": "t"})
+    assert (att.path, att.meta) == ("a.txt", {})
+
+
+def test_from_dict_keeps_observed_at_and_stamps_only_when_missing(monkeypatch):
+    import core.evidence as evidence
+
+    monkeypatch.setattr(evidence, "_now_iso", lambda: "NOW")
+    assert evidence.VerificationCheck.from_dict({"kind": "k", "observed_at": " 2025-01-01 "}).observed_at == "2025-01-01"
+    assert evidence.VerificationCheck.from_dict({"kind": "k", "observed_at": "  "}).observed_at == "NOW"
+    assert evidence.Attachment.from_dict({"kind": "k"}).observed_at == "NOW"
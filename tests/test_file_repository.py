@@ -195,3 +195,165 @@ def test_clean_filtered(tmp_path: Path):
     assert removed == 1
     assert repo.load("TASK-201") is None
     assert repo.load("TASK-202") is not None
+
+
+def test_parse_cache_returns_independent_copies_and_tracks_writes(tmp_path):
+    repo = FileTaskRepository(tmp_path)
+    repo.save(_sample_task())
+    path = tmp_path / "demo" / "TASK-001.task"
+
+    first = TaskFileParser.parse(path)
+    first.title = "mutated by caller"
+    first.steps[0].completed = True
+    second = TaskFileParser.parse(path)
+    assert second.title == "Repository roundtrip sample task with rich content"
+    assert second.steps[0].completed is False
+
+    second.title = "Renamed"
+    repo.save(second)
+    assert TaskFileParser.parse(path).title == "Renamed"
+
+    assert repo.delete("TASK-001", "demo")
+    assert TaskFileParser.parse(path) is None
+
+
+def test_parse_cache_sees_same_size_rewrite_with_unchanged_mtime(tmp_path):
+    import os
+
+    repo = FileTaskRepository(tmp_path)
+    repo.save(TaskDetail(id="TASK-001", title="Task", status="TODO"))
+    path = tmp_path / "TASK-001.task"
+    assert TaskFileParser.parse(path).status == "TODO"
+
+    # Same-size rewrite inside one coarse mtime tick, outside the repository.
+    st = path.stat()
+    path.write_text(path.read_text(encoding="utf-8").replace("status: TODO", "status: DONE"), encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert path.stat().st_size == st.st_size
+    assert TaskFileParser.parse(path).status == "DONE"
+
+
+def test_parse_cache_key_is_shared_by_symlinked_paths(tmp_path):
+    repo = FileTaskRepository(tmp_path / "real")
+    repo.save(TaskDetail(id="TASK-001", title="Task", status="TODO"))
+    link = tmp_path / "link"
+    link.symlink_to(tmp_path / "real", target_is_directory=True)
+
+    real = (tmp_path / "real" / "TASK-001.task").resolve()
+    assert TaskFileParser.parse(link / "TASK-001.task").title == "Task"
+    assert str(real) in TaskFileParser._cache
+    TaskFileParser.clear_cache(real)
+    assert str(real) not in TaskFileParser._cache
+
+
+def test_listing_skips_reserved_dirs_but_ids_stay_monotonic(tmp_path):
+    repo = FileTaskRepository(tmp_path)
+    live = TaskDetail(id="TASK-001", title="Live", status="TODO", domain="demo")
+    repo.save(live)
+    trashed = tmp_path / ".trash" / "TASK-007.task"
+    trashed.parent.mkdir()
+    trashed.write_text(TaskDetail(id="TASK-007", title="Old", status="TODO").to_file_content(), encoding="utf-8")
+
+    assert [t.id for t in repo.list()] == ["TASK-001"]
+    assert repo.next_id() == "TASK-008"
+    assert repo.load("TASK-001").domain == "demo"
+
+
+def test_parse_text_matches_file_parse(tmp_path):
+    repo = FileTaskRepository(tmp_path)
+    repo.save(_sample_task())
+    path = tmp_path / "demo" / "TASK-001.task"
+
+    from_text = TaskFileParser.parse_text(path.read_text(encoding="utf-8"), path)
+    from_file = TaskFileParser.parse(path)
+    assert from_text.to_file_content() == from_file.to_file_content()
+    assert TaskFileParser.parse_text("no front matter", path) is None
+
+
+def test_save_revision_shadow_follows_external_writes(tmp_path):
+    repo = FileTaskRepository(tmp_path)
+    task = TaskDetail(id="TASK-001", title="Task", status="TODO")
+    repo.save(task)
+    stale = TaskDetail(id="TASK-001", title="Task", status="TODO")
+    repo.save(stale)
+    assert stale.revision == 2
+
+    path = tmp_path / "TASK-001.task"
+    other = TaskDetail(id="TASK-001", title="Task edited elsewhere", status="TODO", revision=9)
+    path.write_text(other.to_file_content(), encoding="utf-8")
+    repo.save(task)
+    assert task.revision == 10
+    assert repo.load("TASK-001").revision == 10
+    assert [p.name for p in tmp_path.iterdir()] == ["TASK-001.task"]
+
+
+def test_save_preserves_existing_file_mode(tmp_path):
+    repo = FileTaskRepository(tmp_path)
+    task = TaskDetail(id="TASK-001", title="Task", status="TODO")
+    repo.save(task)
+    path = tmp_path / "TASK-001.task"
+    path.chmod(0o600)
+
+    task.title = "Task renamed"
+    repo.save(task)
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_parsed_metadata_tokens_are_shared_across_tasks(tmp_path):
+    repo = FileTaskRepository(tmp_path)
+    for idx in (1, 2):
+        repo.save(TaskDetail(id=f"TASK-00{idx}", title="Task", status="TODO", domain="demo", tags=["backend"]))
+
+    first, second = repo.list()
+    assert first.domain is second.domain
+    assert first.priority is second.priority
+    assert first.tags[0] is second.tags[0]
+
+
+def test_front_matter_matches_yaml_safe_dump():
+    import yaml
+
+    from core.task_detail import _dump_front_matter
+
+    metadata = {
+        "schema_version": 9,
+        "id": "TASK-001",
+        "title": "Задача с длинным названием " * 4,
+        "status": "TODO",
+        "domain": None,
+        "created": "2025-12-14T00:00:00Z",
+        "tags": ["backend", "yes", "123", ""],
+        "blocked": True,
+        "assignee": "ai: bot",
+        "depends_on": [],
+        "contract_data": {"goal": "ship"},
+        "events": [{"type": "created", "timestamp": "2025-12-14T00:00:00Z"}],
+    }
+    expected = yaml.safe_dump(metadata, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    assert _dump_front_matter(metadata) == expected
+
+
+def test_load_fallback_index_tracks_moves_and_new_files(tmp_path):
+    repo = FileTaskRepository(tmp_path)
+    repo.save(TaskDetail(id="TASK-001", title="Task", status="TODO", domain="a"))
+    assert repo.load("TASK-001").domain == "a"
+
+    other = FileTaskRepository(tmp_path)
+    other.save(TaskDetail(id="TASK-002", title="Other", status="TODO", domain="b"))
+    assert other.move("TASK-001", "c", current_domain="a")
+
+    assert repo.load("TASK-001").domain == "c"
+    assert repo.load("TASK-002").domain == "b"
+    assert repo.load("TASK-404") is None
+
+
+def test_delete_without_domain_removes_every_duplicate(tmp_path):
+    repo = FileTaskRepository(tmp_path)
+    repo.save(TaskDetail(id="TASK-001", title="Task", status="TODO", domain="a"))
+    assert repo.load("TASK-001").domain == "a"
+
+    repo.save(TaskDetail(id="TASK-001", title="Copy", status="TODO", domain="b"))
+    assert repo.delete("TASK-001")
+    assert not (tmp_path / "a" / "TASK-001.task").exists()
+    assert not (tmp_path / "b" / "TASK-001.task").exists()
+    assert repo.load("TASK-001") is None
@@ -479,3 +479,67 @@ status: TODO
     assert st.started_at == "2025-01-15T10:30:00"
     assert st.blocked is True
     assert st.block_reason == "reason with spaces"
+
+
+def test_parse_step_checkpoint_tokens(tmp_path: Path):
+    """Verify checkpoint tokens, including English aliases and notes."""
+    task_file = tmp_path / "test.task"
+    task_file.write_text(
+        """---
+id: test-16
+title: Test Task
+status: TODO
+---
+
+## Шаги
+- [ ] Step with checkpoints
+  - Тесты: test_a.py
+  - Чекпоинты: Критерии=OK; Тесты=AUTO; SECURITY=ok; Производительность=TODO; docs=OK
+  - Отметки критериев: verified manually; reviewed
+""",
+        encoding="utf-8",
+    )
+
+    task = TaskFileParser.parse(task_file)
+    assert task is not None
+    st = task.steps[0]
+    assert st.criteria_confirmed is True
+    assert st.tests_confirmed is False
+    assert st.tests_auto_confirmed is True
+    assert st.security_confirmed is True
+    assert st.perf_confirmed is False
+    assert st.docs_confirmed is True
+    assert st.criteria_notes == ["verified manually", "reviewed"]
+
+
+def test_parse_body_sections(tmp_path: Path):
+    """Verify body sections are routed by title; unknown and preamble text is ignored."""
+    task_file = tmp_path / "test.task"
+    task_file.write_text(
+        """---
+id: test-17
+title: Test Task
+status: TODO
+---
+preamble
+## Описание
+first line
+second line
+
+## Unknown
+- ignored
+## Риски
+- risk one
+## Текущие проблемы
+1. problem one
+## Tests""",
+        encoding="utf-8",
+    )
+
+    task = TaskFileParser.parse(task_file)
+    assert task is not None
+    assert task.description == "first line\nsecond line"
+    assert task.risks == ["risk one"]
+    assert task.problems == ["problem one"]
+    assert task.tests == []
+    assert task.tests_auto_confirmed is True
@@ -78,3 +78,13 @@ class TestFileRepositorySecurity:
         assert "backend" in str(path)
         assert "api" in str(path)
         assert path.is_relative_to(tmp_path)
+
+    def test_rejects_symlinked_domain_escaping_tasks_dir(self, tmp_path):
+        tasks_dir = tmp_path / "tasks"
+        outside = tmp_path / "outside"
+        tasks_dir.mkdir()
+        outside.mkdir()
+        (tasks_dir / "linked").symlink_to(outside, target_is_directory=True)
+        repo = FileTaskRepository(tasks_dir)
+        with pytest.raises(ValueError, match="Path traversal detected"):
+            repo._resolve_path("TASK-001", "linked")
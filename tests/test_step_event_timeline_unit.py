@@ -0,0 +1,69 @@
+from core.step_event import EVENT_BLOCKED, EVENT_PLAN_UPDATED, StepEvent
+
+
+def test_format_timeline_dispatches_by_event_type():
+    ts = "2025-01-02T03:04:05.678+00:00"
+    assert StepEvent(ts, "created").format_timeline() == "[2025-01-02 03:04:05] Step created"
+    blocked = StepEvent(ts, EVENT_BLOCKED, data={"reason": "waiting", "blocker_step": "s:1"})
+    assert blocked.format_timeline() == "[2025-01-02 03:04:05] Blocked: waiting (by s:1)"
+    plan = StepEvent(ts, EVENT_PLAN_UPDATED, data={"steps": ["a", "b"], "current": 1})
+    assert plan.format_timeline() == "[2025-01-02 03:04:05] Plan updated: 1/2"
+
+
+def test_format_timeline_falls_back_for_unknown_types():
+    assert StepEvent("", "custom", data={"k": 1}).format_timeline() == "[unknown] custom: {'k': 1}"
+
+
+def test_events_to_timeline_orders_by_timestamp_and_tolerates_null():
+    from core.step_event import events_to_timeline
+
+    events = [
+        StepEvent("2025-01-02T00:00:00", "created"),
+        StepEvent("2025-01-01T00:00:00", "unblocked"),
+    ]
+    assert events_to_timeline(events).splitlines() == [
+        "[2025-01-01 00:00:00] Unblocked",
+        "[2025-01-02 00:00:00] Step created",
+    ]
+    events.append(StepEvent(None, "unblocked"))  # type: ignore[arg-type]
+    assert events_to_timeline(events).splitlines()[0] == "[unknown] Unblocked"
+
+
+def test_loaded_event_strings_are_interned_and_statuses_canonical():
+    from core.status import Status, normalize_status
+    from core.step_event import ACTOR_HUMAN, EVENT_CREATED
+
+    event = StepEvent.from_dict({"timestamp": "t", "event_type": "".join(["crea", "ted"]), "actor": "".join(["hu", "man"])})
+    assert event.event_type is EVENT_CREATED
+    assert event.actor is ACTOR_HUMAN
+    assert normalize_status(" done ") is normalize_status("DONE")
+    assert Status.from_string("active") is Status.ACTIVE
+    assert Status.from_string("?") is Status.UNKNOWN
+    assert Status.from_string("nope") is Status.UNKNOWN
+
+
+def test_from_legacy_history_splits_dated_lines_only():
+    dated = StepEvent.from_legacy_history("2025-12-07: created: twice")
+    assert (dated.timestamp, dated.data["text"]) == ("2025-12-07", "created: twice")
+    plain = StepEvent.from_legacy_history("note: no date")
+    assert (plain.timestamp, plain.data["text"]) == ("", "note: no date")
+    bare = StepEvent.from_legacy_history("created")
+    assert (bare.timestamp, bare.data["text"], bare.event_type) == ("", "created", "legacy")
+
+
+def test_format_timeline_display_timestamp_follows_reassignment():
+    event = StepEvent("2025-01-01T00:00:00", "unblocked")
+    assert event.format_timeline() == "[2025-01-01 00:00:00] Unblocked"
+    assert event.format_timeline() == "[2025-01-01 00:00:00] Unblocked"
+    event.timestamp = "2025-02-02T00:00:00"
+    assert event.format_timeline() == "[2025-02-02 00:00:00] Unblocked"
+    assert event == StepEvent("2025-02-02T00:00:00", "unblocked")
+    assert "_display_ts" not in repr(event)
+
+
+def test_status_members_expose_plain_code_color_symbol():
+    from core.status import Status
+
+    for member in Status:
+        assert (member.code, member.color, member.symbol) == member.value
+    assert isinstance(Status.from_string("done"), Status)
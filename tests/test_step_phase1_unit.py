@@ -20,3 +20,32 @@ def test_step_computed_status_completed():
     st = Step(completed=True, title="T", success_criteria=["c"], tests=["t"], blockers=["b"])
     assert st.computed_status == "completed"
 
+
+
+def test_step_count_memo_matches_plain_counts():
+    from core import PlanNode, TaskNode
+    from core.step import _count_step_tree, step_count_memo
+
+    leaf = TaskNode(title="Leaf", steps=[Step(completed=True, title="L1"), Step(completed=False, title="L2")])
+    mid = TaskNode(title="Mid", steps=[Step(completed=True, title="M1", plan=PlanNode(tasks=[leaf]))])
+    root = [Step(completed=False, title="R1", plan=PlanNode(tasks=[mid])), Step(completed=True, title="R2")]
+
+    plain = (_count_step_tree(root), mid.calculate_progress(), leaf.calculate_progress())
+    with step_count_memo():
+        memoized = (_count_step_tree(root), mid.calculate_progress(), leaf.calculate_progress())
+    assert plain == memoized == ((5, 3), 66, 50)
+
+    # Outside the scope counts are live again.
+    leaf.steps[1].completed = True
+    assert leaf.calculate_progress() == 100
+
+
+def test_is_valid_flagship_flags_compound_titles_case_insensitively():
+    base = dict(completed=False, success_criteria=["c"], tests=["t"], blockers=["b"])
+    ok, _ = Step(title="Implement the parser for config files", **base).is_valid_flagship()
+    assert ok
+    for title in ("Implement parser AND THEN wire the config", "Сделать парсер, Потом подключить конфиг"):
+        ok, issues = Step(title=title, **base).is_valid_flagship()
+        assert not ok
+        assert any("не атомарна" in issue for issue in issues)
+
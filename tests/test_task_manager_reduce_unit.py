@@ -83,6 +83,32 @@ def test_apply_context_filters_and_models():
     assert built[0][1].name == "DONE"
 
 
+def test_task_view_predicate_filters_inside_build_pass():
+    items = [
+        SimpleNamespace(phase="p", component="c", parent="PLAN-001", kind="task", status="TODO"),
+        SimpleNamespace(phase="p", component="x", parent="PLAN-001", kind="task", status="TODO"),
+        SimpleNamespace(phase="p", component="c", parent="", kind="task", status="TODO"),
+        SimpleNamespace(phase="p", component="c", parent="PLAN-001", kind="plan", status="TODO"),
+    ]
+    keep = tui_loader.task_view_predicate("p", "c", lambda d: d.kind == "plan")
+    built = tui_loader.build_task_models(items, lambda det, *_: det, keep)
+    assert built == [items[0]]
+    assert tui_loader.apply_context_filters(items, "", "") is items
+
+
+def test_build_task_models_counts_nested_steps_in_one_pass():
+    from core import PlanNode, Step, TaskDetail, TaskNode
+
+    child = Step.new("Child", criteria=["c"], tests=["t"])
+    child.completed = True
+    parent = Step.new("Parent", criteria=["c"], tests=["t"])
+    parent.plan = PlanNode(tasks=[TaskNode(title="Nested", steps=[child])])
+    det = TaskDetail(id="TASK-001", title="T", status="TODO", steps=[parent])
+
+    built = tui_loader.build_task_models([det], lambda det, st, prog, subs, total: (st, prog, subs, total))
+    assert built == [(tui_loader.Status.TODO, det.calculate_progress(), 1, 2)]
+
+
 def test_select_index_after_load():
     class T:
         def __init__(self, task_file):
@@ -92,6 +118,16 @@ def test_select_index_after_load():
     assert tui_loader.select_index_after_load(tasks, True, "b") == 1
     assert tui_loader.select_index_after_load(tasks, False, "b") == 0
 
+    index_by_file = {}
+    built = tui_loader.build_task_models(
+        [SimpleNamespace(status="TODO", task_file=f) for f in ("a", "b", "b")],
+        lambda det, *_: det,
+        index_by_file=index_by_file,
+    )
+    assert index_by_file == {"a": 0, "b": 1}
+    assert tui_loader.select_index_after_load(built, True, "b", index_by_file) == 1
+    assert tui_loader.select_index_after_load(built, True, "zzz", index_by_file) == 0
+
 
 def test_load_tasks_with_state_no_filter_message():
     class DummyManager:
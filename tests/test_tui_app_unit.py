@@ -781,6 +781,21 @@ class TestTaskTrackerTUIInstanceMethods:
         tui.force_render()
         mock_app.invalidate.assert_called_once()
 
+    def test_batch_render_coalesces_force_render(self, tui):
+        """Nested batches invalidate once, on the outermost exit."""
+        mock_app = Mock()
+        tui.app = mock_app
+        with tui.batch_render():
+            tui.force_render()
+            with tui.batch_render():
+                tui.force_render()
+            mock_app.invalidate.assert_not_called()
+        mock_app.invalidate.assert_called_once()
+
+        with tui.batch_render():
+            pass
+        mock_app.invalidate.assert_called_once()
+
     def test_force_render_no_app(self, tui):
         """Test force_render handles missing app gracefully."""
         tui.app = None
@@ -816,3 +831,40 @@ class TestTaskTrackerTUIInstanceMethods:
         result = tui._run_with_spinner("Computing...", test_func, 2, 3)
         assert result == 5
         assert tui.spinner_active is False  # Spinner should be stopped
+
+    def test_snap_cursor_prefers_next_focusable(self):
+        """_snap_cursor keeps exact hits, snaps forward, then falls back backward."""
+        focusables = [2, 5, 9]
+        assert TaskTrackerTUI._snap_cursor(5, focusables) == 5
+        assert TaskTrackerTUI._snap_cursor(0, focusables) == 2
+        assert TaskTrackerTUI._snap_cursor(6, focusables) == 9
+        assert TaskTrackerTUI._snap_cursor(12, focusables) == 9
+        assert TaskTrackerTUI._snap_cursor(-3, []) == 0
+
+    def test_renderer_getattr_fields_have_defaults(self, tui):
+        """Fields renderers read via getattr(tui, name, default) exist on a real TUI."""
+        import re
+        from core.desktop.devtools.interface import tui_footer, tui_mouse, tui_navigation, tui_preview, tui_state
+
+        names = set()
+        for module in (tui_footer, tui_mouse, tui_navigation, tui_preview, tui_state):
+            names.update(re.findall(r'getattr\(tui, "(\w+)"', Path(module.__file__).read_text(encoding="utf-8")))
+        assert names
+        assert [name for name in sorted(names) if not hasattr(tui, name)] == []
+
+    def test_select_step_by_path_uses_key_index(self, tui):
+        """_select_step_by_path resolves keys through an index rebuilt per flat list."""
+        from core.desktop.devtools.interface.tui_detail_tree import DetailNodeEntry
+
+        def flat(*keys):
+            return [DetailNodeEntry(key=k, kind="step", node=None, level=0, collapsed=False, has_children=False, parent_key=None) for k in keys]
+
+        tui.detail_flat_subtasks = flat("s:0", "s:1", "s:2")
+        tui._select_step_by_path("s:2")
+        assert (tui.detail_selected_index, tui.detail_selected_path) == (2, "s:2")
+
+        tui.detail_flat_subtasks = flat("s:2", "s:0")
+        tui._select_step_by_path("s:2")
+        assert (tui.detail_selected_index, tui.detail_selected_path) == (0, "s:2")
+        tui._select_step_by_path("missing")
+        assert tui.detail_selected_path == "s:2"
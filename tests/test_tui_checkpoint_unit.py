@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+from core.desktop.devtools.interface.tui_checkpoint import CheckpointMixin
+
+
+class _TUI(CheckpointMixin):
+    def __init__(self):
+        self.checkpoint_selected_index = 0
+        self.renders = 0
+
+    def force_render(self):
+        self.renders += 1
+
+
+def test_checkpoint_selection_clamps_and_renders_each_move():
+    tui = _TUI()
+    for delta in (1, 1, -1, -1):
+        tui.move_checkpoint_selection(delta)
+    assert tui.checkpoint_selected_index == 0
+    assert tui.renders == 4
+
+
+class _Manager:
+    def __init__(self, detail):
+        self.detail = detail
+        self.updates = []
+        self.loads = 0
+
+    def update_checkpoint(self, task_id, *, kind, checkpoint, value, note, domain, path):
+        self.updates.append((task_id, kind, checkpoint, value, path))
+        step = self.detail.steps[0]
+        setattr(step, f"{checkpoint}_confirmed", value)
+        return True, ""
+
+    def load_task(self, task_id, domain, skip_sync=False):
+        self.loads += 1
+        return self.detail
+
+
+class _ToggleTUI(_TUI):
+    def __init__(self, detail):
+        super().__init__()
+        self.current_task_detail = detail
+        self.detail_selected_path = "s:0"
+        self.manager = _Manager(detail)
+        self.task_details_cache = {}
+        self.navigation_stack = []
+        self.rebuilds = []
+        self.list_updates = 0
+
+    def _get_step_by_path(self, path):
+        return self.current_task_detail.steps[int(path.split(":")[1])]
+
+    def _get_root_task_context(self):
+        return self.current_task_detail.id, "", ""
+
+    def _rebuild_detail_flat(self, selected_path=None):
+        self.rebuilds.append(selected_path)
+
+    def _update_tasks_list_silent(self, skip_sync=False):
+        self.list_updates += 1
+
+
+def test_toggle_checkpoint_reloads_root_and_renders_once(monkeypatch):
+    from core import Step
+    from core.desktop.devtools.application import context
+
+    saved = []
+    monkeypatch.setattr(context, "save_last_task", lambda task_id, domain="": saved.append(task_id))
+    detail = SimpleNamespace(id="TASK-001", kind="task", steps=[Step(False, "s", success_criteria=["c"])])
+    tui = _ToggleTUI(detail)
+
+    tui.toggle_checkpoint_state()
+
+    assert tui.manager.updates == [("TASK-001", "step", "criteria", True, "s:0")]
+    assert tui.manager.loads == 1
+    assert tui.rebuilds == ["s:0"]
+    assert tui.list_updates == 1
+    assert saved == ["TASK-001"]
+    assert tui.renders == 1
+    assert tui.task_details_cache["TASK-001"] is detail
+
+
+def test_toggle_checkpoint_resolves_root_context_once(monkeypatch):
+    from core import Step
+    from core.desktop.devtools.application import context
+
+    monkeypatch.setattr(context, "save_last_task", lambda task_id, domain="": None)
+    detail = SimpleNamespace(id="TASK-001", kind="task", steps=[Step(False, "s", success_criteria=["c"])])
+    tui = _ToggleTUI(detail)
+    calls = []
+    original = tui._get_root_task_context
+    tui._get_root_task_context = lambda: calls.append(1) or original()
+
+    tui.toggle_checkpoint_state()
+
+    assert len(calls) == 1
+    assert tui.manager.updates == [("TASK-001", "step", "criteria", True, "s:0")]
+
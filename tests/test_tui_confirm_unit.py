@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+from core.desktop.devtools.interface.tui_confirm import render_confirm_dialog
+
+
+def _tui(lines, width=60):
+    return SimpleNamespace(
+        confirm_title="Delete task?",
+        confirm_lines=lines,
+        get_terminal_width=lambda: width,
+        _t=lambda key, **_: {"CONFIRM_HINT": "Enter=yes  Esc=no"}.get(key, key),
+    )
+
+
+def test_confirm_dialog_box_is_rectangular_and_clips_long_lines():
+    rendered = render_confirm_dialog(_tui(["short", "x" * 200, "a\nb"]))
+    text = "".join(fragment for _, fragment in rendered)
+    rows = text.split("\n")
+
+    assert len({len(row) for row in rows}) == 1
+    assert rows[0] == rows[-1] == "+" + "=" * 54 + "+"
+    assert rows[1].startswith("| Delete task?")
+    assert rows[2] == rows[-3] == "+" + "-" * 54 + "+"
+    assert rows[4].endswith("… |")
+    assert [row[2:3] for row in rows[5:7]] == ["a", "b"]
+    assert "Enter=yes" in rows[-2]
+
+
+def test_confirm_dialog_styles_header_body_and_hint():
+    rendered = render_confirm_dialog(_tui(["body"]))
+    styles = {style for style, _ in rendered}
+    assert {"class:border", "class:header", "class:text", "class:text.dim"} <= styles
+    assert any(style == "class:text" and text.startswith("body") for style, text in rendered)
@@ -0,0 +1,69 @@
+from core import PlanNode, Step, TaskNode
+from core.desktop.devtools.interface.tui_detail_tree import (
+    build_detail_tree,
+    children_count,
+    find_entry_index,
+    find_parent_key,
+    iter_children,
+)
+
+
+def _tree() -> list[Step]:
+    leaf = Step(False, "leaf", success_criteria=["c"])
+    root = Step(False, "root", success_criteria=["c"])
+    root.plan = PlanNode(tasks=[TaskNode(title="t0", steps=[leaf]), TaskNode(title="t1", steps=[])])
+    return [root, Step(True, "second", success_criteria=["c"])]
+
+
+def test_detail_tree_lookup_helpers():
+    entries, _ = build_detail_tree(_tree(), collapsed=set())
+
+    assert find_entry_index(entries, "s:0.t:1") == 5
+    assert find_entry_index(entries, "missing") is None
+    assert find_parent_key(entries, "s:0.t:0.s:0") == "s:0.t:0"
+    assert find_parent_key(entries, "missing") is None
+    assert [c.key for c in iter_children(entries, "p:s:0")] == ["s:0.t:0", "s:0.t:1"]
+    for container in (entries, list(entries)):
+        assert children_count(container, "p:s:0") == 2
+        assert children_count(container, "s:0.t:1") == 0
+
+
+def test_compute_detail_stats_step_readiness_and_rollups():
+    from core import Status
+    from core.desktop.devtools.interface.tui_detail_tree import compute_detail_stats
+
+    ready = Step(False, "ready", success_criteria=["c"], criteria_confirmed=True, tests_confirmed=True)
+    blocked = Step(False, "blocked", success_criteria=["c"], criteria_confirmed=True, tests_confirmed=True)
+    blocked.blocked = True
+    parent = Step(False, "parent", success_criteria=["c"], criteria_confirmed=True, tests_confirmed=True)
+    parent.plan = PlanNode(tasks=[TaskNode(title="t0", steps=[Step(True, "done", success_criteria=["c"])])])
+    pending = Step(False, "pending", success_criteria=["c"], criteria_confirmed=True, tests_confirmed=True)
+    pending.plan = PlanNode(tasks=[TaskNode(title="t0", steps=[Step(False, "open", success_criteria=["c"])])])
+
+    stats = compute_detail_stats([ready, blocked, parent, pending])
+
+    assert stats["s:0"].status == Status.ACTIVE
+    assert stats["s:1"].status == Status.TODO
+    assert stats["s:2"].status == Status.ACTIVE
+    assert (stats["s:2"].children_done, stats["s:2"].children_total, stats["s:2"].progress) == (1, 1, 50)
+    assert stats["p:s:2"].status == Status.DONE and stats["p:s:2"].progress == 100
+    assert stats["s:2.t:0"].status == Status.DONE
+    assert stats["s:3"].status == Status.TODO
+    assert stats["s:3.t:0"].status == Status.TODO
+
+
+def test_flatten_detail_tree_honors_nested_collapsed_keys():
+    from core.desktop.devtools.interface.tui_detail_tree import flatten_detail_tree
+
+    roots = _tree()
+    all_keys = [e.key for e in flatten_detail_tree(roots, collapsed=set())]
+    assert all_keys == ["s:0", "p:s:0", "s:0.t:0", "s:0.t:0.s:0", "p:s:0.t:0.s:0", "s:0.t:1", "s:1", "p:s:1"]
+
+    by_task = flatten_detail_tree(roots, collapsed={"s:0.t:0"})
+    assert [e.key for e in by_task] == ["s:0", "p:s:0", "s:0.t:0", "s:0.t:1", "s:1", "p:s:1"]
+    assert [e.key for e in by_task if e.collapsed] == ["s:0.t:0"]
+
+    by_plan = flatten_detail_tree(roots, collapsed={"p:s:0", "s:9"})
+    assert [e.key for e in by_plan] == ["s:0", "p:s:0", "s:1", "p:s:1"]
+    assert [e.key for e in by_plan if e.collapsed] == ["p:s:0"]
+
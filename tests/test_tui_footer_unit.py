@@ -42,3 +42,62 @@ def test_build_footer_text_with_offset():
     result = build_footer_text(tui)
     text = "".join(fragment for _, fragment in result)
     assert "DESCRIPTION" in text
+
+
+def test_footer_width_helpers_handle_wide_and_ascii_text():
+    from core.desktop.devtools.interface.tui_footer import _display_width, _pad_display, _slice_display, _trim_display
+
+    assert _display_width("abc") == 3
+    assert _display_width("日本語") == 6
+    assert _display_width("a\tb") == 5
+    assert _trim_display("日本語", 5) == "日本"
+    assert _trim_display("abcdef", 4) == "abcd"
+    assert _pad_display("日本", 6) == "日本  "
+    assert _slice_display("日本語x", 2, 3) == "本"
+    assert _slice_display("abcdef", 2, 3) == "cde"
+    assert _slice_display("abc", 0, 0) == ""
+
+
+def test_fit_kv_accepts_precomputed_label_width():
+    from core.desktop.devtools.interface.tui_footer import _display_width, _fit_kv
+
+    assert _fit_kv("A: ", "xy", 8) == "A: xy   "
+    assert _fit_kv("A: ", "xy", 8, 3) == "A: xy   "
+    assert _fit_kv("A: ", "日本語", 8, 3) == "A: 日本…"
+    assert _display_width(_fit_kv("A: ", "long value here", 8, 3)) == 8
+    assert _fit_kv("A: ", "x", 0) == ""
+
+
+def test_slice_display_with_prefix_widths_matches_walk():
+    from core.desktop.devtools.interface.tui_footer import _prefix_widths, _slice_display
+
+    text = "日本語x"
+    prefix = _prefix_widths(text)
+    assert prefix == [0, 2, 4, 6, 7]
+    assert _slice_display(text, 1, 3, prefix) == "日"
+    assert _slice_display(text, 2, 3, prefix) == "本"
+    assert _slice_display(text, 4, 10, prefix) == "語x"
+    assert _slice_display(text, 99, 3, prefix) == ""
+
+
+def test_trim_measure_reports_used_columns():
+    from core.desktop.devtools.interface.tui_footer import _pad_display, _trim_measure
+
+    assert _trim_measure("日本語", 5) == ("日本", 4)
+    assert _trim_measure("abcdef", 4) == ("abcd", 4)
+    assert _trim_measure("日本語", 5, [0, 2, 4, 6]) == ("日本", 4)
+    assert _pad_display("日本語", 5) == "日本 "
+    assert _pad_display("ab", 4) == "ab  "
+    assert _pad_display("a\tb", 6) == "a   b "
+
+
+def test_build_footer_text_reuses_cached_frame_until_inputs_change():
+    tui = DummyTUI(horizontal_offset=0, filtered_tasks=["TASK"])
+    first = build_footer_text(tui)
+    assert build_footer_text(tui) is first
+
+    tui.language = "ru"
+    second = build_footer_text(tui)
+    assert second is not first
+    assert build_footer_text(tui) is second
+
@@ -253,3 +253,76 @@ def test_detail_click_switches_tab_via_hitboxes():
     tui_mouse.handle_body_mouse(tui, _mouse(MouseEventType.MOUSE_UP, x=3, y=1))
     assert tui.detail_tab == "plan"
     assert getattr(tui, "rendered", False)
+
+
+def test_mouse_state_reads_all_flags_with_defaults_for_partial_tui():
+    full = SimpleNamespace(editing_mode=True, edit_context="token", settings_mode=False, detail_mode=True, current_task_detail="d")
+    assert tui_mouse._mouse_state(full) == (True, "token", False, True, "d")
+    assert tui_mouse._mouse_state(SimpleNamespace(detail_mode=True)) == (False, "", False, True, None)
+
+
+def test_scroll_events_coalesce_into_one_move_per_loop_tick():
+    scheduled = []
+
+    class Loop:
+        def is_running(self):
+            return True
+
+        def call_soon(self, fn, *args):
+            scheduled.append((fn, args))
+
+    moves = []
+
+    class TUI:
+        editing_mode = False
+        detail_mode = False
+        app = SimpleNamespace(loop=Loop())
+
+        def move_vertical_selection(self, delta):
+            moves.append(delta)
+
+    tui = TUI()
+    for _ in range(3):
+        tui_mouse.handle_body_mouse(tui, _mouse(MouseEventType.SCROLL_DOWN))
+    tui_mouse.handle_body_mouse(tui, _mouse(MouseEventType.SCROLL_UP))
+    assert moves == [] and len(scheduled) == 1
+    fn, args = scheduled[0]
+    fn(*args)
+    assert moves == [2]
+
+
+def test_scroll_is_dropped_while_editing():
+    class TUI:
+        editing_mode = True
+
+        def move_vertical_selection(self, delta):
+            raise AssertionError("no scroll while editing")
+
+    assert tui_mouse.handle_body_mouse(TUI(), _mouse(MouseEventType.SCROLL_DOWN)) is NotImplemented
+
+
+def test_detail_click_bisects_prebuilt_tab_hitboxes():
+    from core.desktop.devtools.interface.tui_detail_tabs import make_tab_hitboxes
+
+    class TUI:
+        detail_mode = True
+        current_task_detail = True
+        editing_mode = False
+        settings_mode = False
+        detail_tab = "radar"
+        detail_tab_scroll_offsets = {}
+        _detail_tab_hitboxes = make_tab_hitboxes(1, [(2, 7, "radar"), (9, 13, "plan"), (15, 20, "notes")])
+
+        def force_render(self):
+            pass
+
+        def _subtask_index_from_y(self, y):
+            raise AssertionError("tab bar clicks never reach subtask resolution")
+
+    tui = TUI()
+    tui_mouse.handle_body_mouse(tui, _mouse(MouseEventType.MOUSE_UP, x=13, y=1))
+    assert tui.detail_tab == "radar"
+    tui_mouse.handle_body_mouse(tui, _mouse(MouseEventType.MOUSE_UP, x=12, y=1))
+    assert tui.detail_tab == "plan"
+    tui_mouse.handle_body_mouse(tui, _mouse(MouseEventType.MOUSE_UP, x=15, y=1))
+    assert tui.detail_tab == "notes"
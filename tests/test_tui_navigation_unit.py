@@ -147,3 +147,9 @@ def test_move_vertical_selection_list_empty():
     tui = TUI()
     tui_navigation.move_vertical_selection(tui, 1)
     assert tui.selected_index == 0
+
+
+def test_clamp_matches_max_min():
+    for hi in (0, 1, 5):
+        for value in range(-3, 9):
+            assert tui_navigation._clamp(value, hi) == max(0, min(value, hi))
@@ -40,6 +40,13 @@ def test_plan_detail_tasks_list_is_cached(tmp_path, monkeypatch):
     tui._plan_detail_tasks()
     assert calls["n"] == 2
 
+    # The navigation property returns the clean cached list as-is.
+    assert tui.plan_detail_tasks is tui.detail_plan_tasks
+    assert calls["n"] == 2
+    tui._invalidate_plan_detail_tasks_cache()
+    assert [t.id for t in tui.plan_detail_tasks] == [t.id for t in first]
+    assert calls["n"] == 3
+
 
 def test_cached_step_tree_counts_respects_fingerprint(tmp_path):
     tasks_dir = tmp_path / ".tasks"
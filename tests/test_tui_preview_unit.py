@@ -99,3 +99,65 @@ def test_preview_loads_from_file_and_handles_parse_failure(monkeypatch, tmp_path
     monkeypatch.setattr("core.desktop.devtools.interface.tui_preview.TaskFileParser.parse", fail_parse)
     text2 = "".join(part[1] for part in build_side_preview_text(tui))
     assert "SIDE_NO_DATA" in text2
+
+
+def test_preview_wrap_rows_are_padded_and_memoized():
+    from core.desktop.devtools.interface.tui_preview import _description_rows, _wrap_rows
+
+    rows = _wrap_rows("x" * 80)
+    assert rows == ("x" * 38 + "  ", "x" * 38 + "  ", "xxxx".ljust(40))
+    assert _wrap_rows("x" * 80, 2) == rows[:2]
+    assert _wrap_rows("x" * 80) is rows
+    assert _wrap_rows("") == ()
+
+    desc = "\n".join(["y" * 200] + ["line"] * 6)
+    assert _description_rows(desc) == ("y" * 38 + "  ",) * 3 + ("line".ljust(40),) * 4
+
+
+def test_preview_progress_row_is_shared_between_frames():
+    from core.desktop.devtools.interface.tui_preview import _progress_row
+
+    row = _progress_row(50)
+    assert "".join(text for _, text in row) == "|  50% [" + "#" * 15 + "-" * 15 + "]    |\n"
+    assert _progress_row(50) is row
+
+
+def test_preview_labels_cached_per_language():
+    calls = []
+
+    def _t(key, **kwargs):
+        calls.append(key)
+        return f"{key}-{tui.language}"
+
+    tui = SimpleNamespace(filtered_tasks=[], selected_index=0, language="en", _t=_t)
+    assert "SIDE_EMPTY_TASKS-en" in "".join(chunk[1] for chunk in build_side_preview_text(tui))
+    seen = len(calls)
+    build_side_preview_text(tui)
+    assert len(calls) == seen
+
+    tui.language = "ru"
+    assert "SIDE_EMPTY_TASKS-ru" in "".join(chunk[1] for chunk in build_side_preview_text(tui))
+
+
+def test_preview_reuses_text_until_row_changes():
+    calls = {"n": 0}
+
+    class Detail(SimpleNamespace):
+        def calculate_progress(self):
+            calls["n"] += 1
+            return 10
+
+    def make(title):
+        detail = Detail(id="TASK-1", title=title, status="TODO", priority="LOW", description="", domain="", phase="", component="")
+        return SimpleNamespace(detail=detail, task_file=None)
+
+    tui = SimpleNamespace(filtered_tasks=[make("A"), make("B")], selected_index=0, _t=lambda key, **k: key)
+    first = build_side_preview_text(tui)
+    assert build_side_preview_text(tui) is first
+    assert calls["n"] == 1
+
+    tui.filtered_tasks[0].detail.title = "A2"
+    assert "A2" in "".join(part[1] for part in build_side_preview_text(tui))
+    tui.selected_index = 1
+    assert "B" in "".join(part[1] for part in build_side_preview_text(tui))
+    assert calls["n"] == 3
@@ -264,6 +264,23 @@ class TestCollapseExpandSubtree:
         assert t.detail_collapsed == set()
 
 
+    def test_iter_subtree_nodes_preorder(self):
+        leaf = Step(False, "leaf", success_criteria=["c"])
+        root = Step(False, "root", success_criteria=["c"])
+        root.plan = PlanNode(tasks=[TaskNode(title="t0", steps=[leaf]), TaskNode(title="t1")])
+        entry = DetailNodeEntry(key="s:0", kind="step", node=root, level=0, collapsed=False, has_children=True, parent_key=None)
+
+        keys = [(kind, key) for kind, key, _ in tui_state._iter_subtree_nodes(entry)]
+        assert keys == [
+            ("step", "s:0"),
+            ("plan", "p:s:0"),
+            ("task", "s:0.t:0"),
+            ("step", "s:0.t:0.s:0"),
+            ("plan", "p:s:0.t:0.s:0"),
+            ("task", "s:0.t:1"),
+        ]
+
+
 class TestMaybeReload:
     """Tests for maybe_reload function."""
 